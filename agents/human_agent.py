@@ -59,11 +59,11 @@ class HumanAgent(BaseAgent):
         for action in actions:
             attacker_id = action.details['attacker_id']
             if attacker_id not in attackers:
-                card = next((c for c in game_state.active_player.board.get_cards() if c.instance_id == attacker_id), None)
+                card = game_state.find_card(attacker_id, game_state.active_player.board)
                 if card: attackers[attacker_id] = card
         
         attacker_choices = [
-            Choice(title=f"{card.name} ({card.get_property('atk')}/{card.get_property('def')})", value=card)
+            Choice(title=f"{card.name} ({card.atk}/{card.defense})", value=card)
             for card in attackers.values()
         ]
         attacker_choices.append(Separator())
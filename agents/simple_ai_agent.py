@@ -1,4 +1,3 @@
-import random
 from typing import List
 
 # --- IMPORTS CORRECTED HERE ---
@@ -14,5 +13,5 @@ class SimpleAiAgent(BaseAgent):
         """
         Chooses a random action from the list of possible actions.
         """
-        chosen_action = random.choice(possible_actions)
+        chosen_action = game_state.rng.agent.choice(possible_actions)
         return chosen_action
\ No newline at end of file
@@ -1,27 +1,75 @@
 import uuid
 from typing import Optional
 
+from .card_definition import CardDefinition
+
 'Player'
 
+# Properties that live on the instance rather than on the shared definition.
+# get_property() serves these from the card's own slots.
+_INSTANCE_PROPERTIES = {
+    'atk': 'atk',
+    'def': 'defense',
+    'is_evolved': 'is_evolved',
+    'gained_rush_this_turn': 'gained_rush_this_turn',
+}
+
 class Card:
     """
     Represents a single, generic card in the game.
+
+    Static data comes from a shared CardDefinition; the instance only holds
+    the state that can change during a game.
     """
-    def __init__(self, card_id: str, name: str, properties: dict = None):
+    __slots__ = ('instance_id', 'definition', 'owner', 'atk', 'defense', 'is_evolved',
+                 'gained_rush_this_turn', 'attacks_made_this_turn', 'max_attacks_per_turn',
+                 'turn_played', 'keywords')
+
+    def __init__(self, definition: CardDefinition):
         self.instance_id = str(uuid.uuid4())
-        self.card_id = card_id
-        self.name = name
-        self.properties = properties if properties is not None else {}
+        self.definition = definition
         self.owner: Optional['Player'] = None
+
+        # Current stats start at the printed values (spells and amulets have none).
+        self.atk: int = definition.get_property("atk") or 0
+        self.defense: int = definition.get_property("def") or 0
+        self.is_evolved: bool = False
+        self.gained_rush_this_turn: bool = False
+
         self.attacks_made_this_turn: int = 0
-        self.max_attacks_per_turn: int = self.properties.get("max_attacks", 1)
+        self.max_attacks_per_turn: int = definition.get_property("max_attacks", 1)
 
-        # --- NEW ATTRIBUTE ---
         # Records the turn number this card was played on. 0 means it started in play or is not on board.
         self.turn_played: int = 0
 
+        # Keyword bitmask; starts as the printed keywords and effects may grant more.
+        self.keywords: int = definition.keywords
+
+    @property
+    def card_id(self) -> str:
+        return self.definition.card_id
+
+    @property
+    def name(self) -> str:
+        return self.definition.name
+
+    def snapshot(self) -> tuple:
+        """Returns the card's mutable state as a compact tuple (see restore)."""
+        return (self.atk, self.defense, self.is_evolved, self.gained_rush_this_turn,
+                self.attacks_made_this_turn, self.max_attacks_per_turn, self.turn_played,
+                self.keywords)
+
+    def restore(self, state: tuple):
+        """Restores the mutable state captured by snapshot()."""
+        (self.atk, self.defense, self.is_evolved, self.gained_rush_this_turn,
+         self.attacks_made_this_turn, self.max_attacks_per_turn, self.turn_played,
+         self.keywords) = state
+
     def get_property(self, key: str, default=None):
-        return self.properties.get(key, default)
+        attr = _INSTANCE_PROPERTIES.get(key)
+        if attr is not None:
+            return getattr(self, attr)
+        return self.definition.properties.get(key, default)
 
     def __repr__(self) -> str:
         return f"Card(ID: {self.card_id}, Name: '{self.name}')"
\ No newline at end of file
@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+@dataclass(frozen=True, slots=True)
+class CardDefinition:
+    """
+    The immutable description of a card (name, cost, printed stats, text).
+
+    One definition is created per card id and shared by every Card instance
+    of that id, so building a deck never copies card data.
+    """
+    card_id: str
+    name: str
+    properties: Mapping[str, Any] = field(default_factory=dict)
+    # Bitmask of keyword abilities, parsed once when the definition is built.
+    # The bit meanings are defined by each game (see games/sv/modules/keywords.py).
+    keywords: int = 0
+
+    def __post_init__(self):
+        # Freeze the property mapping (and any list values) so no instance can mutate shared data.
+        frozen = {k: tuple(v) if isinstance(v, list) else v for k, v in self.properties.items()}
+        object.__setattr__(self, 'properties', MappingProxyType(frozen))
+
+    def get_property(self, key: str, default=None):
+        return self.properties.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"CardDefinition(ID: {self.card_id}, Name: '{self.name}')"
@@ -1,5 +1,5 @@
 import random
-from typing import List
+from typing import List, Optional
 from .zone import Zone
 from .card import Card
 
@@ -17,9 +17,23 @@ class Deck(Zone):
                 card.owner = self.owner
             self.cards = list(cards)
 
-    def shuffle(self):
-        """Shuffles the cards in the deck randomly."""
-        random.shuffle(self.cards)
+    def shuffle(self, rng: Optional[random.Random] = None):
+        """
+        Shuffles the cards in the deck randomly.
+
+        Args:
+            rng (random.Random, optional): The stream to shuffle with. Defaults to the
+                attached GameState's shuffle stream, or the global `random` module.
+        """
+        if rng is None:
+            rng = self.game_state.rng.shuffle if self.game_state is not None else random
+        cards = list(self.cards)
+        rng.shuffle(cards)
+        # Swap in the new order through the GameState so a journal can undo it.
+        if self.game_state is not None:
+            self.game_state.set_attr(self, 'cards', cards)
+        else:
+            self.cards = cards
 
     def draw(self) -> Card:
         """
@@ -29,7 +43,9 @@ class Deck(Zone):
             Card: The card from the top of the deck, or None if the deck is empty.
         """
         if len(self.cards) > 0:
-            return self.cards.pop(0) # Draw from the "top" (index 0)
+            card = self.cards[0] # Draw from the "top" (index 0)
+            self.remove(card)
+            return card
         return None
 
     def __repr__(self) -> str:
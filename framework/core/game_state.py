@@ -1,5 +1,24 @@
-from typing import List
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from .card import Card
+from .journal import Journal, SET_ATTR, ZONE_ADD
 from .player import Player
+from .rng import GameRng, Seed
+from .zone import Zone
+from .zobrist import HASH_MASK, card_key, feature_key
+from ..utils.events import EventSink, EventType
+
+class GameStateSnapshot(NamedTuple):
+    """
+    The mutable data of a GameState at one moment, as produced by GameState.snapshot().
+
+    Cards are referenced, never copied: each zone entry stores the zone, the
+    cards it held (in order) and each card's snapshot() tuple.
+    """
+    turn_number: int
+    active_player_index: int
+    players: Tuple[Tuple[int, bool, tuple], ...]
+    zones: Tuple[Tuple[Zone, Tuple[Card, ...], Tuple[tuple, ...]], ...]
+    zobrist_hash: int
 
 class GameState:
     """
@@ -8,20 +27,65 @@ class GameState:
     This is the top-level container that holds all players, tracks the
     current turn, and manages any global game zones.
     """
-    def __init__(self, players: List[Player], game_engine: 'BaseGameEngine'):
+    # Attributes that contribute to zobrist_hash when changed through set_attr.
+    HASHED_ATTRS = ('turn_number', 'active_player_index')
+
+    def __init__(self, players: List[Player], game_engine: 'BaseGameEngine', seed: Optional[Seed] = None):
         """
         Initializes the GameState.
 
         Args:
             players (List[Player]): A list of Player objects participating in the game.
+            seed (int or str, optional): Seeds this game's random streams (see GameRng).
+                A random seed is chosen when omitted; it is kept in rng.seed.
         """
         if not players or len(players) < 1:
             raise ValueError("GameState requires at least one player.")
         
         self.players = players
         self.game_engine = game_engine
+        # The engine's event sink, shared by everything that reaches this state.
+        engine_events = getattr(game_engine, 'events', None)
+        self.events: EventSink = engine_events if engine_events is not None else EventSink()
         self.turn_number = 0
         self.active_player_index = -1 # No active player until the game starts
+        # All randomness in the game (shuffles, agent choices, card effects) comes from here.
+        self.rng = GameRng(seed)
+
+        # Lookup tables so engines and agents never scan zones or player lists.
+        # card_index maps a card's instance_id to (card, zone, owner) and is kept
+        # current by Zone.add / Zone.remove.
+        self.card_index: Dict[str, Tuple[Card, Zone, Player]] = {}
+        self._players_by_name: Dict[str, Player] = {p.name: p for p in players}
+        self._opponents: Dict[Player, Player] = {
+            p: players[(i + 1) % len(players)] for i, p in enumerate(players)
+        }
+        # When set, every change made through card_added / card_removed /
+        # set_attr is recorded so it can be reverted with undo().
+        self.journal: Optional[Journal] = None
+
+        # A 64-bit position hash, kept current by the mutation hooks below so
+        # search agents can detect transpositions. Zones are hashed as multisets.
+        self.zobrist_hash: int = 0
+        self._seats: Dict[Player, int] = {p: i for i, p in enumerate(players)}
+        self._hash_labels: Dict[object, Tuple[object, Tuple[str, ...]]] = {}
+
+        # Change tracking for incremental consumers. Every change made through
+        # the mutation hooks advances `version`, and each zone and object (card,
+        # player, resource manager, this GameState) it touched is stamped with
+        # the new value in `versions`. Consumers keep the version they last saw
+        # and ask changed_since(), so any number of them can follow one state.
+        # win_check_pending is set whenever a player's life or deck-out flag changes.
+        self.version: int = 0
+        self.versions: Dict[Any, int] = {}
+        self.win_check_pending: bool = True
+
+        for player in players:
+            for zone in player.zones.values():
+                zone.game_state = self
+                for card in zone.get_cards():
+                    self.index_card(card, zone)
+        self.rehash()
 
     @property
     def active_player(self) -> Player:
@@ -30,21 +94,218 @@ class GameState:
             return self.players[self.active_player_index]
         return None
 
+    def get_player(self, name: str) -> Optional[Player]:
+        """Returns the player with the given name, or None."""
+        return self._players_by_name.get(name)
+
+    def get_opponent(self, player: Player) -> Player:
+        """Returns the player who acts after `player` (the opponent in a two-player game)."""
+        return self._opponents[player]
+
+    def find_card(self, instance_id: str, zone: Optional[Zone] = None) -> Optional[Card]:
+        """
+        Finds a card anywhere in the game by its instance_id.
+
+        Args:
+            instance_id (str): The card's unique instance id.
+            zone (Zone, optional): If given, the card is only returned when it is in this zone.
+        """
+        entry = self.card_index.get(instance_id)
+        if entry is None or (zone is not None and entry[1] is not zone):
+            return None
+        return entry[0]
+
+    def locate_card(self, instance_id: str) -> Optional[Tuple[Card, Zone, Player]]:
+        """Returns the (card, zone, owner) entry for an instance_id, or None."""
+        return self.card_index.get(instance_id)
+
+    def index_card(self, card: Card, zone: Zone):
+        """Records that `card` is now in `zone`."""
+        self.card_index[card.instance_id] = (card, zone, zone.owner)
+
+    def unindex_card(self, card: Card):
+        """Forgets a card that left its zone."""
+        self.card_index.pop(card.instance_id, None)
+
+    # --- Change tracking ---
+
+    def changed_since(self, obj, version: int) -> bool:
+        """Whether `obj` (a zone, card, player, resource manager or this GameState) changed after `version`."""
+        return self.versions.get(obj, 0) > version
+
+    def mark_all_dirty(self):
+        """Forces incremental consumers to rebuild, e.g. after state was changed directly."""
+        self.version += 1
+        self.versions[self] = self.version
+        self.win_check_pending = True
+
+    # --- Mutation hooks ---
+    # All in-game changes go through these so the index and journal stay in step.
+
+    def card_added(self, card: Card, zone: Zone, position: int):
+        """Called by Zone.add after `card` was inserted at `position`."""
+        self.index_card(card, zone)
+        version = self.version = self.version + 1
+        self.versions[zone] = self.versions[card] = version
+        self.zobrist_hash = (self.zobrist_hash + self._card_key(card, zone)) & HASH_MASK
+        if self.journal is not None:
+            self.journal.record_add(zone, position, card)
+
+    def card_removed(self, card: Card, zone: Zone, position: int):
+        """Called by Zone.remove after `card` was taken from `position`."""
+        self.unindex_card(card)
+        version = self.version = self.version + 1
+        self.versions[zone] = self.versions[card] = version
+        self.zobrist_hash = (self.zobrist_hash - self._card_key(card, zone)) & HASH_MASK
+        if self.journal is not None:
+            self.journal.record_remove(zone, position, card)
+
+    def set_attr(self, obj, name: str, value):
+        """
+        Sets an attribute of a card, player, resource manager, zone or this
+        GameState. Engines use this for every in-game change so it can be
+        journaled and folded into zobrist_hash.
+        """
+        if self.journal is not None:
+            self.journal.record_attr(obj, name, getattr(obj, name))
+
+        if isinstance(obj, Card):
+            entry = self.card_index.get(obj.instance_id)
+            if entry is not None:
+                zone = entry[1]
+                version = self.version = self.version + 1
+                self.versions[zone] = self.versions[obj] = version
+                old_key = self._card_key(obj, zone)
+                setattr(obj, name, value)
+                self.zobrist_hash = (self.zobrist_hash - old_key + self._card_key(obj, zone)) & HASH_MASK
+                return
+        else:
+            self.version += 1
+            self.versions[obj] = self.version
+            if isinstance(obj, Player):
+                self.win_check_pending = True
+            label = self._hash_labels.get(obj)
+            if label is not None and name in label[1]:
+                old_key = feature_key((label[0], name, getattr(obj, name)))
+                self.zobrist_hash = (self.zobrist_hash - old_key + feature_key((label[0], name, value))) & HASH_MASK
+        setattr(obj, name, value)
+
+    def _card_key(self, card: Card, zone: Zone) -> int:
+        return card_key((self._seats[zone.owner], zone.name, card.card_id), card.snapshot())
+
+    def rehash(self) -> int:
+        """
+        Recomputes zobrist_hash from scratch and registers the players and
+        resource managers whose HASHED_ATTRS feed it. Called automatically
+        when the game starts; call it again after changing state directly.
+        """
+        labels = {self: ('game', self.HASHED_ATTRS)}
+        for seat, player in enumerate(self.players):
+            labels[player] = (('player', seat), player.HASHED_ATTRS)
+            if player.resources is not None:
+                labels[player.resources] = (('resources', seat), player.resources.HASHED_ATTRS)
+        self._hash_labels = labels
+
+        total = 0
+        for obj, (label, attrs) in labels.items():
+            for name in attrs:
+                total += feature_key((label, name, getattr(obj, name)))
+        for player in self.players:
+            for zone in player.zones.values():
+                for card in zone.cards:
+                    total += self._card_key(card, zone)
+        self.zobrist_hash = total & HASH_MASK
+        return self.zobrist_hash
+
+    def undo(self, journal: Journal, mark: int = 0):
+        """
+        Reverts the changes recorded in `journal` after `mark`, newest first,
+        and drops those entries.
+        """
+        entries = journal.entries
+        # Reverting goes through the same hooks (with recording off) so the
+        # card index and zobrist_hash are restored along with the data.
+        recording, self.journal = self.journal, None
+        try:
+            while len(entries) > mark:
+                kind, target, key, value = entries.pop()
+                if kind == SET_ATTR:
+                    self.set_attr(target, key, value)
+                elif kind == ZONE_ADD:
+                    del target.cards[key]
+                    value.owner = None
+                    self.card_removed(value, target, key)
+                else: # ZONE_REMOVE
+                    target.cards.insert(key, value)
+                    value.owner = target.owner
+                    self.card_added(value, target, key)
+        finally:
+            self.journal = recording
+
+    def snapshot(self) -> GameStateSnapshot:
+        """
+        Captures the mutable game data: turn, life, resource counters, zone
+        contents and card stats. The engine, scripting runtime and card
+        definitions are shared, not copied, so this is cheap enough to call
+        at every node of a search.
+        """
+        players = []
+        zones = []
+        for player in self.players:
+            resources = player.resources
+            players.append((player.life, player.has_decked_out,
+                            resources.snapshot() if resources is not None else ()))
+            for zone in player.zones.values():
+                cards = tuple(zone.cards)
+                zones.append((zone, cards, tuple([card.snapshot() for card in cards])))
+        return GameStateSnapshot(self.turn_number, self.active_player_index, tuple(players), tuple(zones),
+                                 self.zobrist_hash)
+
+    def restore(self, snapshot: GameStateSnapshot):
+        """
+        Returns this GameState to the moment `snapshot` was taken. The same
+        snapshot can be restored any number of times.
+        """
+        self.turn_number = snapshot.turn_number
+        self.active_player_index = snapshot.active_player_index
+        for player, (life, has_decked_out, resource_state) in zip(self.players, snapshot.players):
+            player.life = life
+            player.has_decked_out = has_decked_out
+            if player.resources is not None:
+                player.resources.restore(resource_state)
+
+        card_index = {}
+        for zone, cards, states in snapshot.zones:
+            zone.cards = list(cards)
+            owner = zone.owner
+            for card, state in zip(cards, states):
+                card.restore(state)
+                card.owner = owner
+                card_index[card.instance_id] = (card, zone, owner)
+        self.card_index = card_index
+        self.zobrist_hash = snapshot.zobrist_hash
+        self.mark_all_dirty()
+
     def start_game(self):
         """Initializes the game, setting the turn to 1 and the first player as active."""
-        print("Game is starting...")
+        events = self.events
+        if events:
+            events.emit(EventType.GAME_START)
         self.turn_number = 1
         self.active_player_index = 0
-        print(f"Turn {self.turn_number}: It is {self.active_player.name}'s turn.")
+        self.rehash()
+        self.mark_all_dirty()
+        if events:
+            events.emit(EventType.TURN_START, turn=self.turn_number, player=self.active_player.name)
 
     def end_turn(self):
         """Ends the current turn and advances to the next player."""
         # Simple turn progression: cycle through players.
-        self.active_player_index = (self.active_player_index + 1) % len(self.players)
+        self.set_attr(self, 'active_player_index', (self.active_player_index + 1) % len(self.players))
         
         # If we've looped back to the first player, it's a new round of turns.
         if self.active_player_index == 0:
-            self.turn_number += 1
+            self.set_attr(self, 'turn_number', self.turn_number + 1)
 
     def __repr__(self) -> str:
         """Provides a developer-friendly string representation of the game state."""
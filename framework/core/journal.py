@@ -0,0 +1,43 @@
+from typing import Any, List, Tuple
+
+# Entry kinds. Each journal entry is a flat (kind, a, b, c) tuple.
+SET_ATTR = 0     # (SET_ATTR, obj, attribute_name, old_value)
+ZONE_ADD = 1     # (ZONE_ADD, zone, position, card)
+ZONE_REMOVE = 2  # (ZONE_REMOVE, zone, position, card)
+
+class Journal:
+    """
+    An undo log of the changes made to a GameState.
+
+    While a journal is attached to a GameState (game_state.journal), every
+    zone move and every GameState.set_attr() call appends one entry.
+    GameState.undo() replays the entries backwards to restore the exact
+    prior state. A search can reuse one journal for a whole tree by
+    remembering mark() before each move and undoing back to it.
+    """
+    __slots__ = ('entries',)
+
+    def __init__(self):
+        self.entries: List[Tuple[int, Any, Any, Any]] = []
+
+    def mark(self) -> int:
+        """Returns a position that GameState.undo() can roll back to."""
+        return len(self.entries)
+
+    def record_attr(self, obj: Any, name: str, old_value: Any):
+        self.entries.append((SET_ATTR, obj, name, old_value))
+
+    def record_add(self, zone: 'Zone', position: int, card: 'Card'):
+        self.entries.append((ZONE_ADD, zone, position, card))
+
+    def record_remove(self, zone: 'Zone', position: int, card: 'Card'):
+        self.entries.append((ZONE_REMOVE, zone, position, card))
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"Journal(Entries: {len(self.entries)})"
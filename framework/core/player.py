@@ -3,9 +3,13 @@ from typing import List, Dict, Optional
 from .card import Card
 from .deck import Deck
 from .zone import Zone
+from ..utils.events import EventType
 'BaseResourceManager'
 
 class Player:
+    # Attributes that contribute to GameState.zobrist_hash.
+    HASHED_ATTRS = ('life', 'has_decked_out')
+
     def __init__(self, name: str, life: int = 20):
         self.name = name
         self.life = life
@@ -17,6 +21,10 @@ class Player:
         }
         self.resources: Optional['BaseResourceManager'] = None
         self.has_decked_out: bool = False
+        # The card ids given to setup_deck, before any shuffle, and whether it
+        # shuffled them. Replays rebuild the deck from these and the game's seed.
+        self.deck_list: List[str] = []
+        self.deck_shuffled: bool = False
 
     # ... (properties are unchanged)
     @property
@@ -35,9 +43,19 @@ class Player:
     def board(self) -> Zone:
         return self.zones["Board"]
         
-    def setup_deck(self, cards: List[Card]):
-        self.deck.cards = cards
-        self.deck.shuffle()
+    def setup_deck(self, cards: List[Card], shuffle: bool = True):
+        """
+        Fills the deck with `cards` and shuffles it. Pass shuffle=False to keep
+        an order the caller already fixed (e.g. for paired evaluation).
+        """
+        self.deck.cards = []
+        self.deck_list = [card.card_id for card in cards]
+        self.deck_shuffled = shuffle
+        # Add through the zone so an attached GameState indexes every card.
+        for card in cards:
+            self.deck.add(card)
+        if shuffle:
+            self.deck.shuffle()
 
     # --- METHOD UPDATED HERE ---
     def draw_card(self, game_state: 'GameState'): # Add game_state as an argument
@@ -47,8 +65,9 @@ class Player:
         """
         card = self.deck.draw()
         if not card:
-            self.has_decked_out = True
-            print(f"!!! {self.name}'s deck is empty. They will lose if the turn ends!")
+            game_state.set_attr(self, 'has_decked_out', True)
+            if game_state.events:
+                game_state.events.emit(EventType.DECK_EMPTY, player=self.name)
             return None
 
         # --- UPDATED LOGIC ---
@@ -56,7 +75,8 @@ class Player:
         hand_limit = game_state.game_engine.max_hand_size
         
         if len(self.hand) >= hand_limit:
-            print(f"!!! {self.name}'s hand is full (limit: {hand_limit})! '{card.name}' is discarded. !!!")
+            if game_state.events:
+                game_state.events.emit(EventType.HAND_FULL, player=self.name, limit=hand_limit, card=card.name)
             self.graveyard.add(card)
         else:
             self.hand.add(card)
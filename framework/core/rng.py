@@ -0,0 +1,43 @@
+import random
+import secrets
+from typing import Optional, Tuple, Union
+
+Seed = Union[int, str]
+
+class GameRng:
+    """
+    The random number streams of a single game, all derived from one seed.
+
+    Each stream is an independent random.Random, so extra draws in one of
+    them (an agent thinking longer, a new random card effect) never shift
+    the others:
+        shuffle - deck shuffles
+        agent   - random choices made by agents
+        effect  - random card effects (random targets, random summons...)
+
+    Two games created with the same seed play out identically given the
+    same decisions, in any process.
+    """
+    STREAMS = ('shuffle', 'agent', 'effect')
+
+    def __init__(self, seed: Optional[Seed] = None):
+        if seed is None:
+            seed = secrets.randbits(63)
+        self.seed = seed
+        # String seeds are hashed with SHA-512 by random.Random, which is
+        # stable across processes and Python hash randomization.
+        self.shuffle = random.Random(f"{seed}:shuffle")
+        self.agent = random.Random(f"{seed}:agent")
+        self.effect = random.Random(f"{seed}:effect")
+
+    def getstate(self) -> Tuple[object, ...]:
+        """Captures the position of every stream."""
+        return tuple(getattr(self, name).getstate() for name in self.STREAMS)
+
+    def setstate(self, state: Tuple[object, ...]):
+        """Returns every stream to a position captured by getstate()."""
+        for name, stream_state in zip(self.STREAMS, state):
+            getattr(self, name).setstate(stream_state)
+
+    def __repr__(self) -> str:
+        return f"GameRng(Seed: {self.seed!r})"
@@ -0,0 +1,76 @@
+import hashlib
+import struct
+from typing import Dict, Hashable, Tuple
+
+HASH_MASK = (1 << 64) - 1
+STATE_CACHE_SIZE = 1 << 16
+
+class ZobristKeys:
+    """
+    Assigns a fixed 64-bit key to every hashable game feature.
+
+    A GameState's hash is the sum (mod 2**64) of the keys of its features.
+    Keys are added and subtracted instead of XORed, so duplicate cards in the
+    same zone do not cancel each other out.
+
+    Each key is derived from the seed and the feature itself, so a position
+    hashes the same in every process, whatever order its features were
+    first seen in. Derived keys are cached; features are kept small (one
+    attribute's value) so the cache is bounded by the range of each value.
+    A card's key is derived from its place and whole state together, and
+    only recently used ones are cached.
+    """
+    def __init__(self, seed: int = 0x7C6A):
+        self._seed = seed.to_bytes(8, 'little')
+        self._keys: Dict[Hashable, int] = {}
+        # The keys of recently used (place, card state) pairs. They are cheap
+        # to derive again, so the cache is simply emptied when it fills up.
+        self._states: Dict[Hashable, int] = {}
+        self._state_formats: Dict[int, struct.Struct] = {}
+
+    def key(self, feature: Hashable) -> int:
+        k = self._keys.get(feature)
+        if k is None:
+            k = self._keys[feature] = self._derive(feature)
+        return k
+
+    def card_key(self, place: Hashable, state: Tuple[int, ...]) -> int:
+        """
+        The key of a card at `place`, e.g. (seat, zone, card_id), whose
+        mutable state is `state` (Card.snapshot()). The whole state is
+        hashed at once, so copies of a card whose stats add up to the same
+        totals (a 2/1 and a 2/3 against two 2/2s) still get unrelated keys.
+        """
+        feature = (place, state)
+        k = self._states.get(feature)
+        if k is None:
+            packer = self._state_formats.get(len(state))
+            if packer is None:
+                packer = self._state_formats[len(state)] = struct.Struct(f'<Q{len(state)}q')
+            # The place's key already depends on the seed, so the digest needs no key of its own.
+            digest = hashlib.blake2b(packer.pack(self.key(place), *state), digest_size=8).digest()
+            if len(self._states) >= STATE_CACHE_SIZE:
+                self._states.clear()
+            k = self._states[feature] = int.from_bytes(digest, 'little')
+        return k
+
+    def _derive(self, feature: Hashable) -> int:
+        digest = hashlib.blake2b(repr(feature).encode('utf-8'), digest_size=8, key=self._seed).digest()
+        return int.from_bytes(digest, 'little')
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._states)
+
+
+# One key table per process. Keys do not depend on the process, so hashes
+# are comparable across games, processes and saved replays.
+ZOBRIST_KEYS = ZobristKeys()
+
+
+def feature_key(feature: Hashable) -> int:
+    """Returns the shared key for a feature tuple."""
+    return ZOBRIST_KEYS.key(feature)
+
+
+# The shared key for a card's place and mutable state (see ZobristKeys.card_key).
+card_key = ZOBRIST_KEYS.card_key
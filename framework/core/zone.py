@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from .card import Card
 
 class Zone:
@@ -10,6 +10,8 @@ class Zone:
         self.name = name
         self.cards: List[Card] = []
         self.owner = owner # Store the owner of the zone
+        # Attached by GameState so the zone can keep the game's card index current.
+        self.game_state: Optional['GameState'] = None
 
     def add(self, card: Card):
         """Adds a card to this zone and sets its owner."""
@@ -19,14 +21,19 @@ class Zone:
         # A card's owner is the owner of the zone it is in.
         card.owner = self.owner
         self.cards.append(card)
+        if self.game_state is not None:
+            self.game_state.card_added(card, self, len(self.cards) - 1)
 
     def remove(self, card: Card):
         """Removes a card from this zone."""
-        if card in self.cards:
-            self.cards.remove(card)
-            card.owner = None # Clear owner when it leaves a zone
-        else:
+        try:
+            position = self.cards.index(card)
+        except ValueError:
             raise ValueError(f"Card {card} not found in zone {self.name}.")
+        del self.cards[position]
+        card.owner = None # Clear owner when it leaves a zone
+        if self.game_state is not None:
+            self.game_state.card_removed(card, self, position)
 
     def get_cards(self) -> List[Card]:
         """Returns the list of cards in this zone."""
@@ -1,27 +1,70 @@
+import logging
+import os
 from lupa import LuaRuntime
-from typing import Any
+from typing import Any, Dict, Optional, Set, Tuple
 
 from ..core.card import Card
 from ..core.game_state import GameState
+from ..utils.events import EventSink, EventType
+
+logger = logging.getLogger(__name__)
+
+# Runs a script's source once in a fresh environment (falling back to the
+# globals, so `api` stays visible) and returns that environment. Each script
+# keeps its own on_fanfare / on_last_words instead of overwriting a global.
+_LOAD_SCRIPT = '''
+function(code, chunk_name)
+  local env = setmetatable({}, {__index = _G})
+  local chunk, err = load(code, chunk_name, 't', env)
+  if not chunk then error(err, 0) end
+  chunk()
+  return env
+end
+'''
 
 class LuaEngine:
     """
     A wrapper for the Lua runtime. It loads, executes, and provides a Python API
     to Lua scripts. This is the bridge between Python and Lua.
+
+    Each script file is compiled once and its functions are cached per
+    (script_path, function_name); scripts that do not exist, or do not define
+    the function, are cached as misses. A trigger is then one dict lookup and
+    one Lua call. With `dev_mode`, every call checks the file's mtime and
+    recompiles edited scripts (or picks up new ones).
+
+    Script errors are sent to the event sink as SCRIPT_ERROR. With nobody
+    subscribed (headless runs) they are logged instead, once per script
+    function, and `error_count` counts every one of them either way.
     """
-    def __init__(self, script_api: Any):
+    def __init__(self, script_api: Any, events: Optional[EventSink] = None, dev_mode: bool = False):
         """
         Initializes the Lua runtime and injects the Python ScriptAPI.
+
+        Args:
+            events (EventSink, optional): Where script errors are reported, usually the engine's sink.
+            dev_mode (bool): Reload scripts whose file changed since they were compiled.
         """
+        self.events = events if events is not None else EventSink()
+        self.dev_mode = dev_mode
         self.lua = LuaRuntime(unpack_returned_tuples=True)
         # Inject the Python API object into the Lua global namespace.
         # Lua scripts can now call Python functions via `api.function_name()`.
         self.lua.globals().api = script_api
-        print("Lua Engine Initialized.")
+        self._load_script = self.lua.eval(_LOAD_SCRIPT)
+        self.error_count = 0
+        self._logged_errors: Set[Tuple[str, str]] = set()
+
+        # (script_path, function_name) -> compiled function, or None for a miss.
+        self._functions: Dict[Tuple[str, str], Any] = {}
+        # script_path -> the script's environment table, or None if it has no file.
+        self._scripts: Dict[str, Any] = {}
+        # script_path -> mtime the cached entry was built from (dev mode only).
+        self._mtimes: Dict[str, Optional[int]] = {}
 
     def run_script(self, script_path: str, function_name: str, card: Card, game_state: GameState):
         """
-        Loads a script from a file and executes a specific function within it.
+        Executes a specific function of a card script.
 
         Args:
             script_path (str): The full path to the .lua script.
@@ -29,21 +72,82 @@ class LuaEngine:
             card (Card): The card object associated with this effect.
             game_state (GameState): The current state of the game.
         """
+        key = (script_path, function_name)
+        if self.dev_mode and self._mtimes.get(script_path, -1) != self._mtime(script_path):
+            self.invalidate(script_path)
+        try:
+            function = self._functions[key]
+        except KeyError:
+            function = self._functions[key] = self._compile(script_path, function_name)
+        if function is None:
+            # It is perfectly normal for a card to have no script (e.g., a vanilla follower).
+            return
+
+        try:
+            function(card, game_state)
+        except Exception as e:
+            self._report_error(script_path, function_name, e)
+
+    def warm_up(self, script_dir: str) -> int:
+        """
+        Compiles every .lua script in `script_dir` ahead of time, so the first
+        trigger of each card costs no file access. Returns the number of scripts loaded.
+        """
+        loaded = 0
+        for filename in sorted(os.listdir(script_dir)):
+            if filename.endswith('.lua'):
+                if self._script_env(os.path.join(script_dir, filename)) is not None:
+                    loaded += 1
+        return loaded
+
+    def invalidate(self, script_path: Optional[str] = None):
+        """Drops the cached compilation of one script, or of every script."""
+        if script_path is None:
+            self._functions.clear()
+            self._scripts.clear()
+            self._mtimes.clear()
+            return
+        for key in [key for key in self._functions if key[0] == script_path]:
+            del self._functions[key]
+        self._scripts.pop(script_path, None)
+        self._mtimes.pop(script_path, None)
+
+    def _compile(self, script_path: str, function_name: str):
+        env = self._script_env(script_path)
+        if env is None:
+            return None
+        return env[function_name]
+
+    def _script_env(self, script_path: str):
+        """Loads a script once and returns its environment table (None if it cannot be loaded)."""
+        if script_path in self._scripts:
+            return self._scripts[script_path]
+        if self.dev_mode:
+            self._mtimes[script_path] = self._mtime(script_path)
+        env = None
         try:
             with open(script_path, 'r') as f:
                 lua_code = f.read()
-            
-            # Create a Lua function from the code string.
-            # We pass `self` (the card) and `game_state` as arguments to the Lua function.
-            lua_function = self.lua.eval(f'function(self, game_state) {lua_code} return {function_name}(self, game_state) end')
-            
-            # Execute the function
-            lua_function(card, game_state)
-
+            env = self._load_script(lua_code, '@' + script_path)
         except FileNotFoundError:
-            # It is perfectly normal for a card to have no script (e.g., a vanilla follower).
-            # We can silently ignore this.
             pass
         except Exception as e:
-            # Catch other potential Lua errors (e.g., syntax errors in the .lua file).
-            print(f"!!! LUA ERROR in '{script_path}' -> {function_name}: {e}")
\ No newline at end of file
+            # Syntax errors and errors raised while the script's top level runs.
+            self._report_error(script_path, '(load)', e)
+        self._scripts[script_path] = env
+        return env
+
+    def _report_error(self, script_path: str, function_name: str, error: Exception):
+        self.error_count += 1
+        if self.events:
+            self.events.emit(EventType.SCRIPT_ERROR, script=script_path, function=function_name, error=error)
+        elif (script_path, function_name) not in self._logged_errors:
+            self._logged_errors.add((script_path, function_name))
+            logger.warning("Lua error in '%s' -> %s: %s", script_path, function_name, error)
+
+    @staticmethod
+    def _mtime(script_path: str) -> Optional[int]:
+        try:
+            return os.stat(script_path).st_mtime_ns
+        except OSError:
+            return None
@@ -16,37 +16,26 @@ class Action:
         """
         Creates a human-readable string representation of the action.
         """
-        player = next((p for p in game_state.players if p.name == self.player_id), None)
+        player = game_state.get_player(self.player_id)
         if not player: return "Action by Unknown Player"
 
         if self.action_type == "PLAY_CARD":
-            card_id = self.details['card_instance_id']
-            card = next((c for c in player.hand.get_cards() if c.instance_id == card_id), None)
-            if not card: card = next((c for c in player.board.get_cards() if c.instance_id == card_id), None)
-            if not card: card = next((c for c in player.graveyard.get_cards() if c.instance_id == card_id), None)
+            card = game_state.find_card(self.details['card_instance_id'])
             return f"Played {card.name}" if card else "Played Unknown Card"
 
         if self.action_type == "ATTACK":
-            attacker_id = self.details['attacker_id']
             target_id = self.details['target_id']
-            
-            attacker = next((c for c in player.board.get_cards() if c.instance_id == attacker_id), None)
-            
-            opponent = next(p for p in game_state.players if p is not player)
-            # --- FIX APPLIED HERE: Search board AND graveyard for the target ---
-            target = next((c for c in opponent.board.get_cards() if c.instance_id == target_id), None)
-            if not target: target = next((c for c in opponent.graveyard.get_cards() if c.instance_id == target_id), None)
-            
-            if not target and opponent.name == target_id:
-                target = opponent
+            # The index covers every zone, so attackers and targets that have
+            # already died are still found in the graveyard.
+            attacker = game_state.find_card(self.details['attacker_id'])
+            target = game_state.find_card(target_id) or game_state.get_player(target_id)
             
             attacker_name = attacker.name if attacker else "Unknown"
             target_name = target.name if target else "Unknown"
             return f"Attacked {target_name} with {attacker_name}"
 
         if self.action_type == "EVOLVE":
-            target_id = self.details['target_id']
-            target = next((c for c in player.board.get_cards() if c.instance_id == target_id), None)
+            target = game_state.find_card(self.details['target_id'])
             return f"Evolved {target.name}" if target else "Evolved Unknown Follower"
         
         if self.action_type == "END_TURN":
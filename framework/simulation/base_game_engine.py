@@ -4,6 +4,7 @@ from typing import List, Optional
 from ..core.game_state import GameState
 from ..core.player import Player
 from .action import Action
+from ..utils.events import EventSink
 
 class BaseGameEngine(ABC):
     """
@@ -23,6 +24,10 @@ class BaseGameEngine(ABC):
         # Define a default, which can be overridden by specific engines.
         self.max_hand_size: int = 9 
 
+        # Structured log output. Displays subscribe to it; with no subscribers
+        # nothing is formatted or printed.
+        self.events = EventSink()
+
     @abstractmethod
     def setup_game(self, game_state: GameState):
         pass
@@ -11,6 +11,9 @@ class BaseResourceManager(ABC):
     This defines the contract for how the core simulator interacts with
     a game's specific resource system (e.g., Mana, Play Points, etc.).
     """
+    # Counters that contribute to GameState.zobrist_hash. Subclasses list theirs.
+    HASHED_ATTRS = ()
+
     def __init__(self, player: Player, game_state: GameState, game_mode: str):
         self.player = player
         self.game_state = game_state
@@ -29,4 +32,15 @@ class BaseResourceManager(ABC):
     @abstractmethod
     def spend_resources_for_card(self, card: Card):
         """Deducts the resources required to play a given card."""
+        pass
+
+    def snapshot(self) -> tuple:
+        """
+        Returns the manager's counters as a tuple for GameState.snapshot().
+        Games whose resources change during play must override this and restore().
+        """
+        return ()
+
+    def restore(self, state: tuple):
+        """Restores counters captured by snapshot()."""
         pass
\ No newline at end of file
@@ -0,0 +1,158 @@
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+# A game scores 2 points for a win, 1 for a draw and 0 for a loss, so a
+# seed pair (both seatings of the same seed) scores 0-4 for configuration A.
+PAIR_OUTCOMES = 5
+
+# Pair-score variance used by the SPRT when the observed variance is smaller,
+# e.g. mirror matches where every pair scores exactly 2 points.
+MIN_PAIR_VARIANCE = 1e-3
+
+@dataclass
+class PairedStats:
+    """
+    Results of paired games between configuration A and configuration B.
+
+    Each seed is played twice with the seats swapped, and the two games are
+    scored together. Seat advantage and per-seat luck cancel within a pair,
+    so the pair score varies less than single games do (see variance_ratio).
+    """
+    # counts[k] = number of seed pairs in which A scored k points (0-4).
+    counts: List[int] = field(default_factory=lambda: [0] * PAIR_OUTCOMES)
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+
+    def record(self, points_first: int, points_second: int):
+        """Adds one seed pair; each argument is A's points (0, 1 or 2) in one game."""
+        self.counts[points_first + points_second] += 1
+        for points in (points_first, points_second):
+            if points == 2:
+                self.wins += 1
+            elif points == 1:
+                self.draws += 1
+            else:
+                self.losses += 1
+
+    @property
+    def pairs(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def games(self) -> int:
+        return 2 * self.pairs
+
+    @property
+    def score(self) -> float:
+        """A's mean score per game, from 0 (always lost) to 1 (always won)."""
+        pairs = self.pairs
+        if not pairs:
+            return 0.5
+        return sum(k * c for k, c in enumerate(self.counts)) / (4 * pairs)
+
+    @property
+    def pair_variance(self) -> float:
+        """Variance of the pair score (scaled to 0-1)."""
+        pairs = self.pairs
+        if not pairs:
+            return 0.0
+        mean = self.score
+        return sum(c * (k / 4 - mean) ** 2 for k, c in enumerate(self.counts)) / pairs
+
+    @property
+    def standard_error(self) -> float:
+        pairs = self.pairs
+        return math.sqrt(self.pair_variance / pairs) if pairs else float('inf')
+
+    def confidence_interval(self, z: float = 1.96) -> Tuple[float, float]:
+        """A normal-approximation interval for A's score (95% by default)."""
+        margin = z * self.standard_error
+        return self.score - margin, self.score + margin
+
+    @property
+    def variance_ratio(self) -> float:
+        """
+        Variance of the paired estimate relative to the same number of
+        independent games. Below 1 means pairing saved games: an unpaired run
+        would need 1 / variance_ratio times as many games.
+        """
+        pairs = self.pairs
+        if not pairs:
+            return 1.0
+        wins, draws, games = self.wins, self.draws, self.games
+        mean = (wins + 0.5 * draws) / games
+        game_variance = (wins * (1 - mean) ** 2 + draws * (0.5 - mean) ** 2
+                         + self.losses * mean ** 2) / games
+        if game_variance == 0:
+            return 1.0
+        # Unpaired estimate: game_variance / games. Paired: pair_variance / pairs.
+        return (self.pair_variance / pairs) / (game_variance / games)
+
+
+class Sprt:
+    """
+    A sequential probability ratio test on the pair scores of PairedStats.
+
+    Tests H0: score = score0 against H1: score = score1 using the normal
+    (GSPRT) approximation of the log-likelihood ratio, with type I error
+    `alpha` and type II error `beta`. No decision is made before `min_pairs`
+    pairs, so the variance estimate has something to stand on.
+    """
+    def __init__(self, score0: float, score1: float, alpha: float = 0.05, beta: float = 0.05,
+                 min_pairs: int = 16):
+        if score0 == score1:
+            raise ValueError("SPRT hypotheses must differ.")
+        self.score0 = score0
+        self.score1 = score1
+        self.min_pairs = min_pairs
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+
+    def llr(self, stats: PairedStats) -> float:
+        if stats.pairs < 2:
+            return 0.0
+        variance = max(stats.pair_variance, MIN_PAIR_VARIANCE)
+        s0, s1 = self.score0, self.score1
+        return (s1 - s0) * (2 * stats.score - s0 - s1) * stats.pairs / (2 * variance)
+
+    def decision(self, stats: PairedStats) -> Optional[bool]:
+        """True if H1 is accepted, False if H0 is accepted, None to keep playing."""
+        if stats.pairs < self.min_pairs:
+            return None
+        llr = self.llr(stats)
+        if llr >= self.upper:
+            return True
+        if llr <= self.lower:
+            return False
+        return None
+
+
+class MatchupSprt:
+    """
+    A two-sided decision built from two SPRTs: "A is stronger by at least
+    `delta`", "B is stronger by at least `delta`", or "neither edge reaches
+    `delta`" once both one-sided tests accept their null hypothesis.
+    """
+    A_STRONGER = "A stronger"
+    B_STRONGER = "B stronger"
+    NO_EDGE = "no edge"
+
+    def __init__(self, delta: float = 0.05, alpha: float = 0.05, beta: float = 0.05):
+        self.delta = delta
+        self.alpha = alpha
+        self.beta = beta
+        self.a_test = Sprt(0.5, 0.5 + delta, alpha, beta)
+        self.b_test = Sprt(0.5, 0.5 - delta, alpha, beta)
+
+    def decision(self, stats: PairedStats) -> Optional[str]:
+        a_better = self.a_test.decision(stats)
+        b_better = self.b_test.decision(stats)
+        if a_better:
+            return self.A_STRONGER
+        if b_better:
+            return self.B_STRONGER
+        if a_better is False and b_better is False:
+            return self.NO_EDGE
+        return None
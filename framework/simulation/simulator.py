@@ -1,38 +1,68 @@
-from typing import List
+from typing import List, Optional
 
 from agents.base_agent import BaseAgent
 from ..core.game_state import GameState
 from ..core.player import Player
+from ..core.rng import Seed
 from .base_game_engine import BaseGameEngine
 from ..utils.display import Display
+from ..utils.events import EventSink, EventType
 
 class GameSimulator:
-    def __init__(self, game_engine: BaseGameEngine, agents: List[BaseAgent]):
+    def __init__(self, game_engine: BaseGameEngine, agents: List[BaseAgent], seed: Optional[Seed] = None):
         if len(agents) < 1:
             raise ValueError("Simulator requires at least one agent.")
         self.game_engine = game_engine
         self.agents = agents
         players = [Player(name=agent.name) for agent in self.agents]
-        self.game_state = GameState(players=players, game_engine=self.game_engine)
+        self.game_state = GameState(players=players, game_engine=self.game_engine, seed=seed)
         self.display = Display()
 
-    def run(self, max_turns: int = 50, log_level: str = 'pretty'):
+    def run(self, max_turns: int = 50, log_level: str = 'pretty', recorder=None) -> Optional[Player]:
+        """
+        Plays a single game to completion.
+
+        Args:
+            log_level (str): 'pretty' or 'simple' subscribe the Display to the
+                engine's events for this game; 'none' leaves the run silent.
+            recorder (optional): Receives the game as it is played, e.g. a
+                games.sv.replay.ReplayRecorder. Nothing is recorded when omitted.
+
+        Returns:
+            Optional[Player]: The winning player, or None if the game was aborted
+            or reached the turn limit without a winner.
+        """
+        events = self.game_engine.events
+        subscribed = log_level in ('pretty', 'simple')
+        if subscribed:
+            self.display.log_level = log_level
+            events.subscribe(self.display.handle_event)
+        try:
+            return self._play(max_turns, events, recorder)
+        finally:
+            if subscribed:
+                events.unsubscribe(self.display.handle_event)
+
+    def _play(self, max_turns: int, events: EventSink, recorder) -> Optional[Player]:
+        if recorder is not None:
+            recorder.begin(self.game_state)
         self.game_engine.setup_game(self.game_state)
         self.game_state.start_game()
         
         winner = None
         while self.game_state.turn_number <= max_turns:
+            if recorder is not None:
+                recorder.turn_start(self.game_state)
             active_player = self.game_state.active_player
-            active_agent = next(agent for agent in self.agents if agent.name == active_player.name)
+            # Players are created in agent order, so seats and agents share an index.
+            active_agent = self.agents[self.game_state.active_player_index]
             
             if active_player.resources:
                 active_player.resources.start_turn()
             active_player.draw_card(self.game_state)
             
-            if log_level == 'pretty':
-                self.display.display_board(self.game_state)
-            elif log_level == 'simple':
-                self.display.display_turn_summary(self.game_state)
+            if events:
+                events.emit(EventType.TURN_BEGIN, game_state=self.game_state)
 
             while True:
                 possible_actions = self.game_engine.get_possible_actions(self.game_state)
@@ -41,15 +71,19 @@ class GameSimulator:
 
                 chosen_action = active_agent.choose_action(self.game_state, possible_actions)
                 if chosen_action == "quit_to_menu":
-                    print("\n--- Game aborted by user. Returning to main menu. ---")
-                    return
+                    if events:
+                        events.emit(EventType.GAME_ABORTED)
+                    if recorder is not None:
+                        recorder.finish(None)
+                    return None
 
+                if recorder is not None:
+                    recorder.action(self.game_state, chosen_action)
                 self.game_engine.apply_action(self.game_state, chosen_action)
                 
-                if log_level == 'pretty':
-                    self.display.display_board(self.game_state)
-                elif log_level == 'simple':
-                    print(f"  {active_player.name}: {chosen_action.to_repr(self.game_state)}")
+                if events:
+                    events.emit(EventType.ACTION_APPLIED, game_state=self.game_state,
+                                player=active_player.name, action=chosen_action)
 
                 winner = self.game_engine.check_win_condition(self.game_state)
                 if winner:
@@ -58,12 +92,15 @@ class GameSimulator:
                     break
 
             if winner:
-                print("=" * 30)
-                print(f"GAME OVER! The winner is {winner.name}!")
+                if events:
+                    events.emit(EventType.GAME_OVER, winner=winner.name)
                 break
             
             self.game_state.end_turn()
 
-        if not winner:
-            print("=" * 30)
-            print(f"Simulation finished after reaching the {max_turns} turn limit. No winner.")
\ No newline at end of file
+        if not winner and events:
+            events.emit(EventType.TURN_LIMIT, max_turns=max_turns)
+        if recorder is not None:
+            recorder.finish(winner)
+
+        return winner
\ No newline at end of file
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+EVICTION_POLICIES = ('lru', 'fifo', 'depth', 'always')
+
+@dataclass(slots=True)
+class TTEntry:
+    """
+    A cached search result for one position, keyed by GameState.zobrist_hash.
+    """
+    key: int
+    value: float
+    best_action: Any = None
+    depth: int = 0
+
+class TranspositionTable:
+    """
+    A bounded cache of evaluations and best moves for search agents.
+
+    Eviction policies:
+        'lru'    - when full, drop the least recently looked-up or stored entry.
+        'fifo'   - when full, drop the oldest stored entry.
+        'depth'  - direct-mapped slots; a colliding entry is only replaced by one
+                   searched at least as deep.
+        'always' - direct-mapped slots; a colliding entry is always replaced.
+    """
+    def __init__(self, capacity: int = 1 << 16, policy: str = 'lru'):
+        if capacity < 1:
+            raise ValueError("TranspositionTable capacity must be at least 1.")
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy '{policy}'. Expected one of {EVICTION_POLICIES}.")
+        self.capacity = capacity
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self._ordered: Optional[OrderedDict] = OrderedDict() if policy in ('lru', 'fifo') else None
+        self._slots: Optional[List[Optional[TTEntry]]] = None if self._ordered is not None else [None] * capacity
+        self._size = 0
+
+    def lookup(self, key: int) -> Optional[TTEntry]:
+        """Returns the entry stored for `key`, or None."""
+        if self._ordered is not None:
+            entry = self._ordered.get(key)
+            if entry is not None and self.policy == 'lru':
+                self._ordered.move_to_end(key)
+        else:
+            entry = self._slots[key % self.capacity]
+            if entry is not None and entry.key != key:
+                entry = None
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def store(self, key: int, value: float, best_action: Any = None, depth: int = 0) -> bool:
+        """
+        Stores a result for `key`. Returns False if the policy kept an existing entry instead.
+        """
+        if self._ordered is not None:
+            entry = self._ordered.get(key)
+            if entry is not None:
+                entry.value, entry.best_action, entry.depth = value, best_action, depth
+                if self.policy == 'lru':
+                    self._ordered.move_to_end(key)
+                return True
+            if len(self._ordered) >= self.capacity:
+                self._ordered.popitem(last=False)
+            self._ordered[key] = TTEntry(key, value, best_action, depth)
+            return True
+
+        index = key % self.capacity
+        existing = self._slots[index]
+        if existing is not None and existing.key != key and self.policy == 'depth' and existing.depth > depth:
+            return False
+        if existing is None:
+            self._size += 1
+        self._slots[index] = TTEntry(key, value, best_action, depth)
+        return True
+
+    def clear(self):
+        """Removes every entry and resets the hit counters."""
+        if self._ordered is not None:
+            self._ordered.clear()
+        else:
+            self._slots = [None] * self.capacity
+        self._size = 0
+        self.hits = self.misses = 0
+
+    def __contains__(self, key: int) -> bool:
+        if self._ordered is not None:
+            return key in self._ordered
+        entry = self._slots[key % self.capacity]
+        return entry is not None and entry.key == key
+
+    def __len__(self) -> int:
+        return len(self._ordered) if self._ordered is not None else self._size
+
+    def __repr__(self) -> str:
+        return (f"TranspositionTable(Policy: '{self.policy}', Entries: {len(self)}/{self.capacity}, "
+                f"Hits: {self.hits}, Misses: {self.misses})")
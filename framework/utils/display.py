@@ -1,8 +1,10 @@
 import os
 import shutil
+from typing import Any, Dict
 
 from ..core.game_state import GameState
 from ..core.card import Card # Import Card for type hinting
+from .events import EventType, format_event
 
 def clear_screen():
     """Clears the terminal screen."""
@@ -11,11 +13,32 @@ def clear_screen():
 class Display:
     """
     Handles the visual presentation of the game state to the console.
+
+    A Display is an EventSink subscriber: subscribe handle_event to the
+    engine's events and it renders the board ('pretty') or a turn summary and
+    one line per action ('simple'), and prints every other event's message.
     """
+    def __init__(self, log_level: str = 'pretty'):
+        self.log_level = log_level
+
+    def handle_event(self, event_type: EventType, fields: Dict[str, Any]):
+        if event_type is EventType.TURN_BEGIN:
+            if self.log_level == 'pretty':
+                self.display_board(fields['game_state'])
+            else:
+                self.display_turn_summary(fields['game_state'])
+        elif event_type is EventType.ACTION_APPLIED:
+            if self.log_level == 'pretty':
+                self.display_board(fields['game_state'])
+            else:
+                print(f"  {fields['player']}: {fields['action'].to_repr(fields['game_state'])}")
+        else:
+            print(format_event(event_type, fields))
+
     def _format_board_card(self, card: Card) -> str:
         """Helper to format a card on the board."""
         if card.get_property('type') == 'Follower':
-            return f"[{card.name} ({card.get_property('atk')}/{card.get_property('def')})]"
+            return f"[{card.name} ({card.atk}/{card.defense})]"
         else: # Amulets
             return f"[{card.name}]"
 
@@ -26,7 +49,7 @@ class Display:
         clear_screen()
         
         active_player = game_state.active_player
-        opponent = next(p for p in game_state.players if p is not active_player)
+        opponent = game_state.get_opponent(active_player)
         width = shutil.get_terminal_size((80, 20)).columns
         
         print("=" * width)
@@ -57,7 +80,7 @@ class Display:
             for card in hand_cards:
                 cost, name = card.get_property('cost'), card.name
                 if card.get_property('type') == 'Follower':
-                    atk, defs = card.get_property('atk'), card.get_property('def')
+                    atk, defs = card.atk, card.defense
                     hand_card_strings.append(f"[{cost}PP {name} ({atk}/{defs})]")
                 else:
                     hand_card_strings.append(f"[{cost}PP {name}]")
@@ -72,7 +95,7 @@ class Display:
         Prints a consolidated summary at the start of a turn for the 'simple' log.
         """
         active_player = game_state.active_player
-        opponent = next(p for p in game_state.players if p is not active_player)
+        opponent = game_state.get_opponent(active_player)
 
         print(f"\n--- Turn {game_state.turn_number}: {active_player.name} ---")
         
@@ -93,7 +116,7 @@ class Display:
             for card in hand_cards:
                 cost, name = card.get_property('cost'), card.name
                 if card.get_property('type') == 'Follower':
-                    atk, defs = card.get_property('atk'), card.get_property('def')
+                    atk, defs = card.atk, card.defense
                     hand_card_strings.append(f"[{cost}PP {name} ({atk}/{defs})]")
                 else:
                     hand_card_strings.append(f"[{cost}PP {name}]")
@@ -0,0 +1,101 @@
+from enum import Enum, auto
+from typing import Any, Callable, Dict, List
+
+class EventType(Enum):
+    """Everything the engines report while a game runs."""
+    # Game flow
+    GAME_START = auto()
+    TURN_START = auto()
+    TURN_BEGIN = auto()       # After the turn's draw; fields: game_state
+    ACTION_APPLIED = auto()   # fields: game_state, action
+    GAME_OVER = auto()
+    TURN_LIMIT = auto()
+    GAME_ABORTED = auto()
+    # Players and cards
+    DECK_EMPTY = auto()
+    HAND_FULL = auto()
+    CAN_EVOLVE = auto()
+    CARD_PLAYED = auto()
+    PASS_TURN = auto()
+    DAMAGE = auto()
+    EFFECT_DRAW = auto()
+    CARD_NOT_FOUND = auto()
+    SETUP_COMPLETE = auto()
+    CARDS_LOADED = auto()     # fields: count
+    # Scripting
+    TRIGGER = auto()
+    SCRIPT_DRAW = auto()
+    SCRIPT_ENGINE_READY = auto()
+    SCRIPT_ERROR = auto()
+
+# Console text for each event, filled from the event's fields by format_event().
+MESSAGES: Dict[EventType, str] = {
+    EventType.GAME_START: "Game is starting...",
+    EventType.TURN_START: "Turn {turn}: It is {player}'s turn.",
+    EventType.ACTION_APPLIED: "  {player}: {action}",
+    EventType.GAME_OVER: "==============================\nGAME OVER! The winner is {winner}!",
+    EventType.TURN_LIMIT: "==============================\n"
+                          "Simulation finished after reaching the {max_turns} turn limit. No winner.",
+    EventType.GAME_ABORTED: "\n--- Game aborted by user. Returning to main menu. ---",
+    EventType.DECK_EMPTY: "!!! {player}'s deck is empty. They will lose if the turn ends!",
+    EventType.HAND_FULL: "!!! {player}'s hand is full (limit: {limit})! '{card}' is discarded. !!!",
+    EventType.CAN_EVOLVE: "--- {player} can now evolve! ---",
+    EventType.CARD_PLAYED: "{player} plays {card}.",
+    EventType.PASS_TURN: "{player} passes the turn.",
+    EventType.DAMAGE: "{source} deals {amount} damage to {target}. {target} is at {life} life.",
+    EventType.EFFECT_DRAW: "{source} allows {player} to draw a card.",
+    EventType.CARD_NOT_FOUND: "ERROR: Card with instance ID {instance_id} not found in hand.",
+    EventType.SETUP_COMPLETE: "{engine}: Game setup complete. {details}",
+    EventType.CARDS_LOADED: "Loaded {count} card definitions from the database.",
+    EventType.TRIGGER: "--- TriggerManager: Detected {timing} for {card}. Running effect. ---",
+    EventType.SCRIPT_DRAW: "--- API CALL: {player} draws {count} card(s). ---",
+    EventType.SCRIPT_ENGINE_READY: "Lua Engine Initialized.",
+    EventType.SCRIPT_ERROR: "!!! LUA ERROR in '{script}' -> {function}: {error}",
+}
+
+Subscriber = Callable[[EventType, Dict[str, Any]], None]
+
+
+def format_event(event_type: EventType, fields: Dict[str, Any]) -> str:
+    """Renders an event as its console message."""
+    template = MESSAGES.get(event_type)
+    if template is None:
+        return f"{event_type.name}: {fields}"
+    return template.format(**fields)
+
+
+class EventSink:
+    """
+    Delivers structured events (an EventType plus keyword fields) to subscribers.
+
+    The sink is falsy while nobody is subscribed, so call sites guard with
+    `if events: events.emit(...)` and headless runs skip building the fields,
+    formatting and I/O entirely. Formatting is left to subscribers
+    (see format_event and Display.handle_event).
+    """
+    __slots__ = ('_subscribers',)
+
+    def __init__(self):
+        self._subscribers: List[Subscriber] = []
+
+    def subscribe(self, subscriber: Subscriber):
+        self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber):
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def emit(self, event_type: EventType, **fields):
+        for subscriber in self._subscribers:
+            subscriber(event_type, fields)
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+    def __repr__(self) -> str:
+        return f"EventSink(Subscribers: {len(self._subscribers)})"
+
+
+def print_event(event_type: EventType, fields: Dict[str, Any]):
+    """A subscriber that prints every event's message to stdout."""
+    print(format_event(event_type, fields))
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Iterable, Iterator, Optional
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def write_atomic(path: str, data: bytes) -> bool:
+    """
+    Replaces the file at `path` with `data` in one step, so readers (or
+    other processes writing the same file) never see a partial file.
+    Returns False if the file could not be written.
+    """
+    temporary = None
+    try:
+        fd, temporary = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(path)))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates the file private to its owner.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temporary, 0o666 & ~umask)
+        os.replace(temporary, path)
+    except OSError:
+        if temporary is not None and os.path.exists(temporary):
+            os.remove(temporary)
+        return False
+    return True
+
+
+def file_digest(path: str, digest_size: int = 64) -> str:
+    """The blake2b hex digest of a file's content, read in chunks."""
+    h = hashlib.blake2b(digest_size=digest_size)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def iter_json_array(path: str, fields: Optional[Iterable[str]] = None,
+                    chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Yields the elements of the JSON array in the file at `path` one at a
+    time, reading it in chunks: memory stays bounded by the largest element
+    rather than the file. With `fields`, object elements are cut down to
+    those keys as they are read.
+
+    Raises ValueError if the file is not a well-formed JSON array.
+    """
+    keep = None if fields is None else tuple(fields)
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            """Appends the next chunk, dropping what was consumed. False at the end of the file."""
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            eof = not chunk
+            return not eof
+
+        def skip_whitespace():
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    return
+
+        skip_whitespace()
+        if buffer[pos:pos + 1] != '[':
+            raise ValueError(f"{path} is not a JSON array.")
+        pos += 1
+        skip_whitespace()
+        if buffer[pos:pos + 1] == ']':
+            return
+        while True:
+            # An element is only complete once the separator after it is
+            # buffered: a chunk may end inside it, and one ending in the
+            # middle of a number like 3.5 or 1e-3 decodes a shorter number.
+            try:
+                element, end = _DECODER.raw_decode(buffer, pos)
+                while end < len(buffer) and buffer[end] in _WHITESPACE:
+                    end += 1
+                complete = end < len(buffer) and (eof or buffer[end] in ',]')
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                if not fill():
+                    raise ValueError(f"{path} ends in the middle of its JSON array.")
+                continue
+            if keep is not None and isinstance(element, dict):
+                element = {key: element[key] for key in keep if key in element}
+            yield element
+            pos = end
+            if buffer[pos] == ']':
+                return
+            if buffer[pos] != ',':
+                raise ValueError(f"Expected ',' or ']' at offset {pos} of the buffered text of {path}.")
+            pos += 1
+            skip_whitespace()
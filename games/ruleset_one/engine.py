@@ -4,6 +4,7 @@ from framework.core.player import Player
 from framework.core.game_state import GameState
 from framework.simulation.action import Action
 from framework.simulation.base_game_engine import BaseGameEngine
+from framework.utils.events import EventType
 
 class RuleSetOneEngine(BaseGameEngine):
     """
@@ -24,7 +25,9 @@ class RuleSetOneEngine(BaseGameEngine):
             player.draw_card(game_state)
             player.draw_card(game_state)
             player.draw_card(game_state)
-        print("RuleSetOneEngine: Game setup complete. Players have 10 life and 3 cards.")
+        if self.events:
+            self.events.emit(EventType.SETUP_COMPLETE, engine="RuleSetOneEngine",
+                             details="Players have 10 life and 3 cards.")
 
     def get_possible_actions(self, game_state: GameState) -> List[Action]:
         actions = []
@@ -40,29 +43,36 @@ class RuleSetOneEngine(BaseGameEngine):
 
     def apply_action(self, game_state: GameState, action: Action):
         active_player = game_state.active_player
+        events = self.events
         if action.action_type == "PASS_TURN" or action.action_type == "END_TURN":
-            print(f"{active_player.name} passes the turn.")
+            if events:
+                events.emit(EventType.PASS_TURN, player=active_player.name)
             return
         if action.action_type == "PLAY_CARD":
             card_instance_id = action.details["card_instance_id"]
-            card_to_play = next((c for c in active_player.hand.get_cards() if c.instance_id == card_instance_id), None)
+            card_to_play = game_state.find_card(card_instance_id, active_player.hand)
             if card_to_play:
-                print(f"{active_player.name} plays {card_to_play.name}.")
+                if events:
+                    events.emit(EventType.CARD_PLAYED, player=active_player.name, card=card_to_play.name)
                 active_player.hand.remove(card_to_play)
                 active_player.graveyard.add(card_to_play)
                 if card_to_play.card_id == "ATTACK_BOT":
-                    opponent = next(p for p in game_state.players if p is not active_player)
+                    opponent = game_state.get_opponent(active_player)
                     opponent.life -= 1
-                    print(f"{card_to_play.name} deals 1 damage to {opponent.name}. {opponent.name} is at {opponent.life} life.")
+                    if events:
+                        events.emit(EventType.DAMAGE, source=card_to_play.name, amount=1,
+                                    target=opponent.name, life=opponent.life)
                 elif card_to_play.card_id == "DRAW_BOT":
                     active_player.draw_card(game_state)
-                    print(f"{card_to_play.name} allows {active_player.name} to draw a card.")
+                    if events:
+                        events.emit(EventType.EFFECT_DRAW, source=card_to_play.name, player=active_player.name)
             else:
-                print(f"ERROR: Card with instance ID {card_instance_id} not found in hand.")
+                if events:
+                    events.emit(EventType.CARD_NOT_FOUND, instance_id=card_instance_id)
 
     def check_win_condition(self, game_state: GameState) -> Optional[Player]:
         for player in game_state.players:
-            opponent = next(p for p in game_state.players if p is not player)
+            opponent = game_state.get_opponent(player)
             if opponent.life <= 0:
                 return player
         return None
\ No newline at end of file
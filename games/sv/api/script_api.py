@@ -1,5 +1,8 @@
 # --- IMPORTS CORRECTED HERE ---
+from framework.core.card import Card
 from framework.core.player import Player
+from framework.utils.events import EventType
+from ..modules import effects
 
 # Forward reference to avoid circular import with SvEngine
 from typing import TYPE_CHECKING
@@ -26,6 +29,35 @@ class ScriptAPI:
             player (Player): The Player object who should draw.
             count (int): The number of cards to draw.
         """
-        print(f"--- API CALL: {player.name} draws {count} card(s). ---")
+        if self.engine.events:
+            self.engine.events.emit(EventType.SCRIPT_DRAW, player=player.name, count=count)
         for _ in range(count):
-            player.draw_card(self.engine.game_state)
\ No newline at end of file
+            player.draw_card(self.engine.game_state)
+
+    def random_int(self, low: int, high: int) -> int:
+        """
+        Returns a random integer N such that low <= N <= high, for random card effects.
+        Draws from the game's effect stream so seeded games replay exactly.
+        """
+        return self.engine.game_state.rng.effect.randint(low, high)
+
+    # --- Effect primitives ---
+    # The same code the native effect library runs, for bespoke Lua scripts.
+
+    def deal_damage(self, target, amount: int):
+        """Deals damage to a follower (Card) or a leader (Player)."""
+        effects.damage(self.engine.game_state, [target], amount)
+
+    def restore_defense(self, player: Player, amount: int):
+        """Restores a leader's defense, up to the maximum."""
+        effects.heal(self.engine.game_state, player, amount)
+
+    def summon_token(self, player: Player, name: str, atk: int, defense: int) -> Card:
+        """Summons a vanilla follower for `player`; returns None if the board is full."""
+        return effects.summon_token(self.engine.game_state, player, name, atk, defense)
+
+    def buff(self, card: Card, atk: int, defense: int):
+        effects.buff(self.engine.game_state, [card], atk, defense)
+
+    def destroy(self, card: Card):
+        effects.destroy(self.engine.game_state, card)
@@ -0,0 +1,200 @@
+import operator
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+from framework.core.card import Card
+from .skill_ast import parse_skill
+
+# --- Selector vocabulary ---
+# Selectors use the skill DSL's internal names; these map them to the
+# engine's card properties.
+CLANS = {'all': 'Neutral', 'elf': 'Forestcraft', 'royal': 'Swordcraft', 'witch': 'Runecraft',
+         'dragon': 'Dragoncraft', 'necro': 'Shadowcraft', 'vampire': 'Bloodcraft',
+         'bishop': 'Havencraft', 'nemesis': 'Portalcraft'}
+TRIBES = {'legion': 'Officer', 'lord': 'Commander', 'machine': 'Machina', 'nature': 'Natura',
+          'school': 'Academic', 'manaria': 'Mysteria', 'hellbound': 'Condemned', 'banquet': 'Festive',
+          'artifact': 'Artifact', 'armed': 'Armed', 'white_ritual': 'Earth Sigil', 'levin': 'Levin',
+          'chess': 'Chess', 'looting': 'Loot', 'hero': 'Heroic'}
+# A card with this trait counts as every trait.
+ALL_TRAITS = 'All'
+# card_type=... -> the card types it selects (None for every card).
+CARD_TYPES = {'all': None, 'unit': ('Follower',), 'spell': ('Spell',), 'field': ('Amulet',),
+              'spell_and_field': ('Spell', 'Amulet')}
+# Raw char_type of countdown amulets, selected by card_type=chant_field.
+CHANT_FIELD = 3
+
+COMPARISONS = {
+    '=': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+}
+
+# The card properties CardIndex indexes. A list property (traits) is
+# indexed under each of its entries.
+INDEXED = ('class', 'type', 'char_type', 'cost', 'traits', 'rarity', 'card_set_id')
+# Numeric properties, the only ones that take <, <=, > and >=.
+_NUMERIC = frozenset({'cost', 'char_type', 'card_set_id'})
+
+
+def _mask(ordinals: List[int]) -> int:
+    bits = bytearray((max(ordinals) >> 3) + 1)
+    for ordinal in ordinals:
+        bits[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(bits, 'little')
+
+
+class CardIndex:
+    """
+    Secondary indexes over a card pool: for each property in INDEXED, the
+    set of cards with each value, as a bitset (an int whose bit i is the
+    i-th card of `card_ids`). Queries compile selectors such as
+    "card_type=unit&tribe=machine&base_cost<=3" into intersections and
+    unions of those bitsets.
+    """
+    def __init__(self, card_ids: Sequence[str], masks: Dict[str, Dict[Any, int]]):
+        self.card_ids = list(card_ids)
+        self.ordinals = {card_id: ordinal for ordinal, card_id in enumerate(self.card_ids)}
+        self.masks = masks
+        self.all = (1 << len(self.card_ids)) - 1
+        # selector string -> compiled query
+        self._queries: Dict[str, CardQuery] = {}
+
+    @classmethod
+    def build(cls, cards: Mapping[str, Dict[str, Any]]) -> 'CardIndex':
+        """Indexes a {card_id: properties} mapping, in its order."""
+        ordinals: Dict[str, Dict[Any, List[int]]] = {field: defaultdict(list) for field in INDEXED}
+        for ordinal, data in enumerate(cards.values()):
+            for field in INDEXED:
+                value = data.get(field)
+                for entry in (value if isinstance(value, list) else [value]):
+                    if entry is not None:
+                        ordinals[field][entry].append(ordinal)
+        masks = {field: {value: _mask(found) for value, found in values.items()}
+                 for field, values in ordinals.items()}
+        return cls(list(cards), masks)
+
+    def record(self) -> Tuple[List[str], Dict[str, Dict[Any, int]]]:
+        """The index as plain data, for CardIndex(*record) (see snapshot.py)."""
+        return self.card_ids, self.masks
+
+    def query(self, selector) -> 'CardQuery':
+        """
+        Compiles a selector string, or its parse_skill() tree, into a query.
+        Clauses are joined with '&' and '|'. Raises ValueError for keys or
+        values the index cannot answer.
+        """
+        if not isinstance(selector, str):
+            return CardQuery(self, self._evaluate(selector))
+        query = self._queries.get(selector)
+        if query is None:
+            query = self._queries[selector] = CardQuery(self, self._evaluate(parse_skill(selector)))
+        return query
+
+    def select(self, key: str, op: str, value) -> int:
+        """The bitset of one selector clause, e.g. ('tribe', '=', 'machine')."""
+        if op not in COMPARISONS:
+            raise ValueError(f"Unknown comparison '{op}'")
+        if key == 'card_type':
+            if value == 'chant_field':
+                return self._where('char_type', op, CHANT_FIELD)
+            if value not in CARD_TYPES:
+                raise ValueError(f"Unknown card_type '{value}'")
+            types = CARD_TYPES[value]
+            mask = self.all if types is None else self._any('type', types)
+        elif key == 'tribe':
+            if value == 'any_tribe':
+                mask = self._any('traits', self.masks['traits'])
+            elif value in TRIBES:
+                mask = self._any('traits', (TRIBES[value], ALL_TRAITS))
+            else:
+                raise ValueError(f"Unknown tribe '{value}'")
+        elif key == 'clan':
+            if value not in CLANS:
+                raise ValueError(f"Unknown clan '{value}'")
+            mask = self._any('class', (CLANS[value],))
+        elif key in ('cost', 'base_cost', 'char_type', 'card_set_id'):
+            return self._where('cost' if key == 'base_cost' else key, op, int(value))
+        elif key == 'rarity':
+            mask = self._any('rarity', (value,))
+        else:
+            raise ValueError(f"Cannot select cards by '{key}'")
+        if op == '=':
+            return mask
+        if op == '!=':
+            return self.all & ~mask
+        raise ValueError(f"{key} only takes = and !=")
+
+    def _any(self, field: str, values: Iterable) -> int:
+        masks = self.masks[field]
+        mask = 0
+        for value in values:
+            mask |= masks.get(value, 0)
+        return mask
+
+    def _where(self, field: str, op: str, value) -> int:
+        """Every card whose `field` compares true against `value`."""
+        if op not in ('=', '!=') and field not in _NUMERIC:
+            raise ValueError(f"{field} only takes = and !=")
+        compare = COMPARISONS[op]
+        mask = 0
+        for entry, entry_mask in self.masks[field].items():
+            if compare(entry, value):
+                mask |= entry_mask
+        return mask
+
+    def _evaluate(self, node) -> int:
+        if node is None or node == 'none':
+            return self.all
+        if isinstance(node, list) and len(node) == 1:
+            # A whole field parses to its list of one effect.
+            return self._evaluate(node[0])
+        if isinstance(node, list) and isinstance(node[0], str):
+            if node[0] == '&' and len(node) == 3:
+                return self._evaluate(node[1]) & self._evaluate(node[2])
+            if node[0] == '|' and len(node) == 3:
+                return self._evaluate(node[1]) | self._evaluate(node[2])
+            if node[0] == '(' and len(node) == 2:
+                return self._evaluate(node[1])
+            if node[0] in COMPARISONS and len(node) == 3 and isinstance(node[1], str) \
+                    and isinstance(node[2], str):
+                return self.select(node[1], node[0], node[2])
+        raise ValueError(f"Unsupported selector {node!r}")
+
+
+class CardQuery:
+    """The cards a selector matches, as a bitset over a CardIndex."""
+    __slots__ = ('index', 'mask')
+
+    def __init__(self, index: CardIndex, mask: int):
+        self.index = index
+        self.mask = mask
+
+    def __contains__(self, card_id: str) -> bool:
+        ordinal = self.index.ordinals.get(card_id)
+        return ordinal is not None and (self.mask >> ordinal) & 1 == 1
+
+    def __and__(self, other: 'CardQuery') -> 'CardQuery':
+        return CardQuery(self.index, self.mask & other.mask)
+
+    def __or__(self, other: 'CardQuery') -> 'CardQuery':
+        return CardQuery(self.index, self.mask | other.mask)
+
+    def __len__(self) -> int:
+        return bin(self.mask).count('1')
+
+    def __iter__(self) -> Iterator[str]:
+        """The matching card ids, in index order."""
+        mask, card_ids = self.mask, self.index.card_ids
+        while mask:
+            low = mask & -mask
+            yield card_ids[low.bit_length() - 1]
+            mask ^= low
+
+    def filter(self, cards: Iterable[Card]) -> List[Card]:
+        """The cards (e.g. of a zone) whose definition matches; cards outside the index never do."""
+        mask, ordinals = self.mask, self.index.ordinals
+        found = []
+        for card in cards:
+            ordinal = ordinals.get(card.card_id)
+            if ordinal is not None and (mask >> ordinal) & 1:
+                found.append(card)
+        return found
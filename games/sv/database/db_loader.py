@@ -1,24 +1,161 @@
+import hashlib
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Union
+
+from framework.core.card_definition import CardDefinition
+from framework.utils.events import EventSink, EventType
+from framework.utils.files import file_digest
+from ..modules.keywords import parse_keywords
+from ..modules.skill_compiler import SkillCompiler
+from .card_index import CardIndex, CardQuery
+from .importer import DB_DIR, RAW_DATABASES, import_pool, is_raw_database, pool_aliases
+from .skill_ast import SkillTrees
+from .snapshot import CardSnapshot, snapshot_path, write_snapshot
+
+# Parsed skill DSL trees, keyed by a hash of each string (see SkillTrees).
+SKILL_TREE_CACHE = os.path.join(DB_DIR, 'skill_trees.cache')
+
+
+def _paths(db_path: Union[str, Sequence[str]]) -> List[str]:
+    return [db_path] if isinstance(db_path, str) else list(db_path)
+
+
+def _load_db(db_path: str) -> Dict[str, Any]:
+    """Loads an engine-format card file."""
+    with open(db_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_sources(paths: Sequence[str], trees: SkillTrees) -> Dict[str, Any]:
+    """
+    Loads the card files, parsing their DSL fields into `trees`. Raw class
+    databases are imported into one deduplicated pool (see import_pool),
+    and engine-format files are merged over it.
+    """
+    for path in paths:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Card database not found at: {path}")
+    raw = [path for path in paths if is_raw_database(path)]
+    cards = import_pool(raw) if raw else {}
+    for path in paths:
+        if path not in raw:
+            cards.update(_load_db(path))
+    if trees.parse_cards(cards.values()):
+        trees.save()
+    return cards
+
+
+def build_snapshot(db_path: Union[str, Sequence[str]], skill_cache: Optional[str] = SKILL_TREE_CACHE) -> str:
+    """
+    Compiles card files into the binary snapshot CardDatabase loads them
+    from, whether or not it is up to date. Returns the snapshot's path.
+    """
+    paths = _paths(db_path)
+    trees = SkillTrees(skill_cache)
+    path = snapshot_path(paths)
+    cards = _load_sources(paths, trees)
+    if not write_snapshot(path, paths, cards, trees, CardIndex.build(cards), pool_aliases(cards)):
+        raise OSError(f"Could not write the card snapshot to: {path}")
+    return path
+
 
 class CardDatabase:
     """
     Loads and provides access to card data from the JSON database.
+
+    `db_path` is a card file or a list of them, either in the engine's own
+    format (test_cards.json) or raw class databases (sword.json...). With
+    `snapshot`, the cards are read from a binary snapshot of those files
+    (see snapshot.py), built on the first load and rebuilt whenever one of
+    them changes; cards are then decoded on first use. Parsed DSL trees are
+    cached in `skill_cache` (None to always parse) when the JSON is read.
+
+    Alternate printings of a raw card are folded into one card on import;
+    `aliases` maps their IDs to it, and lookups accept either.
+
+    `index` answers selector queries over the cards (see CardIndex), e.g.
+    db.query("card_type=unit&tribe=machine"). The skills of raw cards are
+    compiled into native effects on a card's first use; engines pick them
+    up through `skills` (see SvEngine's card_db).
+
+    Loading is reported as a CARDS_LOADED event to `events`, if given.
     """
-    def __init__(self, db_path: str):
-        self.cards: Dict[str, Any] = self._load_db(db_path)
-        print(f"Loaded {len(self.cards)} card definitions from the database.")
+    def __init__(self, db_path: Union[str, Sequence[str]], skill_cache: Optional[str] = SKILL_TREE_CACHE,
+                 snapshot: bool = True, events: Optional[EventSink] = None):
+        paths = _paths(db_path)
+        self.sources = paths
+        self._fingerprint: Optional[str] = None
+        self.skill_trees = SkillTrees()
+        self.snapshot_path = snapshot_path(paths) if snapshot else None
+        cards: Optional[Mapping[str, Any]] = None
+        if self.snapshot_path is not None:
+            cards = CardSnapshot.open(self.snapshot_path, paths, self.skill_trees)
+        if cards is not None:
+            self.index = cards.card_index()
+            self.aliases: Dict[str, str] = cards.aliases
+        else:
+            self.skill_trees = SkillTrees(skill_cache)
+            cards = _load_sources(paths, self.skill_trees)
+            self.index = CardIndex.build(cards)
+            self.aliases = pool_aliases(cards)
+            if self.snapshot_path is not None:
+                write_snapshot(self.snapshot_path, paths, cards, self.skill_trees, self.index, self.aliases)
+        self.cards: Mapping[str, Any] = cards
+        # Shared, immutable definitions, built on first use and reused by every game.
+        self.definitions: Dict[str, CardDefinition] = {}
+        self.skills = SkillCompiler(self.get_definition, self.skill_trees.parse, self.index)
+        if events:
+            events.emit(EventType.CARDS_LOADED, count=len(self.cards))
+
+    def compile_skills(self) -> int:
+        """
+        Compiles the skills of every card up front instead of on each card's
+        first use. Returns how many cards got at least one effect.
+        """
+        compiled = 0
+        for card_id, data in self.cards.items():
+            if data.get('skill') and self.skills.compile(self.get_definition(card_id)):
+                compiled += 1
+        return compiled
 
-    def _load_db(self, db_path: str) -> Dict[str, Any]:
-        """Loads the JSON file from the given path."""
-        if not os.path.exists(db_path):
-            raise FileNotFoundError(f"Card database not found at: {db_path}")
-        with open(db_path, 'r') as f:
-            return json.load(f)
+    def fingerprint(self) -> str:
+        """
+        A digest of the card files' content, for caches of anything derived
+        from the cards (see DeckLoader): it changes whenever one of them does.
+        """
+        if self._fingerprint is None:
+            if isinstance(self.cards, CardSnapshot):
+                digests = [stamp[3] for stamp in self.cards.sources]
+            else:
+                digests = [file_digest(path) for path in self.sources]
+            self._fingerprint = hashlib.blake2b('\n'.join(digests).encode('ascii'), digest_size=16).hexdigest()
+        return self._fingerprint
+
+    def query(self, selector) -> CardQuery:
+        """The cards matching a selector string such as "clan=elf&base_cost<=2"; see CardIndex.query."""
+        return self.index.query(selector)
 
     def get_card_data(self, card_id: str) -> Dict[str, Any]:
-        """Retrieves the data for a single card by its ID."""
+        """Retrieves the data for a single card by its ID, or that of a printing folded into it."""
+        card_id = self.aliases.get(card_id, card_id)
         if card_id not in self.cards:
             raise KeyError(f"Card ID '{card_id}' not found in the database.")
-        return self.cards[card_id]
\ No newline at end of file
+        return self.cards[card_id]
+
+    def get_definition(self, card_id: str) -> CardDefinition:
+        """
+        Returns the shared CardDefinition for a card ID, creating it once.
+        An alias gets the definition of the card it was folded into.
+        """
+        definition = self.definitions.get(card_id)
+        if definition is None:
+            canonical = self.aliases.get(card_id, card_id)
+            definition = self.definitions.get(canonical)
+            if definition is None:
+                data = self.get_card_data(canonical)
+                definition = CardDefinition(canonical, data.get('name', canonical), data,
+                                            parse_keywords(data.get('effect_text', '')))
+                self.definitions[canonical] = definition
+            self.definitions[card_id] = definition
+        return definition
@@ -2,6 +2,8 @@ import json
 import argparse
 import sys
 
+from framework.utils.files import iter_json_array
+
 def check_subset(superset_file: str, subset_file: str):
     """
     Checks if the card IDs from one JSON file are a subset of another.
@@ -11,22 +13,18 @@ def check_subset(superset_file: str, subset_file: str):
         subset_file (str): The path to the JSON file that should be a subset (the smaller list).
     """
     try:
-        # Load the superset file and extract card IDs into a set for fast lookups
-        with open(superset_file, 'r', encoding='utf-8') as f:
-            superset_data = json.load(f)
-        superset_ids = {str(item['card_id']) for item in superset_data}
+        # Stream the superset file and extract card IDs into a set for fast lookups
+        superset_ids = {str(item['card_id']) for item in iter_json_array(superset_file, ('card_id',))}
         print(f"Loaded {len(superset_ids)} unique card IDs from '{superset_file}'.")
 
-        # Load the subset file and extract card IDs
-        with open(subset_file, 'r', encoding='utf-8') as f:
-            subset_data = json.load(f)
-        subset_ids = {str(item['card_id']) for item in subset_data}
+        # Stream the subset file and extract card IDs
+        subset_ids = {str(item['card_id']) for item in iter_json_array(subset_file, ('card_id',))}
         print(f"Loaded {len(subset_ids)} unique card IDs from '{subset_file}'.")
 
     except FileNotFoundError as e:
         print(f"Error: File not found. Please check your file paths. Details: {e}")
         sys.exit(1)
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
+    except (ValueError, KeyError, TypeError) as e:
         print(f"Error: Could not process JSON file. Make sure it's a valid array of objects with a 'card_id' attribute. Details: {e}")
         sys.exit(1)
 
@@ -0,0 +1,191 @@
+import argparse
+import importlib
+import os
+import pickle
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from framework.utils.files import file_digest, iter_json_array, write_atomic
+from ..importer import DB_DIR, RAW_DATABASES
+
+# --- Corpus analyses ---
+# The helper scripts are analyses over the raw class databases. Any set of
+# them runs in one pass over each class file, optionally one file per
+# worker process, and the partial result of every file is cached under a
+# hash of its content. Run from the repository root, e.g.
+#   python -m games.sv.database.helper_script.corpus count_cards find_dup_cards --workers 4
+CACHE_DIR = os.path.join(DB_DIR, 'analysis_cache')
+
+# The modules of this package that define an analysis, as ANALYSIS; each
+# is run by its module name.
+PLUGINS = ('count_cards', 'keyword_analysis', 'chars_analysis', 'skill_parser', 'skill_tokenizer',
+           'find_dup_cards')
+
+
+class Analysis:
+    """
+    One analysis over the card corpus. add() folds a raw card record into
+    the partial result new() started; the partial results of the class
+    files are then combined with merge() and printed by report().
+
+    Results are cached and sent between processes, so they must pickle.
+    Bump `version` whenever the results change shape or meaning, and
+    include any option that changes them in key(). `fields` lists the
+    card fields add() reads (None for all); the others are dropped as the
+    records are read.
+    """
+    name = ''
+    version = 1
+    fields: Optional[Tuple[str, ...]] = None
+
+    def key(self) -> str:
+        """Identifies this analysis' results in the cache."""
+        return f"{self.name}-{self.version}"
+
+    def new(self) -> Any:
+        return Counter()
+
+    def add(self, result: Any, card: Dict[str, Any]):
+        raise NotImplementedError
+
+    def merge(self, result: Any, other: Any) -> Any:
+        return merge_results(result, other)
+
+    def report(self, result: Any):
+        raise NotImplementedError
+
+
+def merge_results(result: Any, other: Any) -> Any:
+    """Combines two partial results: counts add up, lists extend, sets unite and dicts merge key by key."""
+    if isinstance(result, Counter):
+        result.update(other)
+        return result
+    if isinstance(result, dict):
+        for key, value in other.items():
+            result[key] = merge_results(result[key], value) if key in result else value
+        return result
+    if isinstance(result, list):
+        return result + other
+    if isinstance(result, set):
+        return result | other
+    return result + other
+
+
+def iter_cards(path: str, fields: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """The raw card records of one class database, read one at a time, optionally cut down to `fields`."""
+    return iter_json_array(path, fields)
+
+
+def _fields(analyses: Sequence[Analysis]) -> Optional[List[str]]:
+    """Every field the analyses read, or None if one of them reads all of them."""
+    fields: Dict[str, None] = {}
+    for analysis in analyses:
+        if analysis.fields is None:
+            return None
+        fields.update(dict.fromkeys(analysis.fields))
+    return list(fields)
+
+
+def _scan(path: str, analyses: Sequence[Analysis]) -> Dict[str, Any]:
+    """Runs every analysis over one class file in a single pass: {key: partial result}."""
+    results = [analysis.new() for analysis in analyses]
+    for card in iter_cards(path, _fields(analyses)):
+        for analysis, result in zip(analyses, results):
+            analysis.add(result, card)
+    return {analysis.key(): result for analysis, result in zip(analyses, results)}
+
+
+class _FileCache:
+    """The cached partial results of one class file, valid while its content is unchanged."""
+    def __init__(self, cache_dir: Optional[str], path: str):
+        self.prefix = os.path.splitext(os.path.basename(path))[0] + '-'
+        self.cache_dir = cache_dir
+        self.path = None
+        self.results: Dict[str, Any] = {}
+        if cache_dir is None:
+            return
+        self.path = os.path.join(cache_dir, f"{self.prefix}{file_digest(path, 16)}.pickle")
+        try:
+            with open(self.path, 'rb') as f:
+                self.results = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Missing or unreadable: recomputed.
+            pass
+
+    def save(self):
+        """Writes the results and drops those of the file's older contents. Failures are ignored."""
+        if self.path is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if write_atomic(self.path, pickle.dumps(self.results, protocol=pickle.HIGHEST_PROTOCOL)):
+            for name in os.listdir(self.cache_dir):
+                stale = os.path.join(self.cache_dir, name)
+                if name.startswith(self.prefix) and name.endswith('.pickle') and stale != self.path:
+                    os.remove(stale)
+
+
+def run(analyses: Sequence[Analysis], paths: Sequence[str] = RAW_DATABASES, workers: int = 1,
+        cache_dir: Optional[str] = CACHE_DIR) -> Dict[str, Any]:
+    """
+    Runs the analyses over the class files and returns {name: result}.
+    Only the analyses a file has no cached result for are run over it, all
+    in one pass; with `workers` > 1 the files are scanned in parallel.
+    """
+    caches = [_FileCache(cache_dir, path) for path in paths]
+    pending = []
+    for path, cache in zip(paths, caches):
+        missing = [analysis for analysis in analyses if analysis.key() not in cache.results]
+        if missing:
+            pending.append((path, cache, missing))
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            scanned = list(pool.map(_scan, [task[0] for task in pending], [task[2] for task in pending]))
+    else:
+        scanned = [_scan(path, missing) for path, _, missing in pending]
+    for (_, cache, _), results in zip(pending, scanned):
+        cache.results.update(results)
+        cache.save()
+
+    merged = {}
+    for analysis in analyses:
+        result = analysis.new()
+        for cache in caches:
+            result = analysis.merge(result, cache.results[analysis.key()])
+        merged[analysis.name] = result
+    return merged
+
+
+def run_and_report(analyses: Sequence[Analysis], **options):
+    """run() the analyses and print each one's report."""
+    results = run(analyses, **options)
+    for analysis in analyses:
+        analysis.report(results[analysis.name])
+
+
+def load_plugin(name: str) -> Analysis:
+    """The analysis of the PLUGINS module `name`."""
+    if name not in PLUGINS:
+        raise ValueError(f"Unknown analysis '{name}'. Choose from: {', '.join(PLUGINS)}")
+    return importlib.import_module(f"{__package__}.{name}").ANALYSIS()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run analyses over the raw class databases in one pass.")
+    parser.add_argument('analyses', nargs='*', default=list(PLUGINS), metavar='ANALYSIS',
+                        help=f"Analyses to run (default: all). Available: {', '.join(PLUGINS)}")
+    parser.add_argument('--db', nargs='+', default=list(RAW_DATABASES), metavar='FILE',
+                        help="Raw class database files (default: every class).")
+    parser.add_argument('--workers', type=int, default=1, help="Scan up to this many files in parallel.")
+    parser.add_argument('--no-cache', action='store_true', help="Ignore and do not write cached results.")
+    args = parser.parse_args(argv)
+    try:
+        analyses = [load_plugin(name) for name in args.analyses]
+        run_and_report(analyses, paths=args.db, workers=args.workers,
+                       cache_dir=None if args.no_cache else CACHE_DIR)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ import json
 import os
 import sys
 
+from framework.utils.files import iter_json_array
+
 def extract_neutral_cards():
     """
     Extracts neutral cards by finding the difference between a master
@@ -25,11 +27,9 @@ def extract_neutral_cards():
     for filename in class_filenames:
         filepath = os.path.join(db_path, filename)
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for card in data:
-                    if 'card_id' in card:
-                        class_card_ids.add(str(card['card_id']))
+            for card in iter_json_array(filepath, ('card_id',)):
+                if 'card_id' in card:
+                    class_card_ids.add(str(card['card_id']))
         except FileNotFoundError:
             print(f"Warning: Class file not found, skipping: {filename}")
             continue
@@ -41,10 +41,7 @@ def extract_neutral_cards():
     neutral_cards = []
     
     try:
-        with open(master_filepath, 'r', encoding='utf-8') as f:
-            master_data = json.load(f)
-        
-        for card in master_data:
+        for card in iter_json_array(master_filepath):
             if str(card.get('card_id')) not in class_card_ids:
                 neutral_cards.append(card)
                 
@@ -1,71 +1,65 @@
-import json
-import os
 import sys
-from collections import defaultdict
 
-def verify_base_card_ids():
+from .corpus import Analysis, main
+
+
+class SharedBaseIds(Analysis):
     """
-    Analyzes the slim database to find cards sharing a base_card_id and
-    verifies their card_name for consistency.
+    Finds cards sharing a base_card_id and verifies their card_name for
+    consistency. Printings of a card can sit in different class files, so
+    the groups are only complete once every file's result is merged.
     """
-    db_path = "games/sv/database"
-    slim_filename = "all_sv_cards_slim.json"
-    filepath = os.path.join(db_path, slim_filename)
+    name = 'find_dup_cards'
+    fields = ('card_id', 'card_name', 'base_card_id')
 
-    print(f"--- Verifying Base Card IDs in '{slim_filename}' ---")
+    def new(self):
+        # base_card_id -> [(card_id, card_name)]
+        return {}
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            all_cards_data = json.load(f)
-    except FileNotFoundError:
-        print(f"FATAL ERROR: Slim database '{slim_filename}' not found at '{filepath}'.")
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"FATAL ERROR: Could not parse JSON file. Details: {e}")
-        sys.exit(1)
-
-    # Group cards by their base_card_id
-    base_id_groups = defaultdict(list)
-    for card in all_cards_data:
+    def add(self, result, card):
         base_id = card.get('base_card_id')
         if base_id:
-            base_id_groups[str(base_id)].append(card)
+            result.setdefault(str(base_id), []).append((str(card.get('card_id')), card.get('card_name')))
 
-    print(f"Found {len(base_id_groups)} unique base_card_ids.")
-    print("\n--- Analysis Report ---")
+    def report(self, result):
+        print("--- Verifying Base Card IDs ---")
+        print(f"Found {len(result)} unique base_card_ids.")
+        print("\n--- Analysis Report ---")
 
-    shared_base_id_count = 0
-    name_mismatches = 0
+        shared_base_id_count = 0
+        name_mismatches = 0
 
-    # Analyze the groups
-    for base_id, cards in base_id_groups.items():
-        if len(cards) > 1:
+        # Analyze the groups
+        for base_id, cards in result.items():
+            if len(cards) < 2:
+                continue
             shared_base_id_count += 1
-            
+
             # Check for name consistency within the group
-            first_card_name = cards[0].get('card_name')
-            all_names_match = all(c.get('card_name') == first_card_name for c in cards)
-            
-            card_ids = [str(c.get('card_id')) for c in cards]
+            first_card_name = cards[0][1]
+            card_ids = [card_id for card_id, _ in cards]
 
-            if all_names_match:
+            if all(name == first_card_name for _, name in cards):
                 print(f"\n✅ Base ID {base_id} is shared by {len(cards)} cards. All have the name '{first_card_name}'.")
                 print(f"   - Card IDs: {', '.join(card_ids)}")
             else:
                 name_mismatches += 1
                 print(f"\n❌ Base ID {base_id} is shared by {len(cards)} cards, but their names DO NOT match.")
-                for c in cards:
-                    print(f"   - Card ID: {c.get('card_id')}, Name: '{c.get('card_name')}'")
+                for card_id, name in cards:
+                    print(f"   - Card ID: {card_id}, Name: '{name}'")
 
-    print("\n--- Summary ---")
-    if shared_base_id_count == 0:
-        print("No cards were found that share a base_card_id.")
-    else:
-        print(f"Found {shared_base_id_count} base_card_ids that are shared by multiple cards.")
-        if name_mismatches == 0:
-            print("✅ All shared groups have consistent card names.")
+        print("\n--- Summary ---")
+        if shared_base_id_count == 0:
+            print("No cards were found that share a base_card_id.")
         else:
-            print(f"❌ Found {name_mismatches} groups with inconsistent card names.")
+            print(f"Found {shared_base_id_count} base_card_ids that are shared by multiple cards.")
+            if name_mismatches == 0:
+                print("✅ All shared groups have consistent card names.")
+            else:
+                print(f"❌ Found {name_mismatches} groups with inconsistent card names.")
+
+
+ANALYSIS = SharedBaseIds
 
 if __name__ == "__main__":
-    verify_base_card_ids()
\ No newline at end of file
+    main([SharedBaseIds.name] + sys.argv[1:])
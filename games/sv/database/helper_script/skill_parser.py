@@ -1,10 +1,10 @@
 # filename: parse_skill_field_tokens_v4.py
-import json
-import os
 import sys
 import re
 from collections import Counter
 
+from .corpus import Analysis, main
+
 # --- Configuration ---
 # Change this to analyze 'skill', 'skill_target', 'skill_option', 'skill_preprocess'
 FIELD_TO_ANALYZE = "skill_condition"
@@ -90,82 +90,77 @@ def parse_field_hierarchically(raw_field_string):
     return all_leaf_tokens
 
 
-def analyze_field_tokens():
+class FieldTokens(Analysis):
     """
-    Main function to load data, parse the specified skill field for all cards,
-    and report statistics on the non-numeric leaf tokens found, including
-    tokens extracted from within {...} blocks.
+    Parses the configured skill field of every card and reports statistics
+    on the non-numeric leaf tokens found, including tokens extracted from
+    within {...} blocks.
     """
-    db_path = "games/sv/database"
-    slim_filename = "all_sv_cards_slim.json" # Make sure this file exists
-    filepath = os.path.join(db_path, slim_filename)
+    name = 'skill_parser'
 
-    print(f"--- Analyzing Non-Numeric Leaf Tokens in '{FIELD_TO_ANALYZE}' Field of '{filepath}' ---")
+    def __init__(self, field: str = FIELD_TO_ANALYZE):
+        self.field = field
+        self.fields = ('card_id', field)
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            all_cards_data = json.load(f)
-        print(f"Successfully loaded {len(all_cards_data)} cards.")
-    except Exception as e:
-        print(f"FATAL ERROR loading/parsing JSON: {e}")
-        sys.exit(1)
+    def key(self) -> str:
+        return f"{super().key()}-{self.field}"
 
-    all_tokens_counter = Counter() # To count all leaf tokens initially
-    cards_processed = 0
-    cards_failed = 0
+    def new(self):
+        # To count all leaf tokens initially
+        return {'tokens': Counter(), 'processed': 0, 'errors': []}
 
-    for card in all_cards_data:
+    def add(self, result, card):
         card_id = card.get('card_id', 'UnknownID')
-        field_string = card.get(FIELD_TO_ANALYZE)
+        field_string = card.get(self.field)
 
         try:
-            # Process cards with valid string fields
+            # Process cards with valid string fields; count cards even if the field is empty/None/not string
             if isinstance(field_string, str) and field_string.strip():
-                 leaf_tokens = parse_field_hierarchically(field_string)
-                 all_tokens_counter.update(leaf_tokens)
-                 cards_processed += 1
+                result['tokens'].update(parse_field_hierarchically(field_string))
+            result['processed'] += 1
+        except Exception as e:
+            result['errors'].append(f"  > ERROR: Failed parsing '{self.field}' for card_id {card_id}. "
+                                    f"Value: '{field_string}'. Error: {e}")
+
+    def report(self, result):
+        print(f"--- Analyzing Non-Numeric Leaf Tokens in '{self.field}' Field ---")
+        for error in result['errors']:
+            print(error)
+
+        print(f"\n--- Parsing Summary ---")
+        print(f"Successfully processed '{self.field}' for {result['processed']} cards.")
+        if result['errors']:
+            print(f"Failed during parsing for {len(result['errors'])} cards.")
+
+        # --- Filter out numeric tokens and create the final counter ---
+        final_tokens_counter = Counter()
+        numeric_token_count = 0
+        total_tokens_counted = 0
+        for token, count in result['tokens'].items():
+            total_tokens_counted += count
+            if not is_numeric(token):
+                final_tokens_counter[token] = count
             else:
-                 # Count cards even if the field is empty/None/not string
-                 cards_processed += 1
+                numeric_token_count += 1
 
-        except Exception as e:
-            print(f"  > ERROR: Failed parsing '{FIELD_TO_ANALYZE}' for card_id {card_id}. Value: '{field_string}'. Error: {e}")
-            cards_failed += 1
-
-    print(f"\n--- Parsing Summary ---")
-    print(f"Successfully processed '{FIELD_TO_ANALYZE}' for {cards_processed} cards.")
-    if cards_failed > 0:
-        print(f"Failed during parsing for {cards_failed} cards.")
-
-    # --- Filter out numeric tokens and create the final counter ---
-    final_tokens_counter = Counter()
-    numeric_token_count = 0
-    total_tokens_counted = 0
-    for token, count in all_tokens_counter.items():
-        total_tokens_counted += count
-        if not is_numeric(token):
-            final_tokens_counter[token] = count
+        # --- Print Filtered Token Statistics ---
+        print("\n--- Unique Non-Numeric Leaf Token Statistics (Sorted by Frequency) ---")
+        if not final_tokens_counter:
+            print("No non-numeric leaf tokens found.")
         else:
-            numeric_token_count += 1
+            for token, count in final_tokens_counter.most_common():
+                print(f"  Token: '{token}' | Count: {count}")
 
-    # --- Print Filtered Token Statistics ---
-    print("\n--- Unique Non-Numeric Leaf Token Statistics (Sorted by Frequency) ---")
-    if not final_tokens_counter:
-        print("No non-numeric leaf tokens found.")
-    else:
-        for token, count in final_tokens_counter.most_common():
-            print(f"  Token: '{token}' | Count: {count}")
+        print(f"\nFound {len(final_tokens_counter)} unique non-numeric leaf tokens.")
+        if numeric_token_count > 0:
+            print(f"(Excluded {numeric_token_count} purely numeric tokens from the final list. "
+                  f"Total tokens processed: {total_tokens_counted})")
 
-    print(f"\nFound {len(final_tokens_counter)} unique non-numeric leaf tokens.")
-    if numeric_token_count > 0:
-      print(f"(Excluded {numeric_token_count} purely numeric tokens from the final list. Total tokens processed: {total_tokens_counted})")
+        print("\nAnalysis complete.")
 
-    print("\nAnalysis complete.")
 
+ANALYSIS = FieldTokens
 
 # --- Execution ---
 if __name__ == "__main__":
-    try:
-        analyze_field_tokens()
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
\ No newline at end of file
+    main([FieldTokens.name] + sys.argv[1:])
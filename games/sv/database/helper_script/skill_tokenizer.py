@@ -1,14 +1,18 @@
 # filename: games/sv/database/helper_script/skill_parser.py (Corrected)
-import json
-import os
+import contextlib
+import io
 import sys
 import re
 import random
 import pprint
+from collections import Counter
+
+from ..importer import RAW_DATABASES
+from .corpus import Analysis, iter_cards, main
 
 # --- Configuration ---
 FIELD_TO_ANALYZE = "skill"
-DB_FILENAME = "all_sv_cards_slim.json"
+FIELDS_TO_PARSE = ('skill', 'skill_condition', 'skill_target', 'skill_option', 'skill_preprocess')
 # --- End Configuration ---
 
 # --- Helper Function ---
@@ -247,118 +251,137 @@ def reconstruct_from_tree(node):
     else:
         return ""
 
-# --- verify_reconstruction_for_all_cards (Main loop) ---
-def verify_reconstruction_for_all_cards():
-    script_dir = os.path.dirname(__file__)
-    db_parent_path = os.path.join(script_dir, '..')
-    db_filepath = os.path.join(db_parent_path, DB_FILENAME)
-
-    print(f"--- Verifying Reconstruction for '{FIELD_TO_ANALYZE}' Field ---")
-    print(f"Loading data from '{db_filepath}'...")
-    try:
-        with open(db_filepath, 'r', encoding='utf-8') as f: all_cards_data = json.load(f)
-        print(f"Successfully loaded {len(all_cards_data)} cards.")
-    except Exception as e: print(f"FATAL ERROR loading JSON: {e}"); sys.exit(1)
-
-    mismatches_found = 0; cards_processed = 0; parse_errors = 0
-    print("\n--- Checking for Mismatches ---")
-
-    for card in all_cards_data:
-        card_id = card.get('card_id', 'UnknownID'); field_string = card.get(FIELD_TO_ANALYZE)
-        raw_string = field_string if isinstance(field_string, str) else ""
-        raw_string_compact = "".join(raw_string.split())
-
-        parsed_tree = None; reconstructed_string = ""; reconstructed_compact = ""
-
-        try:
-            if raw_string.strip() and raw_string.strip().lower() != 'none':
-                parsed_tree = parse_skill(raw_string)
-            elif raw_string.strip().lower() == 'none':
-                parsed_tree = 'none'
-            else: 
-                parsed_tree = None
-            cards_processed += 1
-
-            if parsed_tree is not None:
-                 reconstructed_string = reconstruct_from_tree(parsed_tree)
-                 reconstructed_compact = "".join(reconstructed_string.split())
-            else:
-                reconstructed_compact = ""
-
-            if raw_string_compact == 'none' and reconstructed_compact == 'none':
-                 pass
-            elif raw_string_compact != reconstructed_compact:
-                mismatches_found += 1
-                print("-" * 40); print(f"MISMATCH FOUND for Card ID: {card_id} ({card.get('card_name', '')})")
-                print(f"\n1. Raw String:\n   '{raw_string}'"); print("\n2. Parsed Tree (Indented):")
-                if parsed_tree is None: print("   (Parsing resulted in None)")
-                else: print_tree_indented(parsed_tree)
-                print("\n3. Reconstructed String:"); print(f"   '{reconstructed_string}'"); print("-" * 40)
-
-        except Exception as e:
-            parse_errors += 1
-            print("-" * 40); print(f"ERROR processing Card ID: {card_id} ({card.get('card_name', '')})")
-            print(f"Raw String: '{raw_string}'"); print(f"Error: {e}"); print("-" * 40)
-            continue
-
-    print("\n--- Verification Summary ---"); print(f"Total cards checked: {len(all_cards_data)}")
-    print(f"Cards successfully processed (parsed & reconstructed): {cards_processed - parse_errors}")
-    print(f"Mismatches between raw (compacted) and reconstructed (compacted) strings: {mismatches_found}")
-    print(f"Errors during parsing/reconstruction: {parse_errors}")
-    if mismatches_found == 0 and parse_errors == 0: print("✅ All processed strings reconstructed successfully!")
-    elif mismatches_found > 0: print("❌ Found mismatches. See details above.")
-    elif parse_errors > 0: print("❌ Encountered errors. See details above.")
-
-# --- New Helper Methods (Self-Contained) ---
+# --- Helpers for the corpus analysis ---
 
 def get_parsed_tree_for_card(card, field_name):
     """
     Gets the raw string for a field from a card object and parses it.
-    (This is the wrapper for parse_skill() you requested)
+    Returns None for an empty or non-string field and 'none' for an explicit
+    'none'; raises ValueError if the string does not parse.
     """
-    if not card:
-        print("Error: Received an empty card object.")
-        return None
-
-    card_id = card.get('card_id', 'UnknownID')
     raw_string = card.get(field_name)
 
     if not isinstance(raw_string, str) or not raw_string.strip():
         return None # Empty string or non-string
     if raw_string.strip().lower() == 'none':
         return 'none' # Explicit 'none' string
+    return parse_skill(raw_string)
+
+def count_leaves(node, stats):
+    """Recursively traverses the tree and counts its non-numeric leaves into the `stats` Counter."""
+    # --- Base Case: If not a list/tuple, it's a leaf. ---
+    if not isinstance(node, (list, tuple)):
+        if node is not None and not is_numeric(node):
+            stats[str(node)] += 1
+        return
 
-    try:
-        parsed_tree = parse_skill(raw_string)
-        return parsed_tree
-    except Exception as e:
-        print(f"Error parsing field '{field_name}' for Card ID {card_id}: {e}")
-        print(f"Raw String was: '{raw_string}'")
-        return None
-
-def parse_and_print_random_card():
+    # --- Recursive Case: It IS a list/tuple. ---
+    # An operator node like ['+', 'a', 'b'] only recurses on its children (node[1:]);
+    # a "Group/List" like ['none', ['=', ...]] recurses on ALL items.
+    is_operator_node = (len(node) > 0 and
+                        isinstance(node[0], str) and
+                        (node[0] in STRUCTURAL_TOKENS or
+                         node[0] == 'UNARY_MINUS'))
+    for item in (node[1:] if is_operator_node else node):
+        count_leaves(item, stats)
+
+class SkillTreeChecks(Analysis):
     """
-    Picks a random card and prints the parsed trees for key skill fields.
+    Parses every card: verifies that FIELD_TO_ANALYZE reconstructs from its
+    tree, and counts the leaf nodes of every skill field.
     """
-    # --- Redundant code as requested: Load DB ---
-    script_dir = os.path.dirname(__file__)
-    db_parent_path = os.path.join(script_dir, '..')
-    db_filepath = os.path.join(db_parent_path, DB_FILENAME)
-    all_cards_data = []
-    try:
-        with open(db_filepath, 'r', encoding='utf-8') as f:
-            all_cards_data = json.load(f)
-    except Exception as e:
-        print(f"FATAL ERROR loading JSON in parse_and_print_random_card: {e}")
-        return
-    # --- End redundant code ---
+    name = 'skill_tokenizer'
+    fields = ('card_id', 'card_name') + FIELDS_TO_PARSE
+
+    def new(self):
+        return {
+            'checked': 0,
+            # Printable reports of each mismatch / error
+            'mismatches': [],
+            'errors': [],
+            # field -> leaf -> count
+            'leaves': {field: Counter() for field in FIELDS_TO_PARSE},
+        }
+
+    def add(self, result, card):
+        result['checked'] += 1
+        mismatch = self._check_reconstruction(card, result['errors'])
+        if mismatch:
+            result['mismatches'].append(mismatch)
+        for field in FIELDS_TO_PARSE:
+            try:
+                tree = get_parsed_tree_for_card(card, field)
+            except ValueError:
+                continue # Reported by the reconstruction check for FIELD_TO_ANALYZE
+            count_leaves(tree, result['leaves'][field])
+
+    @staticmethod
+    def _check_reconstruction(card, errors):
+        card_id = card.get('card_id', 'UnknownID'); field_string = card.get(FIELD_TO_ANALYZE)
+        raw_string = field_string if isinstance(field_string, str) else ""
+        raw_string_compact = "".join(raw_string.split())
+        try:
+            parsed_tree = get_parsed_tree_for_card(card, FIELD_TO_ANALYZE)
+            reconstructed_string = reconstruct_from_tree(parsed_tree) if parsed_tree is not None else ""
+        except Exception as e:
+            errors.append("\n".join([
+                "-" * 40, f"ERROR processing Card ID: {card_id} ({card.get('card_name', '')})",
+                f"Raw String: '{raw_string}'", f"Error: {e}", "-" * 40]))
+            return None
+        reconstructed_compact = "".join(reconstructed_string.split())
+        if raw_string_compact == reconstructed_compact:
+            return None
+        lines = ["-" * 40, f"MISMATCH FOUND for Card ID: {card_id} ({card.get('card_name', '')})",
+                 f"\n1. Raw String:\n   '{raw_string}'", "\n2. Parsed Tree (Indented):"]
+        if parsed_tree is None:
+            lines.append("   (Parsing resulted in None)")
+        else:
+            tree_lines = io.StringIO()
+            with contextlib.redirect_stdout(tree_lines):
+                print_tree_indented(parsed_tree)
+            lines.append(tree_lines.getvalue().rstrip("\n"))
+        lines += ["\n3. Reconstructed String:", f"   '{reconstructed_string}'", "-" * 40]
+        return "\n".join(lines)
+
+    def report(self, result):
+        mismatches_found = len(result['mismatches']); parse_errors = len(result['errors'])
+        print(f"--- Verifying Reconstruction for '{FIELD_TO_ANALYZE}' Field ---")
+        print("\n--- Checking for Mismatches ---")
+        for entry in result['mismatches'] + result['errors']:
+            print(entry)
+
+        print("\n--- Verification Summary ---"); print(f"Total cards checked: {result['checked']}")
+        print(f"Cards successfully processed (parsed & reconstructed): {result['checked'] - parse_errors}")
+        print(f"Mismatches between raw (compacted) and reconstructed (compacted) strings: {mismatches_found}")
+        print(f"Errors during parsing/reconstruction: {parse_errors}")
+        if mismatches_found == 0 and parse_errors == 0: print("✅ All processed strings reconstructed successfully!")
+        elif mismatches_found > 0: print("❌ Found mismatches. See details above.")
+        elif parse_errors > 0: print("❌ Encountered errors. See details above.")
+
+        print("\n" + "=" * 50)
+        print("📊 Leaf Node Statistics for All Cards")
+        print("=" * 50)
+        for field in FIELDS_TO_PARSE:
+            print(f"\n--- 🍃 Leaf Stats for '{field}' ---")
+            pprint.pprint(dict(result['leaves'][field]))
+
+ANALYSIS = SkillTreeChecks
+
+def parse_and_print_random_card(paths=RAW_DATABASES):
+    """
+    Picks a random card (in one streaming pass over the class files) and
+    prints the parsed trees for key skill fields.
+    """
+    fields = ('card_id', 'card_name') + FIELDS_TO_PARSE
+    random_card = None
+    for seen, card in enumerate((card for path in paths for card in iter_cards(path, fields)), 1):
+        if random.randrange(seen) == 0:
+            random_card = card
 
-    if not all_cards_data:
+    if random_card is None:
         print("No card data to parse.")
         return
 
-    random_card = random.choice(all_cards_data)
-    # random_card = all_cards_data[1]
     card_id = random_card.get('card_id', 'UnknownID')
     card_name = random_card.get('card_name', 'UnknownName')
 
@@ -366,156 +389,34 @@ def parse_and_print_random_card():
     print(f"📖 Parsing Random Card: {card_id} ({card_name})")
     print("=" * 50)
 
-    fields_to_parse = ['skill', 'skill_condition', 'skill_target', 'skill_option', 'skill_preprocess']
-
-    for field in fields_to_parse:
+    for field in FIELDS_TO_PARSE:
         print(f"\n--- AST for '{field}' ---")
         raw_string = random_card.get(field, "")
-        
+
         if not isinstance(raw_string, str) or not raw_string.strip() or raw_string.strip().lower() == 'none':
             print(f"   (Field is empty or 'none')")
             continue
 
         print(f"   Raw: '{raw_string}'")
-        
-        parsed_tree = get_parsed_tree_for_card(random_card, field)
-        
+        try:
+            parsed_tree = get_parsed_tree_for_card(random_card, field)
+        except ValueError as e:
+            print(f"Error parsing field '{field}' for Card ID {card_id}: {e}")
+            parsed_tree = None
+
         print("   Tree:")
         if parsed_tree is None:
             print("     (Parsing resulted in None or Error)")
         else:
             print_tree_indented(parsed_tree, indent="     ")
 
-def analyze_and_print_leaf_node_stats():
-    """
-    Iterates all cards, parses key fields, and counts leaf node occurrences.
-    """
-    # --- Redundant code as requested: Load DB ---
-    script_dir = os.path.dirname(__file__)
-    db_parent_path = os.path.join(script_dir, '..')
-    db_filepath = os.path.join(db_parent_path, DB_FILENAME)
-    all_cards_data = []
-    try:
-        with open(db_filepath, 'r', encoding='utf-8') as f:
-            all_cards_data = json.load(f)
-    except Exception as e:
-        print(f"FATAL ERROR loading JSON in analyze_and_print_leaf_node_stats: {e}")
-        return
-    # --- End redundant code ---
-
-    print("\n" + "=" * 50)
-    print("📊 Analyzing Leaf Node Statistics for All Cards...")
-    print("=" * 50)
-    
-    # 1. Define the maps
-    skill_stats = {}
-    condition_stats = {}
-    target_stats = {}
-    option_stats = {}
-    preprocess_stats = {}
-
-    # 2. Define the recursive helper to count leaves
-    def _count_leaves(node, stats_map):
-        """Recursively traverses the tree and counts leaves."""
-        
-        # --- Base Case: If not a list/tuple, it's a leaf. ---
-        if not isinstance(node, (list, tuple)):
-            if node is None: return # Don't count None
-
-            if is_numeric(node):
-                return
-
-            key = str(node)
-            stats_map[key] = stats_map.get(key, 0) + 1
-            return
-
-        # --- Recursive Case: It IS a list/tuple. ---
-        
-        # Check if it's an operator node
-        is_operator_node = (len(node) > 0 and 
-                            isinstance(node[0], str) and 
-                            (node[0] in STRUCTURAL_TOKENS or 
-                             node[0] == 'UNARY_MINUS'))
-
-        if is_operator_node:
-            # It's a branch like ['+', 'a', 'b'].
-            # ONLY recurse on the children (node[1:]).
-            for i in range(1, len(node)):
-                _count_leaves(node[i], stats_map)
-        else:
-            # It's a "Group/List" like ['none', ['=', ...]]
-            # Recurse on ALL items.
-            for item in node:
-                _count_leaves(item, stats_map)
-
-    # 3. Iterate all cards and parse
-    print(f"Processing {len(all_cards_data)} cards, please wait...")
-    for card in all_cards_data:
-        # Get tree and count leaves for each field
-        _count_leaves(
-            get_parsed_tree_for_card(card, 'skill'),
-            skill_stats
-        )
-        _count_leaves(
-            get_parsed_tree_for_card(card, 'skill_condition'),
-            condition_stats
-        )
-        _count_leaves(
-            get_parsed_tree_for_card(card, 'skill_target'),
-            target_stats
-        )
-        _count_leaves(
-            get_parsed_tree_for_card(card, 'skill_option'),
-            option_stats
-        )
-        _count_leaves(
-            get_parsed_tree_for_card(card, 'skill_preprocess'),
-            preprocess_stats
-        )
-    
-    print("...Processing complete.")
-
-    # 4. Print all 5 maps
-    print("\n--- 🍃 Leaf Stats for 'skill' ---")
-    pprint.pprint(skill_stats)
-    
-    print("\n--- 🍃 Leaf Stats for 'skill_condition' ---")
-    pprint.pprint(condition_stats)
-
-    print("\n--- 🍃 Leaf Stats for 'skill_target' ---")
-    pprint.pprint(target_stats)
-    
-    print("\n--- 🍃 Leaf Stats for 'skill_option' ---")
-    pprint.pprint(option_stats)
-    
-    print("\n--- 🍃 Leaf Stats for 'skill_preprocess' ---")
-    pprint.pprint(preprocess_stats)
-    
-    print("\n" + "=" * 50)
-    print("📊 Analysis Complete.")
-    print("=" * 50)
-
 # --- Execution ---
 if __name__ == "__main__":
-    DB_FILENAME = "all_sv_cards_slim.json"
-    
-    # 1. Run the original verification (as-is)
-    try:
-        print("--- Running Original Verification ---")
-        verify_reconstruction_for_all_cards()
-    except Exception as e:
-        print(f"An unexpected top-level error during verification: {e}")
-    
-    # 2. Run the new random card parser
+    # 1. Verify reconstruction and count leaf nodes, in one pass
+    main([SkillTreeChecks.name] + sys.argv[1:])
+
+    # 2. Parse a random card
     try:
-        print("\n--- Running New Random Card Parser ---")
         parse_and_print_random_card()
     except Exception as e:
         print(f"An unexpected top-level error during random card parse: {e}")
-        
-    # 3. Run the new stats analyzer
-    try:
-        print("\n--- Running New Leaf Node Stats Analyzer ---")
-        analyze_and_print_leaf_node_stats()
-    except Exception as e:
-        print(f"An unexpected top-level error during stats analysis: {e}")
\ No newline at end of file
@@ -0,0 +1,151 @@
+import os
+import re
+import sys
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from framework.utils.files import iter_json_array
+from .skill_ast import SKILL_FIELDS
+
+DB_DIR = os.path.dirname(__file__)
+
+# --- Raw class databases ---
+# sword.json, forest.json... are lists of cards in the game's own export
+# format. They are converted to the engine's properties on import; the
+# skill DSL fields are kept so SkillCompiler can build their effects.
+RAW_DATABASES = tuple(os.path.join(DB_DIR, f"{name}.json") for name in
+                      ('neutral', 'forest', 'sword', 'rune', 'dragon', 'shadow', 'blood', 'haven', 'portal'))
+RAW_CARD_TYPES = {1: 'Follower', 2: 'Amulet', 3: 'Amulet', 4: 'Spell'}
+RAW_CLANS = {0: 'Neutral', 1: 'Forestcraft', 2: 'Swordcraft', 3: 'Runecraft', 4: 'Dragoncraft',
+             5: 'Shadowcraft', 6: 'Bloodcraft', 7: 'Havencraft', 8: 'Portalcraft'}
+RAW_RARITIES = {1: 'Bronze', 2: 'Silver', 3: 'Gold', 4: 'Legendary'}
+# Tokens (Forest Bat, Fairy...) all belong to this card set.
+TOKEN_CARD_SET = 90000
+# Cards with two traits name them abbreviated: "Mach./Nat.".
+RAW_TRAITS = {'Mach.': 'Machina', 'Nat.': 'Natura', 'Mys.': 'Mysteria', 'Acad.': 'Academic',
+              'Ofcr.': 'Officer', 'Cmdr.': 'Commander', 'Hero.': 'Heroic', 'Cdmn.': 'Condemned',
+              'Fes.': 'Festive', 'Art.': 'Artifact', 'Lvn.': 'Levin'}
+# The raw fields from_raw() reads; the rest (flavour text, art ids...) are
+# dropped as each record is read.
+RAW_FIELDS = ('card_id', 'card_name', 'clan', 'char_type', 'card_set_id', 'rarity', 'cost', 'atk', 'life',
+              'evo_atk', 'evo_life', 'tribe_name', 'skill_disc', 'evo_skill_disc', 'base_card_id') + SKILL_FIELDS
+
+# --- Pool ---
+# Printings of a card (alternate arts, reprints) share its base_card_id.
+# Those whose properties match apart from these are folded into one card;
+# the others (e.g. token copies with their own stats) stay separate.
+_PRINTING_FIELDS = frozenset({'card_set_id', 'alias_ids'})
+
+_MARKUP = re.compile(r"\[/?[a-z0-9]*\]")
+
+
+def _plain_text(description: str) -> str:
+    return _MARKUP.sub('', (description or '').replace('<br>', ' ')).strip()
+
+
+def _traits(tribe_name: Optional[str]) -> List[str]:
+    if not tribe_name or tribe_name == '-':
+        return []
+    if '/' not in tribe_name:
+        return [tribe_name]
+    return [RAW_TRAITS.get(part, part) for part in tribe_name.split('/')]
+
+
+def _intern(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern(entry) for entry in value]
+    return value
+
+
+def from_raw(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts one raw database card to the engine's card properties. Strings
+    are interned, so names, texts and DSL strings repeated across cards are
+    stored once.
+    """
+    data = {
+        'name': entry['card_name'],
+        'class': RAW_CLANS.get(entry['clan'], 'Neutral'),
+        'type': RAW_CARD_TYPES.get(entry['char_type'], 'Follower'),
+        'rarity': 'Token' if entry['card_set_id'] == TOKEN_CARD_SET else RAW_RARITIES.get(entry['rarity']),
+        'cost': max(entry['cost'], 0),
+        'atk': entry['atk'],
+        'def': entry['life'],
+        'evo_atk': entry['evo_atk'],
+        'evo_def': entry['evo_life'],
+        'traits': _traits(entry.get('tribe_name')),
+        'effect_text': _plain_text(entry.get('skill_disc')),
+        'evolve_effect_text': _plain_text(entry.get('evo_skill_disc')),
+        'base_card_id': str(entry['base_card_id']),
+        'char_type': entry['char_type'],
+        'card_set_id': entry['card_set_id'],
+        'skill_disc': entry.get('skill_disc') or '',
+    }
+    for field in SKILL_FIELDS:
+        data[field] = entry.get(field) or 'none'
+    return {key: _intern(value) for key, value in data.items()}
+
+
+def is_raw_database(path: str) -> bool:
+    """True if `path` is a raw class database (a JSON list) rather than an engine card file (an object)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(64)
+            if not chunk:
+                return False
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[0] == '['
+
+
+def iter_raw_cards(paths: Sequence[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yields (card_id, engine properties) for every card of the raw class
+    databases. Records are read one at a time (see iter_json_array), so
+    only the converted cards are ever held in memory.
+    """
+    for path in paths:
+        for entry in iter_json_array(path, RAW_FIELDS):
+            yield str(entry['card_id']), from_raw(entry)
+
+
+def _same_card(a: Mapping[str, Any], b: Mapping[str, Any]) -> bool:
+    keys = a.keys() - _PRINTING_FIELDS
+    return keys == b.keys() - _PRINTING_FIELDS and all(a[key] == b[key] for key in keys)
+
+
+def import_pool(paths: Sequence[str] = RAW_DATABASES) -> Dict[str, Dict[str, Any]]:
+    """
+    Imports raw class databases into one pool of engine cards, keyed by
+    card ID. Printings of the same card are deduplicated by base_card_id:
+    the printing whose ID is its base_card_id is kept (else the first one
+    seen), with the IDs it absorbed listed in its 'alias_ids'.
+    """
+    cards: Dict[str, Dict[str, Any]] = {}
+    # base_card_id -> the IDs kept for it
+    printings: Dict[str, List[str]] = {}
+    for card_id, data in iter_raw_cards(paths):
+        kept = printings.setdefault(data['base_card_id'], [])
+        for i, other_id in enumerate(kept):
+            other = cards[other_id]
+            if not _same_card(other, data):
+                continue
+            if card_id == data['base_card_id']:
+                # The base printing replaces the one kept so far.
+                data['alias_ids'] = other.get('alias_ids', []) + [other_id]
+                del cards[other_id]
+                cards[card_id] = data
+                kept[i] = card_id
+            else:
+                other.setdefault('alias_ids', []).append(card_id)
+            break
+        else:
+            kept.append(card_id)
+            cards[card_id] = data
+    return cards
+
+
+def pool_aliases(cards: Mapping[str, Mapping[str, Any]]) -> Dict[str, str]:
+    """{alias ID: card ID} for every printing import_pool() folded into another card."""
+    return {alias: card_id for card_id, data in cards.items() for alias in data.get('alias_ids', ())}
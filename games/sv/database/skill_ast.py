@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from framework.utils.files import write_atomic
+
+# The parallel DSL fields of a raw database card: entry i of every field
+# describes skill i, and '//' separates the unevolved and evolved forms.
+SKILL_FIELDS = ('skill', 'skill_condition', 'skill_target', 'skill_option', 'skill_preprocess')
+
+# Bumped whenever the trees parse_skill() builds change shape, so stale
+# cache files are ignored instead of misread.
+PARSER_VERSION = 1
+
+# --- Tokens ---
+# Punctuation (longest first) and words; findall skips whitespace and any
+# other character. Keywords must stand on word boundaries, so "3abc" yields
+# only "3".
+_TOKEN = re.compile(r"//|<-|>=|<=|!=|[<>,=&|+\-*/%.():@?!{}]"
+                    r"|\d+_\d+[a-zA-Z0-9_]*|\d+(?:\.\d+)?|\b[a-zA-Z_][a-zA-Z0-9_]*\b")
+
+# --- Grammar ---
+# From loosest to tightest: ',' separates skills and '//' the evolved form
+# (both only at the top of a field or of a {...} block), then the binary
+# operators below, then juxtaposition "f(a)(b)" -> ['SEQ', 'f', ['(', a], ['(', b]],
+# then primaries: leaves, (...), {...} and the prefixes '-' and '?'.
+# Leaves (keywords, numbers, card ids) stay strings.
+
+# operator -> (precedence, right associative)
+_BINARY = {
+    '|': (1, False),
+    '&': (2, False),
+    '=': (3, True),
+    '>=': (4, False), '>': (4, False), '<=': (4, False), '<': (4, False), '!=': (4, False),
+    '?': (5, False),
+    '+': (6, False), '-': (6, False),
+    '*': (7, False), '/': (7, False), '%': (7, False),
+    ':': (8, False),
+    '.': (9, False),
+    '@': (10, False),
+}
+_PREFIX = {'-': 'UNARY_MINUS', '?': 'UNARY_QUESTION'}
+# Tokens that cannot be a leaf. A lone '.' can.
+_NOT_LEAF = frozenset(_BINARY) | {'//', ',', ')', '}', '!'}
+# Where an effect list ends: end of input, a {...} block, or the evolved form.
+_LIST_END = (None, '}', '//')
+
+
+class _Parser:
+    """Parses one token list; see parse_skill()."""
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def advance(self) -> str:
+        token = self.peek()
+        if token is None:
+            raise ValueError("Unexpected end of input")
+        self.pos += 1
+        return token
+
+    def expect(self, token: str):
+        if self.peek() != token:
+            raise ValueError(f"Expected '{token}' but got {self.peek()!r} at token {self.pos}")
+        self.pos += 1
+
+    def field(self):
+        """effects ['//' effects], with an empty side read as 'none'."""
+        left = self.effects()
+        if self.peek() != '//':
+            return left
+        self.pos += 1
+        return ['//', left, self.effects()]
+
+    def effects(self):
+        if self.peek() in _LIST_END:
+            return 'none'
+        effects = [self.expression(1)]
+        while self.peek() == ',':
+            self.pos += 1
+            if self.peek() in _LIST_END:
+                break
+            effects.append(self.expression(1))
+        if len(effects) == 1 and effects[0] == 'none':
+            return 'none'
+        return effects
+
+    def expression(self, min_precedence: int):
+        left = self.sequence()
+        while True:
+            operator = self.peek()
+            binding = _BINARY.get(operator)
+            if binding is None or binding[0] < min_precedence:
+                return left
+            self.pos += 1
+            precedence, right_associative = binding
+            right = self.expression(precedence if right_associative else precedence + 1)
+            left = [operator, left, right]
+
+    def sequence(self):
+        item = self.primary()
+        if self.peek() != '(':
+            return item
+        sequence = ['SEQ', item]
+        while self.peek() == '(':
+            sequence.append(self.primary())
+        return sequence
+
+    def primary(self):
+        token = self.advance()
+        if token == '(':
+            expression = self.expression(1)
+            self.expect(')')
+            return ['(', expression]
+        if token == '{':
+            if self.peek() == '}':
+                self.pos += 1
+                return ['{', '}']
+            content = self.field()
+            self.expect('}')
+            return ['{', content]
+        if token in _PREFIX:
+            return [_PREFIX[token], self.primary()]
+        if token in _NOT_LEAF and token != '.':
+            raise ValueError(f"Expected a value but got '{token}' at token {self.pos - 1}")
+        return token
+
+
+def parse_skill(text: Optional[str]):
+    """
+    Parses one DSL field, e.g. "character=me&target=inplay" into
+    ['&', ['=', 'character', 'me'], ['=', 'target', 'inplay']], and
+    "a,b//c" into ['//', ['a', 'b'], 'c']. Returns None for an empty field;
+    raises ValueError on malformed input.
+    """
+    if not isinstance(text, str):
+        return None
+    tokens = _TOKEN.findall(text)
+    if not tokens:
+        return None
+    parser = _Parser(tokens)
+    tree = parser.field()
+    if parser.pos < len(tokens):
+        raise ValueError(f"Unexpected '{tokens[parser.pos]}' at token {parser.pos}")
+    return tree
+
+
+def skill_key(text: str) -> str:
+    """The cache key of a DSL string."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class SkillTrees:
+    """
+    Parsed DSL trees keyed by a hash of their source string, optionally
+    persisted to a JSON file so later loads skip parsing altogether.
+
+    Strings that fail to parse are cached too, and raise the same
+    ValueError every time they are looked up. Trees are shared between
+    every card with the same string and must not be modified.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        # key -> tree, or {'error': message}
+        self._trees: Dict[str, Any] = {}
+        self._dirty = False
+        if path is not None and os.path.exists(path):
+            self._read(path)
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def parse(self, text: Optional[str]):
+        """parse_skill(text), through the cache."""
+        if not isinstance(text, str):
+            return None
+        tree = self.entry(text)
+        if isinstance(tree, dict):
+            raise ValueError(tree['error'])
+        return tree
+
+    def entry(self, text: str):
+        """The cached entry for `text`, parsing it if needed: a tree, or {'error': message}."""
+        key = skill_key(text)
+        try:
+            return self._trees[key]
+        except KeyError:
+            try:
+                tree = parse_skill(text)
+            except ValueError as e:
+                tree = {'error': str(e)}
+            self._trees[key] = tree
+            self._dirty = True
+            return tree
+
+    def parse_cards(self, cards: Iterable[Dict[str, Any]], fields: Iterable[str] = SKILL_FIELDS) -> int:
+        """
+        Parses the DSL fields of every card in one pass, each distinct string
+        once. Returns how many strings were not cached yet.
+        """
+        fields = tuple(fields)
+        before = len(self._trees)
+        for card in cards:
+            for field in fields:
+                text = card.get(field)
+                if isinstance(text, str):
+                    self.entry(text)
+        return len(self._trees) - before
+
+    def add(self, text: str, entry):
+        """Caches an entry() read elsewhere (e.g. from a card snapshot) without marking the cache dirty."""
+        self._trees[skill_key(text)] = entry
+
+    def save(self):
+        """
+        Writes the cache to `path` if anything was parsed since it was read.
+        The cache is only an optimization, so a failed write is ignored.
+        """
+        if self.path is None or not self._dirty:
+            return
+        data = json.dumps({'version': PARSER_VERSION, 'trees': self._trees}, separators=(',', ':'))
+        if write_atomic(self.path, data.encode('utf-8')):
+            self._dirty = False
+
+    def _read(self, path: str):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # A damaged cache is rebuilt from scratch.
+            return
+        if isinstance(data, dict) and data.get('version') == PARSER_VERSION:
+            self._trees = data.get('trees', {})
@@ -0,0 +1,172 @@
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from framework.utils.files import file_digest, write_atomic
+from .card_index import CardIndex
+from .skill_ast import PARSER_VERSION, SKILL_FIELDS, SkillTrees
+
+# --- Binary layout ---
+# A snapshot is MAGIC, the header's length (u32), the header, then one
+# record per card, one per distinct DSL string and the card index, all
+# marshal-encoded:
+#   header: (FORMAT_VERSION, PARSER_VERSION, sources, index, tree_index, card_index, aliases)
+#   sources: [(path, size, mtime_ns, blake2b hex digest)] of the files it was built from
+#   index: {card_id: (offset, length)}, offsets counted from the first record
+#   tree_index: [(offset, length)] of the tree records
+#   card_index: (offset, length) of the CardIndex record
+#   aliases: {alias ID: card ID} of the printings folded into another card
+#   card record: (card properties, [tree number per DSL field, -1 for none])
+#   tree record: a SkillTrees entry, shared by every card with that string
+# marshal's format is tied to the interpreter, so MAGIC carries its version.
+# Bump FORMAT_VERSION whenever the stored card properties change.
+MAGIC = b'SVDB' + bytes([marshal.version])
+FORMAT_VERSION = 3
+_LENGTH = struct.Struct('<I')
+
+Stamp = Tuple[str, int, int, str]
+
+
+def snapshot_path(sources: Sequence[str]) -> str:
+    """Where the snapshot of these source files lives: next to the first, named after the whole set."""
+    paths = [os.path.abspath(path) for path in sources]
+    digest = hashlib.blake2b('\n'.join(paths).encode('utf-8'), digest_size=4).hexdigest()
+    return os.path.join(os.path.dirname(paths[0]), f"cards_{digest}.snapshot")
+
+
+def _stamp(path: str) -> Stamp:
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return path, stat.st_size, stat.st_mtime_ns, file_digest(path)
+
+
+def _is_current(stamps: List[Stamp], sources: Sequence[str]) -> bool:
+    """True if every source still has the content the snapshot was built from."""
+    if [stamp[0] for stamp in stamps] != [os.path.abspath(path) for path in sources]:
+        return False
+    for path, size, mtime_ns, digest in stamps:
+        try:
+            stat = os.stat(path)
+            # Unchanged size and mtime skip hashing; a touched but identical file still matches.
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns) and file_digest(path) != digest:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def write_snapshot(path: str, sources: Sequence[str], cards: Mapping, trees: SkillTrees,
+                   card_index: CardIndex, aliases: Mapping[str, str]) -> bool:
+    """
+    Writes the snapshot of `cards`, loaded from `sources`, with the parsed
+    trees of their DSL fields, their index and their aliases. Returns False
+    if it could not be written.
+    """
+    records: List[bytes] = []
+    offset = 0
+
+    def add(record: bytes) -> Tuple[int, int]:
+        nonlocal offset
+        records.append(record)
+        offset += len(record)
+        return offset - len(record), len(record)
+
+    # DSL string -> tree number
+    numbers: Dict[str, int] = {}
+    texts: List[str] = []
+    index: Dict[str, Tuple[int, int]] = {}
+    for card_id, data in cards.items():
+        tree_numbers = []
+        for field in SKILL_FIELDS:
+            text = data.get(field)
+            if not isinstance(text, str):
+                tree_numbers.append(-1)
+                continue
+            if text not in numbers:
+                numbers[text] = len(texts)
+                texts.append(text)
+            tree_numbers.append(numbers[text])
+        index[card_id] = add(marshal.dumps((data, tree_numbers)))
+    tree_index = [add(marshal.dumps(trees.entry(text))) for text in texts]
+    index_record = add(marshal.dumps(card_index.record()))
+    header = marshal.dumps((FORMAT_VERSION, PARSER_VERSION, [_stamp(source) for source in sources],
+                            index, tree_index, index_record, dict(aliases)))
+    return write_atomic(path, b''.join([MAGIC, _LENGTH.pack(len(header)), header] + records))
+
+
+class CardSnapshot(Mapping):
+    """
+    The cards of a snapshot, as a read-only {card_id: properties} mapping.
+
+    The file is mapped into memory and each card is decoded on first
+    access, so opening a snapshot only reads its index, and processes
+    loading the same snapshot share its pages. The parsed DSL trees of a
+    decoded card are added to `trees`, each distinct string once.
+    """
+    def __init__(self, path: str, trees: SkillTrees):
+        self.path = path
+        self.trees = trees
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        start = len(MAGIC) + _LENGTH.size
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a card snapshot of this format.")
+        (length,) = _LENGTH.unpack_from(self._map, len(MAGIC))
+        header = marshal.loads(self._map[start:start + length])
+        self.format_version, self.parser_version, self.sources = header[:3]
+        if (self.format_version, self.parser_version) != (FORMAT_VERSION, PARSER_VERSION):
+            raise ValueError(f"{path} was built by another version.")
+        self._index, self._tree_index, self._card_index, self.aliases = header[3:]
+        self._records_start = start + length
+        self._decoded: Dict[str, Dict[str, Any]] = {}
+        self._trees_added = set()
+
+    @classmethod
+    def open(cls, path: str, sources: Sequence[str], trees: SkillTrees) -> Optional['CardSnapshot']:
+        """Opens the snapshot at `path` if it exists and was built from the current `sources`, else None."""
+        if not os.path.exists(path):
+            return None
+        try:
+            snapshot = cls(path, trees)
+        except (OSError, ValueError, EOFError, TypeError, struct.error):
+            # Unreadable or damaged: rebuilt from the sources.
+            return None
+        if not _is_current(snapshot.sources, sources):
+            snapshot.close()
+            return None
+        return snapshot
+
+    def card_index(self) -> CardIndex:
+        """The CardIndex stored with the cards."""
+        return CardIndex(*self._record(*self._card_index))
+
+    def close(self):
+        self._map.close()
+
+    def __getitem__(self, card_id: str) -> Dict[str, Any]:
+        data = self._decoded.get(card_id)
+        if data is None:
+            data, tree_numbers = self._record(*self._index[card_id])
+            for field, number in zip(SKILL_FIELDS, tree_numbers):
+                if number >= 0 and number not in self._trees_added:
+                    self.trees.add(data[field], self._record(*self._tree_index[number]))
+                    self._trees_added.add(number)
+            self._decoded[card_id] = data
+        return data
+
+    def _record(self, offset: int, length: int):
+        start = self._records_start + offset
+        return marshal.loads(self._map[start:start + length])
+
+    def __contains__(self, card_id) -> bool:
+        return card_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -1,21 +1,36 @@
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
+
+import numpy as np
 
 from framework.core.game_state import GameState
 from framework.core.player import Player
 from framework.core.card import Card
+from framework.core.journal import Journal
 from framework.simulation.action import Action
 from framework.simulation.base_game_engine import BaseGameEngine
 from framework.scripting.lua_engine import LuaEngine
+from framework.utils.events import EventType
 from .modules.resource_manager import SvResourceManager
 from .modules.action_generator import SvActionGenerator
-from .modules.trigger_manager import TriggerManager
+from .modules.action_space import ATTACK, EVOLVE, PLAY_CARD, SUPER_EVOLVE, SvActionSpace
+from .modules.effects import destroy
+from .modules.trigger_manager import SCRIPT_DIR, TriggerManager
 from .api.script_api import ScriptAPI
 
+if TYPE_CHECKING:
+    from .database.db_loader import CardDatabase
+
 class SvEngine(BaseGameEngine):
     """
     The concrete game engine for Shadowverse and Shadowverse: Worlds Beyond.
+
+    Args:
+        preload_scripts (bool): Compile every card script when the engine is
+            created instead of on each card's first trigger.
+        card_db (CardDatabase, optional): The database decks are built from;
+            its compiled card skills become native effects.
     """
-    def __init__(self, game_mode: str):
+    def __init__(self, game_mode: str, preload_scripts: bool = False, card_db: Optional['CardDatabase'] = None):
         super().__init__(game_mode)
         if game_mode not in ['SV', 'SVWB']:
             raise ValueError("Invalid game mode specified for SvEngine.")
@@ -24,12 +39,21 @@ class SvEngine(BaseGameEngine):
         
         self.game_state: Optional[GameState] = None
         self.action_generator = SvActionGenerator(game_mode)
+        self.action_space = SvActionSpace(self)
         self.script_api = ScriptAPI(self)
-        self.lua_engine = LuaEngine(self.script_api)
+        self.lua_engine = LuaEngine(self.script_api, self.events)
         self.trigger_manager = TriggerManager(self)
+        if card_db is not None:
+            self.trigger_manager.effects.skills = card_db.skills
+        if preload_scripts:
+            self.lua_engine.warm_up(SCRIPT_DIR)
 
     def setup_game(self, game_state: GameState):
         self.game_state = game_state
+        # Announced here rather than by LuaEngine.__init__, which runs before
+        # anyone can subscribe to the engine's events.
+        if self.events:
+            self.events.emit(EventType.SCRIPT_ENGINE_READY)
         hand_size = 4 if self.game_mode == 'SVWB' else 3
         for player in game_state.players:
             player.resources = SvResourceManager(player, game_state, self.game_mode)
@@ -42,86 +66,153 @@ class SvEngine(BaseGameEngine):
         active_player = game_state.active_player
         return self.action_generator.get_possible_actions(game_state, active_player)
 
-    def apply_action(self, game_state: GameState, action: Action):
-        player = next(p for p in game_state.players if p.name == action.player_id)
-        resources: SvResourceManager = player.resources
+    def get_action_mask(self, game_state: GameState, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Returns the legal actions as a bool mask over self.action_space."""
+        return self.action_space.legal_mask(game_state, out=out)
+
+    def apply_action_index(self, game_state: GameState, index: int, journal: Optional[Journal] = None):
+        """
+        Applies the action at `index` in self.action_space for the active
+        player. The slots are resolved to cards directly; no Action is built.
+        """
+        self._journaled(game_state, journal, self._apply_index, index)
+
+    def apply_action(self, game_state: GameState, action: Action, journal: Optional[Journal] = None):
+        """
+        Applies an action to the game state.
+
+        Args:
+            journal (Journal, optional): If given, every change the action makes,
+                including trigger side effects, is recorded so undo() can revert it.
+        """
+        self._journaled(game_state, journal, self._apply_action, action)
+
+    def undo(self, game_state: GameState, journal: Journal, mark: int = 0):
+        """Reverts the changes recorded in `journal` since `mark`."""
+        game_state.undo(journal, mark)
+
+    def _journaled(self, game_state: GameState, journal: Optional[Journal], apply, argument):
+        """Calls apply(game_state, argument), recording its changes in `journal` if one is given."""
+        if journal is None:
+            apply(game_state, argument)
+            return
+
+        previous, game_state.journal = game_state.journal, journal
+        try:
+            apply(game_state, argument)
+        finally:
+            game_state.journal = previous
+
+    def _apply_index(self, game_state: GameState, index: int):
+        code, player, card, target = self.action_space.resolve(game_state, index)
+        # Card effects and scripts act on engine.game_state; point it at the
+        # game being changed, as one engine may drive several games.
+        self.game_state = game_state
+
+        if code == PLAY_CARD:
+            self._play_card(game_state, player, card)
+        elif code == ATTACK:
+            self._attack(game_state, card, target)
+        elif code == EVOLVE:
+            self._evolve(game_state, player, card)
+        elif code == SUPER_EVOLVE:
+            self._super_evolve(game_state, player)
+
+    def _apply_action(self, game_state: GameState, action: Action):
+        # Card effects and scripts act on engine.game_state; point it at the
+        # game being changed, as one engine may drive several games.
+        self.game_state = game_state
+        player = game_state.get_player(action.player_id)
 
         if action.action_type == "END_TURN":
             return
 
         elif action.action_type == "PLAY_CARD":
             card_id = action.details['card_instance_id']
-            card = next((c for c in player.hand.get_cards() if c.instance_id == card_id), None)
-            
-            if card and resources.can_play_card(card):
-                resources.spend_resources_for_card(card)
-                player.hand.remove(card)
-                
-                card_type = card.get_property("type")
-                if card_type in ["Follower", "Amulet"]:
-                    player.board.add(card)
-                    if card_type == "Follower":
-                        card.turn_played = game_state.turn_number
-                else:
-                    player.graveyard.add(card)
-                
-                # self.trigger_manager is now the only one that prints during an action
-                self.trigger_manager.post_event("on_play", card=card)
-        
+            self._play_card(game_state, player, game_state.find_card(card_id, player.hand))
+
         elif action.action_type == "ATTACK":
-            attacker = next((c for c in player.board.get_cards() if c.instance_id == action.details['attacker_id']), None)
-            opponent = next(p for p in game_state.players if p is not player)
+            attacker = game_state.find_card(action.details['attacker_id'], player.board)
+            opponent = game_state.get_opponent(player)
             target_id = action.details['target_id']
-            target = next((c for c in opponent.board.get_cards() if c.instance_id == target_id), None)
+            target = game_state.find_card(target_id, opponent.board)
             if not target and opponent.name == target_id:
                 target = opponent
+            self._attack(game_state, attacker, target)
 
-            if attacker and target:
-                attacker.attacks_made_this_turn += 1
-                
-                if isinstance(target, Player):
-                    target.life -= attacker.get_property('atk', 0)
-                else:
-                    target.properties['def'] -= attacker.get_property('atk', 0)
-                    attacker.properties['def'] -= target.get_property('atk', 0)
-                
-                if not isinstance(target, Player) and target.get_property('def', 0) <= 0:
-                    opponent.board.remove(target)
-                    opponent.graveyard.add(target)
-                    self.trigger_manager.post_event("on_destroy", card=target)
-
-                if attacker.get_property('def', 0) <= 0:
-                    player.board.remove(attacker)
-                    player.graveyard.add(attacker)
-                    self.trigger_manager.post_event("on_destroy", card=attacker)
-        
         elif action.action_type == "EVOLVE":
-            if resources.can_evolve():
-                resources.has_evolved_this_turn = True
-                resources.spend_ep()
-                target_id = action.details['target_id']
-                target = next((c for c in player.board.get_cards() if c.instance_id == target_id), None)
-                if target:
-                    target.properties['atk'] += 2
-                    target.properties['def'] += 2
-                    target.properties['is_evolved'] = True
-                    target.properties['gained_rush_this_turn'] = True
-                    self.trigger_manager.post_event("on_evolve", card=target)
+            self._evolve(game_state, player, game_state.find_card(action.details['target_id'], player.board))
 
         elif action.action_type == "SUPER_EVOLVE":
-            if resources.can_super_evolve():
-                resources.has_evolved_this_turn = True
-                resources.spend_sep()
-                # TODO: Implement Super Evolve logic
+            self._super_evolve(game_state, player)
+
+    def _play_card(self, game_state: GameState, player: Player, card: Optional[Card]):
+        resources: SvResourceManager = player.resources
+        if card and resources.can_play_card(card):
+            resources.spend_resources_for_card(card)
+            player.hand.remove(card)
+
+            card_type = card.get_property("type")
+            if card_type in ["Follower", "Amulet"]:
+                player.board.add(card)
+                if card_type == "Follower":
+                    game_state.set_attr(card, 'turn_played', game_state.turn_number)
+            else:
+                player.graveyard.add(card)
+
+            self.trigger_manager.post_event("on_play", card=card)
+
+    def _attack(self, game_state: GameState, attacker: Optional[Card], target: Optional[Union[Card, Player]]):
+        if attacker and target:
+            game_state.set_attr(attacker, 'attacks_made_this_turn', attacker.attacks_made_this_turn + 1)
+
+            if isinstance(target, Player):
+                game_state.set_attr(target, 'life', target.life - attacker.atk)
+            else:
+                game_state.set_attr(target, 'defense', target.defense - attacker.atk)
+                game_state.set_attr(attacker, 'defense', attacker.defense - target.atk)
+
+            # destroy() skips a card that is already gone, e.g. when the
+            # target's Last Words destroyed the attacker first.
+            if not isinstance(target, Player) and target.defense <= 0:
+                destroy(game_state, target)
+
+            if attacker.defense <= 0:
+                destroy(game_state, attacker)
+
+    def _evolve(self, game_state: GameState, player: Player, target: Optional[Card]):
+        resources: SvResourceManager = player.resources
+        if resources.can_evolve():
+            game_state.set_attr(resources, 'has_evolved_this_turn', True)
+            resources.spend_ep()
+            if target:
+                game_state.set_attr(target, 'atk', target.atk + 2)
+                game_state.set_attr(target, 'defense', target.defense + 2)
+                game_state.set_attr(target, 'is_evolved', True)
+                game_state.set_attr(target, 'gained_rush_this_turn', True)
+                self.trigger_manager.post_event("on_evolve", card=target)
+
+    def _super_evolve(self, game_state: GameState, player: Player):
+        resources: SvResourceManager = player.resources
+        if resources.can_super_evolve():
+            game_state.set_attr(resources, 'has_evolved_this_turn', True)
+            resources.spend_sep()
+            # TODO: Implement Super Evolve logic
 
     def check_win_condition(self, game_state: GameState) -> Optional[Player]:
+        # Only life and deck-out changes can end the game; GameState flags them as they happen.
+        # The flag stays set while there is a winner, so asking again gives the same answer.
+        if not game_state.win_check_pending:
+            return None
+
         for player in game_state.players:
-            opponent = next(p for p in game_state.players if p is not player)
-            
+            opponent = game_state.get_opponent(player)
+
             if opponent.life <= 0:
                 return player
 
             if opponent.has_decked_out:
                 return player
 
+        game_state.win_check_pending = False
         return None
\ No newline at end of file
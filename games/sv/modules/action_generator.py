@@ -1,18 +1,120 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+from framework.core.card import Card
 from framework.core.game_state import GameState
 from framework.core.player import Player
 from framework.simulation.action import Action
 from framework.simulation.base_action_generator import BaseActionGenerator
 from .resource_manager import SvResourceManager
+from .keywords import WARD, STORM, RUSH
+
+def attack_options(follower: Card, turn_number: int) -> Tuple[bool, bool]:
+    """Returns (can attack followers, can attack the leader) for a card on the board."""
+    if follower.get_property("type") != "Follower":
+        return False, False # Skip amulets
+
+    if follower.attacks_made_this_turn >= follower.max_attacks_per_turn:
+        return False, False
+
+    can_attack_followers = False
+    can_attack_leader = False
+    keywords = follower.keywords
+    was_played_this_turn = (follower.turn_played == turn_number)
+
+    if not was_played_this_turn:
+        can_attack_followers = True
+        can_attack_leader = True
+    else:
+        if keywords & STORM:
+            can_attack_followers = True
+            can_attack_leader = True
+        elif keywords & RUSH:
+            can_attack_followers = True
+        elif follower.gained_rush_this_turn:
+            can_attack_followers = True
+    return can_attack_followers, can_attack_leader
+
 
 class SvActionGenerator(BaseActionGenerator):
+    """
+    Generates the legal actions for a player.
+
+    The action list is kept between calls as separate sections (plays, one
+    attack row per follower, evolves). The GameState's version at the
+    previous call is kept, GameState.changed_since() tells what changed
+    after it, and only the sections that read those zones, cards or
+    resources are rebuilt. Other generators and agents following the same
+    GameState do not interfere. A new turn, a different player or a restored
+    snapshot rebuilds everything.
+    """
+    def __init__(self, game_mode: str):
+        super().__init__(game_mode)
+        self._game_state: Optional[GameState] = None
+        self._player: Optional[Player] = None
+        self._version = 0
+        self._board_full = False
+        self._play_actions: List[Action] = []
+        self._attack_rows: Dict[Card, List[Action]] = {}
+        self._attack_targets: list = []
+        self._ward_targets: List[Card] = []
+        self._evolve_actions: List[Action] = []
+        self._end_turn_action: Optional[Action] = None
+
     def get_possible_actions(self, game_state: GameState, player: Player) -> List[Action]:
+        version, self._version = self._version, game_state.version
+        changed = game_state.changed_since
+        opponent = game_state.get_opponent(player)
+        board = player.board
+
+        if game_state is not self._game_state or player is not self._player or changed(game_state, version):
+            self._game_state = game_state
+            self._player = player
+            self._end_turn_action = Action(player_id=player.name, action_type="END_TURN")
+            self._board_full = len(board.cards) >= 5
+            self._build_play_actions(player)
+            self._build_targets(opponent)
+            self._attack_rows = {}
+            self._build_evolve_actions(player)
+        else:
+            board_changed = changed(board, version)
+            resources_changed = changed(player.resources, version)
+            board_full = len(board.cards) >= 5
+            if resources_changed or changed(player.hand, version) or board_full != self._board_full:
+                self._board_full = board_full
+                self._build_play_actions(player)
+            if changed(opponent.board, version):
+                self._build_targets(opponent)
+                self._attack_rows = {}
+            elif board_changed:
+                # Only rows for followers that changed (or left play) are stale.
+                rows = self._attack_rows
+                for card in [c for c in rows if changed(c, version)]:
+                    del rows[card]
+            if board_changed or resources_changed:
+                self._build_evolve_actions(player)
+
+        actions = list(self._play_actions)
+
+        # Attack rows are assembled in board order; missing rows are built on demand.
+        rows = self._attack_rows
+        live_rows: Dict[Card, List[Action]] = {}
+        for follower in board.cards:
+            row = rows.get(follower)
+            if row is None:
+                row = self._build_attack_row(game_state, player, opponent, follower)
+            live_rows[follower] = row
+            actions.extend(row)
+        self._attack_rows = live_rows
+
+        actions.extend(self._evolve_actions)
+        actions.append(self._end_turn_action)
+        return actions
+
+    def _build_play_actions(self, player: Player):
+        """1. "Play Card" actions."""
         actions: List[Action] = []
         resources: SvResourceManager = player.resources
-
-        # 1. Generate "Play Card" actions
-        if len(player.board.get_cards()) < 5:
+        if not self._board_full:
             for card in player.hand.get_cards():
                 if resources.can_play_card(card):
                     actions.append(Action(
@@ -20,66 +122,48 @@ class SvActionGenerator(BaseActionGenerator):
                         action_type="PLAY_CARD",
                         details={"card_instance_id": card.instance_id}
                     ))
+        self._play_actions = actions
 
-        # 2. Generate "Attack" actions
-        opponent = next(p for p in game_state.players if p is not player)
-        
-        # Get all potential targets on the opponent's side that are followers
+    def _build_targets(self, opponent: Player):
+        """Caches the opponent's attackable followers, respecting Ward."""
         opponent_followers = [f for f in opponent.board.get_cards() if f.get_property("type") == "Follower"]
-        
-        # Determine valid targets first, respecting Ward
-        ward_followers = [f for f in opponent_followers if "Ward" in f.get_property("effect_text", "")]
-        
-        for follower in player.board.get_cards():
-            if follower.get_property("type") != "Follower":
-                continue # Skip amulets
-
-            if follower.attacks_made_this_turn >= follower.max_attacks_per_turn:
-                continue
-
-            can_attack_followers = False
-            can_attack_leader = False
-            effect_text = follower.get_property("effect_text", "")
-            was_played_this_turn = (follower.turn_played == game_state.turn_number)
-
-            if not was_played_this_turn:
-                can_attack_followers = True
-                can_attack_leader = True
-            else:
-                if "Storm" in effect_text:
-                    can_attack_followers = True
-                    can_attack_leader = True
-                elif "Rush" in effect_text:
-                    can_attack_followers = True
-                elif follower.get_property('gained_rush_this_turn', False):
-                    can_attack_followers = True
-            
-            if not can_attack_followers and not can_attack_leader:
-                continue
-
-            possible_targets = []
-            if ward_followers:
-                if can_attack_followers:
-                    possible_targets.extend(ward_followers)
-            else:
-                if can_attack_leader:
-                    possible_targets.append(opponent)
-                if can_attack_followers:
-                    possible_targets.extend(opponent_followers)
-
-            for target in possible_targets:
-                target_id = target.instance_id if hasattr(target, 'instance_id') else target.name
-                actions.append(Action(
-                    player_id=player.name,
-                    action_type="ATTACK",
-                    details={"attacker_id": follower.instance_id, "target_id": target_id}
-                ))
-        
-        # 3. Generate "Evolve" actions
+        self._attack_targets = opponent_followers
+        self._ward_targets = [f for f in opponent_followers if f.keywords & WARD]
+
+    def _build_attack_row(self, game_state: GameState, player: Player, opponent: Player, follower: Card) -> List[Action]:
+        """2. "Attack" actions for one follower."""
+        can_attack_followers, can_attack_leader = attack_options(follower, game_state.turn_number)
+        if not can_attack_followers and not can_attack_leader:
+            return []
+
+        possible_targets = []
+        if self._ward_targets:
+            if can_attack_followers:
+                possible_targets.extend(self._ward_targets)
+        else:
+            if can_attack_leader:
+                possible_targets.append(opponent)
+            if can_attack_followers:
+                possible_targets.extend(self._attack_targets)
+
+        row = []
+        for target in possible_targets:
+            target_id = target.instance_id if hasattr(target, 'instance_id') else target.name
+            row.append(Action(
+                player_id=player.name,
+                action_type="ATTACK",
+                details={"attacker_id": follower.instance_id, "target_id": target_id}
+            ))
+        return row
+
+    def _build_evolve_actions(self, player: Player):
+        """3. "Evolve" and 4. "Super Evolve" actions."""
+        actions: List[Action] = []
+        resources: SvResourceManager = player.resources
         if resources.can_evolve():
             evolve_targets = [
-                f for f in player.board.get_cards() 
-                if f.get_property("type") == "Follower" and not f.get_property("is_evolved", False)
+                f for f in player.board.get_cards()
+                if f.get_property("type") == "Follower" and not f.is_evolved
             ]
             for target in evolve_targets:
                 actions.append(Action(
@@ -87,21 +171,16 @@ class SvActionGenerator(BaseActionGenerator):
                     action_type="EVOLVE",
                     details={"target_id": target.instance_id}
                 ))
-        
-        # 4. Generate "Super Evolve" actions
+
         if resources.can_super_evolve():
             super_evolve_targets = [
-                f for f in player.board.get_cards() 
-                if f.get_property("type") == "Follower" and f.get_property("is_evolved", False)
+                f for f in player.board.get_cards()
+                if f.get_property("type") == "Follower" and f.is_evolved
             ]
             for target in super_evolve_targets:
-                 actions.append(Action(
+                actions.append(Action(
                     player_id=player.name,
                     action_type="SUPER_EVOLVE",
                     details={"target_id": target.instance_id}
                 ))
-
-        # 5. Generate "End Turn" action
-        actions.append(Action(player_id=player.name, action_type="END_TURN"))
-
-        return actions
\ No newline at end of file
+        self._evolve_actions = actions
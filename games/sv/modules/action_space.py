@@ -0,0 +1,259 @@
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from framework.core.card import Card
+from framework.core.game_state import GameState
+from framework.core.player import Player
+from framework.simulation.action import Action
+from .action_generator import attack_options
+from .keywords import WARD
+
+if TYPE_CHECKING:
+    from ..engine import SvEngine
+
+# --- Action type codes ---
+END_TURN = 0
+PLAY_CARD = 1
+ATTACK = 2
+EVOLVE = 3
+SUPER_EVOLVE = 4
+
+ACTION_TYPE_NAMES: Tuple[str, ...] = ("END_TURN", "PLAY_CARD", "ATTACK", "EVOLVE", "SUPER_EVOLVE")
+ACTION_TYPE_CODES: Dict[str, int] = {name: code for code, name in enumerate(ACTION_TYPE_NAMES)}
+
+# --- Fixed layout ---
+# Slots are positions in the acting player's hand/board, and in the
+# opponent's board for attack targets. Target slot 0 is the opponent's leader.
+HAND_SLOTS = 9
+BOARD_SLOTS = 5
+TARGET_SLOTS = 1 + BOARD_SLOTS
+
+PLAY_OFFSET = 0                                           # hand slot
+ATTACK_OFFSET = PLAY_OFFSET + HAND_SLOTS                  # attacker slot * TARGET_SLOTS + target slot
+EVOLVE_OFFSET = ATTACK_OFFSET + BOARD_SLOTS * TARGET_SLOTS  # board slot
+SUPER_EVOLVE_OFFSET = EVOLVE_OFFSET + BOARD_SLOTS         # board slot
+END_TURN_INDEX = SUPER_EVOLVE_OFFSET + BOARD_SLOTS
+ACTION_SPACE_SIZE = END_TURN_INDEX + 1
+
+LEADER_TARGET = 0
+
+
+def pack(action_type: int, slot: int = 0, target: int = 0) -> int:
+    """Returns the action-space index for (type, slot, target)."""
+    if action_type == PLAY_CARD:
+        if not 0 <= slot < HAND_SLOTS:
+            raise ValueError(f"Hand slot {slot} is outside the action space.")
+        return PLAY_OFFSET + slot
+    if action_type == END_TURN:
+        return END_TURN_INDEX
+    if not 0 <= slot < BOARD_SLOTS:
+        raise ValueError(f"Board slot {slot} is outside the action space.")
+    if action_type == ATTACK:
+        if not 0 <= target < TARGET_SLOTS:
+            raise ValueError(f"Target slot {target} is outside the action space.")
+        return ATTACK_OFFSET + slot * TARGET_SLOTS + target
+    if action_type == EVOLVE:
+        return EVOLVE_OFFSET + slot
+    if action_type == SUPER_EVOLVE:
+        return SUPER_EVOLVE_OFFSET + slot
+    raise ValueError(f"Unknown action type code {action_type}.")
+
+
+def unpack(index: int) -> Tuple[int, int, int]:
+    """Returns (type, slot, target) for an action-space index."""
+    if index < 0 or index >= ACTION_SPACE_SIZE:
+        raise ValueError(f"Action index {index} is outside the action space.")
+    if index < ATTACK_OFFSET:
+        return PLAY_CARD, index - PLAY_OFFSET, 0
+    if index < EVOLVE_OFFSET:
+        slot, target = divmod(index - ATTACK_OFFSET, TARGET_SLOTS)
+        return ATTACK, slot, target
+    if index < SUPER_EVOLVE_OFFSET:
+        return EVOLVE, index - EVOLVE_OFFSET, 0
+    if index < END_TURN_INDEX:
+        return SUPER_EVOLVE, index - SUPER_EVOLVE_OFFSET, 0
+    return END_TURN, 0, 0
+
+
+class SvActionSpace:
+    """
+    Maps SV actions to and from a fixed-size integer action space.
+
+    Layout (ACTION_SPACE_SIZE = 50):
+        [0, 9)    play the card in hand slot i
+        [9, 39)   attack with board slot i against target slot j (0 = leader)
+        [39, 44)  evolve board slot i
+        [44, 49)  super evolve board slot i
+        49        end turn
+
+    Indices always refer to the active player, so a policy can work on the
+    legality mask alone and only decode the index it picks.
+    """
+    size = ACTION_SPACE_SIZE
+
+    def __init__(self, engine: 'SvEngine'):
+        self.engine = engine
+
+    def encode(self, game_state: GameState, action: Action) -> int:
+        """Returns the index of an Action taken by the active player."""
+        code = ACTION_TYPE_CODES.get(action.action_type)
+        if code is None:
+            raise ValueError(f"Action type '{action.action_type}' has no encoding.")
+        if code == END_TURN:
+            return END_TURN_INDEX
+
+        player = game_state.get_player(action.player_id)
+        if code == PLAY_CARD:
+            card = game_state.find_card(action.details['card_instance_id'], player.hand)
+            return pack(PLAY_CARD, self._slot(player.hand.cards, card))
+        if code == ATTACK:
+            attacker = game_state.find_card(action.details['attacker_id'], player.board)
+            opponent = game_state.get_opponent(player)
+            target_id = action.details['target_id']
+            if target_id == opponent.name:
+                target = LEADER_TARGET
+            else:
+                target = 1 + self._slot(opponent.board.cards, game_state.find_card(target_id, opponent.board))
+            return pack(ATTACK, self._slot(player.board.cards, attacker), target)
+
+        card = game_state.find_card(action.details['target_id'], player.board)
+        return pack(code, self._slot(player.board.cards, card))
+
+    def resolve(self, game_state: GameState, index: int
+                ) -> Tuple[int, Player, Optional[Card], Optional[Union[Card, Player]]]:
+        """
+        Returns (type code, acting player, card, target) for `index`, without
+        building an Action. `card` is the card in the hand or board slot the
+        index names (None for END_TURN); `target` is the attacked follower or
+        player for ATTACK, else None.
+        """
+        code, slot, target = unpack(index)
+        player = game_state.active_player
+        if code == END_TURN:
+            return code, player, None, None
+        if code == PLAY_CARD:
+            return code, player, self._card_at(player.hand.cards, slot), None
+
+        card = self._card_at(player.board.cards, slot)
+        if code != ATTACK:
+            return code, player, card, None
+        opponent = game_state.get_opponent(player)
+        if target == LEADER_TARGET:
+            return code, player, card, opponent
+        return code, player, card, self._card_at(opponent.board.cards, target - 1)
+
+    def decode(self, game_state: GameState, index: int) -> Action:
+        """Builds the Action for `index`, for the active player."""
+        code, player, card, target = self.resolve(game_state, index)
+        if code == END_TURN:
+            return Action(player_id=player.name, action_type="END_TURN")
+        if code == PLAY_CARD:
+            return Action(player_id=player.name, action_type="PLAY_CARD",
+                          details={"card_instance_id": card.instance_id})
+        if code == ATTACK:
+            target_id = target.name if isinstance(target, Player) else target.instance_id
+            return Action(player_id=player.name, action_type="ATTACK",
+                          details={"attacker_id": card.instance_id, "target_id": target_id})
+        return Action(player_id=player.name, action_type=ACTION_TYPE_NAMES[code],
+                      details={"target_id": card.instance_id})
+
+    def legal_mask(self, game_state: GameState, actions: Optional[List[Action]] = None,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Returns a bool array of length `size` that is True for every legal action.
+
+        The mask is read straight from the active player's hand, board and
+        resources, by the same rules as SvActionGenerator, without building
+        any Action.
+
+        Args:
+            actions (List[Action], optional): The legal actions, if already generated; they are marked instead.
+            out (np.ndarray, optional): A buffer to fill instead of allocating a new one.
+        """
+        if out is None:
+            out = np.zeros(ACTION_SPACE_SIZE, dtype=np.bool_)
+        else:
+            out[:] = False
+        if actions is not None:
+            return self._mark_actions(game_state, actions, out)
+
+        player = game_state.active_player
+        opponent = game_state.get_opponent(player)
+        resources = player.resources
+        board = player.board.cards
+
+        # Playing a card needs a free board slot, even for spells.
+        if len(board) < BOARD_SLOTS:
+            for slot, card in enumerate(player.hand.cards[:HAND_SLOTS]):
+                if resources.can_play_card(card):
+                    out[PLAY_OFFSET + slot] = True
+
+        # Attack targets are the opponent's followers; Ward ones must be attacked first.
+        targets, ward = [], []
+        for target, card in enumerate(opponent.board.cards[:BOARD_SLOTS], 1):
+            if card.get_property("type") == "Follower":
+                targets.append(target)
+                if card.keywords & WARD:
+                    ward.append(target)
+        turn = game_state.turn_number
+        can_evolve = resources.can_evolve()
+        can_super_evolve = resources.can_super_evolve()
+        for slot, card in enumerate(board[:BOARD_SLOTS]):
+            if card.get_property("type") != "Follower":
+                continue
+            can_attack_followers, can_attack_leader = attack_options(card, turn)
+            row = ATTACK_OFFSET + slot * TARGET_SLOTS
+            if ward:
+                if can_attack_followers:
+                    for target in ward:
+                        out[row + target] = True
+            else:
+                if can_attack_leader:
+                    out[row + LEADER_TARGET] = True
+                if can_attack_followers:
+                    for target in targets:
+                        out[row + target] = True
+            if card.is_evolved:
+                if can_super_evolve:
+                    out[SUPER_EVOLVE_OFFSET + slot] = True
+            elif can_evolve:
+                out[EVOLVE_OFFSET + slot] = True
+
+        out[END_TURN_INDEX] = True
+        return out
+
+    def _mark_actions(self, game_state: GameState, actions: List[Action], out: np.ndarray) -> np.ndarray:
+        """Sets the entries of `out` for a list of generated actions."""
+        player = game_state.active_player
+        opponent = game_state.get_opponent(player)
+        hand_slots = {card.instance_id: i for i, card in enumerate(player.hand.cards)}
+        board_slots = {card.instance_id: i for i, card in enumerate(player.board.cards)}
+        target_slots = {card.instance_id: i + 1 for i, card in enumerate(opponent.board.cards)}
+        target_slots[opponent.name] = LEADER_TARGET
+
+        for action in actions:
+            action_type = action.action_type
+            details = action.details
+            if action_type == "PLAY_CARD":
+                index = pack(PLAY_CARD, hand_slots[details['card_instance_id']])
+            elif action_type == "ATTACK":
+                index = pack(ATTACK, board_slots[details['attacker_id']], target_slots[details['target_id']])
+            elif action_type == "END_TURN":
+                index = END_TURN_INDEX
+            else:
+                index = pack(ACTION_TYPE_CODES[action_type], board_slots[details['target_id']])
+            out[index] = True
+        return out
+
+    @staticmethod
+    def _slot(cards: List[Card], card: Optional[Card]) -> int:
+        if card is None:
+            raise ValueError("Action refers to a card that is not in the expected zone.")
+        return cards.index(card)
+
+    @staticmethod
+    def _card_at(cards: List[Card], slot: int) -> Card:
+        if slot >= len(cards):
+            raise ValueError(f"Slot {slot} is empty.")
+        return cards[slot]
@@ -0,0 +1,338 @@
+import re
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
+
+from framework.core.card import Card
+from framework.core.card_definition import CardDefinition
+from framework.core.game_state import GameState
+from framework.core.player import Player
+
+if TYPE_CHECKING:
+    from .skill_compiler import SkillCompiler
+
+# A compiled effect, called like a Lua card function: effect(card, game_state).
+Effect = Callable[[Card, GameState], None]
+Target = Union[Card, Player]
+
+MAX_LIFE = 20
+BOARD_LIMIT = 5
+
+# --- Primitives ---
+# Every change goes through zones and GameState.set_attr, so effects are
+# journaled, hashed and seen by the incremental action generator like any
+# other game action.
+
+def draw(game_state: GameState, player: Player, count: int = 1):
+    for _ in range(count):
+        player.draw_card(game_state)
+
+
+def fetch(game_state: GameState, player: Player, card: Card):
+    """Moves a specific card from the player's deck to their hand (the graveyard if the hand is full)."""
+    player.deck.remove(card)
+    if len(player.hand.cards) >= game_state.game_engine.max_hand_size:
+        player.graveyard.add(card)
+    else:
+        player.hand.add(card)
+
+
+def damage(game_state: GameState, targets: List[Target], amount: int):
+    """Deals `amount` to every target at once, then destroys followers left at 0 defense or less."""
+    for target in targets:
+        if isinstance(target, Player):
+            game_state.set_attr(target, 'life', target.life - amount)
+        else:
+            game_state.set_attr(target, 'defense', target.defense - amount)
+    for target in targets:
+        if not isinstance(target, Player) and target.defense <= 0:
+            destroy(game_state, target)
+
+
+def heal(game_state: GameState, player: Player, amount: int):
+    """Restores the leader's defense, up to MAX_LIFE."""
+    life = min(player.life + amount, MAX_LIFE)
+    if life > player.life:
+        game_state.set_attr(player, 'life', life)
+
+
+def buff(game_state: GameState, cards: List[Card], atk: int, defense: int):
+    for card in cards:
+        game_state.set_attr(card, 'atk', card.atk + atk)
+        game_state.set_attr(card, 'defense', card.defense + defense)
+
+
+def destroy(game_state: GameState, card: Card):
+    """Moves a card from its owner's board to the graveyard and fires its Last Words."""
+    owner = card.owner
+    if owner is None or card not in owner.board.cards:
+        return
+    owner.board.remove(card)
+    owner.graveyard.add(card)
+    game_state.game_engine.trigger_manager.post_event("on_destroy", card=card)
+
+
+def banish(game_state: GameState, card: Card):
+    """Removes a card from its owner's board without sending it to the graveyard; no Last Words."""
+    owner = card.owner
+    if owner is None or card not in owner.board.cards:
+        return
+    owner.board.remove(card)
+
+
+def summon(game_state: GameState, player: Player, definition: CardDefinition) -> Optional[Card]:
+    """Puts a new card on the board; it is lost if the board is full."""
+    if len(player.board.cards) >= BOARD_LIMIT:
+        return None
+    card = Card(definition)
+    player.board.add(card)
+    if definition.get_property("type") == "Follower":
+        game_state.set_attr(card, 'turn_played', game_state.turn_number)
+    return card
+
+
+def summon_token(game_state: GameState, player: Player, name: str, atk: int, defense: int) -> Optional[Card]:
+    """Puts a new vanilla follower on the board; it is lost if the board is full."""
+    return summon(game_state, player, token_definition(name, atk, defense))
+
+
+def add_to_hand(game_state: GameState, player: Player, definition: CardDefinition) -> Optional[Card]:
+    """Puts a new card into the player's hand; it is lost if the hand is full."""
+    if len(player.hand.cards) >= game_state.game_engine.max_hand_size:
+        return None
+    card = Card(definition)
+    player.hand.add(card)
+    return card
+
+
+# --- Tokens ---
+# Token followers are not in the card database. Their ids encode the stats,
+# so any process can rebuild the definition from the id alone (see replays).
+_TOKEN_PREFIX = "TOKEN:"
+_token_definitions: Dict[str, CardDefinition] = {}
+
+
+def token_definition(name: str, atk: int, defense: int) -> CardDefinition:
+    return token_from_id(f"{_TOKEN_PREFIX}{name}:{atk}/{defense}")
+
+
+def is_token_id(card_id: str) -> bool:
+    return card_id.startswith(_TOKEN_PREFIX)
+
+
+def token_from_id(card_id: str) -> CardDefinition:
+    """Returns the shared definition for a token id such as 'TOKEN:Knight:1/1'."""
+    definition = _token_definitions.get(card_id)
+    if definition is None:
+        name, stats = card_id[len(_TOKEN_PREFIX):].rsplit(':', 1)
+        atk, defense = (int(value) for value in stats.split('/'))
+        definition = CardDefinition(card_id, name, {
+            'name': name, 'type': 'Follower', 'cost': 0, 'atk': atk, 'def': defense,
+            'effect_text': '', 'is_token': True,
+        })
+        _token_definitions[card_id] = definition
+    return definition
+
+
+# --- Target selectors ---
+# Each returns the targets for a source card. Single-target effects pick at
+# random from the game's effect stream, as there is no targeting step in the
+# action space yet.
+Selector = Callable[[Card, GameState], List[Target]]
+
+
+def _followers(player: Player) -> List[Card]:
+    return [card for card in player.board.cards if card.get_property("type") == "Follower"]
+
+
+def _one(select: Selector) -> Selector:
+    def pick(source: Card, game_state: GameState) -> List[Target]:
+        candidates = select(source, game_state)
+        return [game_state.rng.effect.choice(candidates)] if candidates else []
+    return pick
+
+
+def _opponent(source: Card, game_state: GameState) -> Player:
+    return game_state.get_opponent(source.owner)
+
+
+_SELECTORS: Dict[str, Selector] = {
+    "the enemy leader": lambda s, gs: [_opponent(s, gs)],
+    "your leader": lambda s, gs: [s.owner],
+    "an enemy follower": _one(lambda s, gs: _followers(_opponent(s, gs))),
+    "a random enemy follower": _one(lambda s, gs: _followers(_opponent(s, gs))),
+    "an enemy": _one(lambda s, gs: _followers(_opponent(s, gs)) + [_opponent(s, gs)]),
+    "an allied follower": _one(lambda s, gs: _followers(s.owner)),
+    "another allied follower": _one(lambda s, gs: [c for c in _followers(s.owner) if c is not s]),
+    "all enemy followers": lambda s, gs: _followers(_opponent(s, gs)),
+    "all enemies": lambda s, gs: _followers(_opponent(s, gs)) + [_opponent(s, gs)],
+    "all allied followers": lambda s, gs: _followers(s.owner),
+    "all other allied followers": lambda s, gs: [c for c in _followers(s.owner) if c is not s],
+    "all followers": lambda s, gs: _followers(s.owner) + _followers(_opponent(s, gs)),
+    "all other followers": lambda s, gs: [c for c in _followers(s.owner) + _followers(_opponent(s, gs))
+                                          if c is not s],
+    "this follower": lambda s, gs: [s] if s in s.owner.board.cards else [],
+}
+_TARGET = "|".join(sorted((re.escape(phrase) for phrase in _SELECTORS), key=len, reverse=True))
+
+_NUMBERS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5}
+
+
+def _count(word: str) -> int:
+    return _NUMBERS[word.lower()] if word.lower() in _NUMBERS else int(word)
+
+
+# --- Sentence compiler ---
+# Each pattern matches one whole sentence of effect text and builds an Effect
+# from the match. Sentences that match nothing make the whole section fall
+# back to its Lua script.
+
+def _draw_clause(match: re.Match) -> Effect:
+    count = _count(match['count'])
+    return lambda card, game_state: draw(game_state, card.owner, count)
+
+
+def _damage_clause(match: re.Match) -> Effect:
+    amount, select = int(match['amount']), _SELECTORS[match['target']]
+    return lambda card, game_state: damage(game_state, select(card, game_state), amount)
+
+
+def _self_damage_clause(match: re.Match) -> Effect:
+    amount = int(match['amount'])
+    return lambda card, game_state: damage(game_state, [card.owner], amount)
+
+
+def _heal_clause(match: re.Match) -> Effect:
+    amount = int(match['amount'])
+    return lambda card, game_state: heal(game_state, card.owner, amount)
+
+
+def _buff_clause(match: re.Match) -> Effect:
+    atk, defense = int(match['atk']), int(match['def'])
+    select = _SELECTORS[match['target']] if match['target'] else _SELECTORS["this follower"]
+    return lambda card, game_state: buff(game_state, select(card, game_state), atk, defense)
+
+
+def _destroy_clause(match: re.Match) -> Effect:
+    select = _SELECTORS[match['target']]
+
+    def effect(card: Card, game_state: GameState):
+        for target in select(card, game_state):
+            destroy(game_state, target)
+    return effect
+
+
+_TOKEN_ITEM = re.compile(r"(?P<count>a|an|one|two|three|four|five) (?P<atk>\d+)/(?P<def>\d+) (?P<name>[A-Z][\w' -]*)")
+
+
+def _summon_clause(match: re.Match) -> Optional[Effect]:
+    tokens: List[Tuple[str, int, int]] = []
+    for item in match['items'].split(" and "):
+        token = _TOKEN_ITEM.fullmatch(item)
+        if token is None:
+            return None
+        count, name = _count(token['count']), token['name']
+        if count > 1 and name.endswith('s'):
+            name = name[:-1]
+        tokens += [(name, int(token['atk']), int(token['def']))] * count
+
+    def effect(card: Card, game_state: GameState):
+        for name, atk, defense in tokens:
+            summon_token(game_state, card.owner, name, atk, defense)
+    return effect
+
+
+_CLAUSES: Tuple[Tuple[re.Pattern, Callable[[re.Match], Optional[Effect]]], ...] = (
+    (re.compile(r"Draw (?P<count>a|an|one|two|three|\d+) cards?"), _draw_clause),
+    (re.compile(rf"Deal (?P<amount>\d+) damage to (?P<target>{_TARGET})"), _damage_clause),
+    (re.compile(r"Your leader takes (?P<amount>\d+) damage"), _self_damage_clause),
+    (re.compile(r"Restore (?P<amount>\d+) defense to your leader"), _heal_clause),
+    (re.compile(rf"(?:Gain|Give (?P<target>{_TARGET})) \+(?P<atk>\d+)/\+(?P<def>\d+)"), _buff_clause),
+    (re.compile(rf"Destroy (?P<target>{_TARGET})"), _destroy_clause),
+    (re.compile(r"Summon (?P<items>.+)"), _summon_clause),
+)
+
+# Timing labels in effect text and the card function each one maps to.
+TIMINGS = {"Fanfare": "on_fanfare", "Last Words": "on_last_words"}
+_TIMING_SPLIT = re.compile(r"\b(Fanfare|Last Words):\s*")
+_SENTENCE_SPLIT = re.compile(r"(?<=\.)\s+")
+
+
+def compile_sentences(text: str) -> Optional[Effect]:
+    """Compiles effect text into one Effect, or None if any sentence is not understood."""
+    effects: List[Effect] = []
+    for sentence in _SENTENCE_SPLIT.split(text.strip()):
+        sentence = sentence.rstrip('.').strip()
+        if not sentence:
+            continue
+        for pattern, build in _CLAUSES:
+            match = pattern.fullmatch(sentence)
+            if match is not None:
+                effect = build(match)
+                if effect is None:
+                    return None
+                effects.append(effect)
+                break
+        else:
+            return None
+    if not effects:
+        return None
+    if len(effects) == 1:
+        return effects[0]
+
+    def sequence(card: Card, game_state: GameState):
+        for effect in effects:
+            effect(card, game_state)
+    return sequence
+
+
+def compile_card(definition: CardDefinition) -> Dict[str, Effect]:
+    """
+    Compiles what it can of a card's effect text, as {function_name: Effect}.
+
+    Followers and amulets get 'on_fanfare' / 'on_last_words' from their
+    "Fanfare:" / "Last Words:" clauses; a spell's whole text is its
+    'on_spell' effect. Keyword-only text before the first timing is skipped.
+    """
+    text = definition.get_property("effect_text") or ""
+    if not text:
+        return {}
+    if definition.get_property("type") == "Spell":
+        effect = compile_sentences(text)
+        return {"on_spell": effect} if effect is not None else {}
+
+    effects: Dict[str, Effect] = {}
+    parts = _TIMING_SPLIT.split(text)
+    # parts = [static text, timing, clause text, timing, clause text, ...]
+    for timing, clause in zip(parts[1::2], parts[2::2]):
+        effect = compile_sentences(clause)
+        if effect is not None:
+            effects[TIMINGS[timing]] = effect
+    return effects
+
+
+class EffectLibrary:
+    """
+    The native effects for each card, compiled from its text on first use.
+
+    TriggerManager asks the library before falling back to Lua. Effects
+    compiled from a card's skill DSL take precedence over its text, and
+    hand-written effects added with register() over both.
+    """
+    def __init__(self, skills: Optional['SkillCompiler'] = None):
+        # Compiles the skill DSL of raw database cards (see skill_compiler.py).
+        self.skills = skills
+        self._compiled: Dict[str, Dict[str, Effect]] = {}
+        self._registered: Dict[str, Dict[str, Effect]] = {}
+
+    def register(self, card_id: str, function_name: str, effect: Effect):
+        self._registered.setdefault(card_id, {})[function_name] = effect
+        self._compiled.pop(card_id, None)
+
+    def get(self, definition: CardDefinition, function_name: str) -> Optional[Effect]:
+        effects = self._compiled.get(definition.card_id)
+        if effects is None:
+            effects = compile_card(definition)
+            if self.skills is not None:
+                effects.update(self.skills.compile(definition))
+            effects.update(self._registered.get(definition.card_id, {}))
+            self._compiled[definition.card_id] = effects
+        return effects.get(function_name)
@@ -0,0 +1,53 @@
+import re
+from typing import Dict
+
+# Keyword bits stored on CardDefinition.keywords and Card.keywords.
+# Plain ints (not an IntFlag) so tests in the action generator stay cheap.
+WARD = 1 << 0
+STORM = 1 << 1
+RUSH = 1 << 2
+BANE = 1 << 3
+DRAIN = 1 << 4
+AMBUSH = 1 << 5
+FANFARE = 1 << 6
+LAST_WORDS = 1 << 7
+
+KEYWORD_NAMES: Dict[int, str] = {
+    WARD: "Ward",
+    STORM: "Storm",
+    RUSH: "Rush",
+    BANE: "Bane",
+    DRAIN: "Drain",
+    AMBUSH: "Ambush",
+    FANFARE: "Fanfare",
+    LAST_WORDS: "Last Words",
+}
+
+# Abilities the card itself has (e.g. "Storm, Ward."). These are only read from
+# the text before the first "Timing:" clause, so "Fanfare: Give ... Rush." does
+# not give the card Rush.
+_STATIC_KEYWORDS = (WARD, STORM, RUSH, BANE, DRAIN, AMBUSH)
+# Trigger timings, which may appear anywhere in the text.
+_TIMING_KEYWORDS = (FANFARE, LAST_WORDS)
+
+_PATTERNS = {bit: re.compile(rf"\b{name}\b") for bit, name in KEYWORD_NAMES.items()}
+
+
+def parse_keywords(effect_text: str) -> int:
+    """Parses a card's effect text into a keyword bitmask."""
+    if not effect_text:
+        return 0
+    static_text = effect_text.split(':', 1)[0]
+    mask = 0
+    for bit in _STATIC_KEYWORDS:
+        if _PATTERNS[bit].search(static_text):
+            mask |= bit
+    for bit in _TIMING_KEYWORDS:
+        if _PATTERNS[bit].search(effect_text):
+            mask |= bit
+    return mask
+
+
+def keyword_names(mask: int) -> str:
+    """Formats a keyword bitmask for display, e.g. 'Storm, Ward'."""
+    return ", ".join(name for bit, name in KEYWORD_NAMES.items() if mask & bit)
@@ -0,0 +1,159 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from framework.core.card import Card
+from framework.core.game_state import GameState
+from framework.core.player import Player
+from .action_generator import attack_options
+from .action_space import BOARD_SLOTS, HAND_SLOTS
+from .keywords import KEYWORD_NAMES
+from .resource_manager import SvResourceManager
+
+_KEYWORD_BITS = tuple(KEYWORD_NAMES)
+# The kw_* features of every keyword mask, so a card's keywords cost one lookup.
+_KEYWORD_VALUES = tuple(tuple(1.0 if mask & bit else 0.0 for bit in _KEYWORD_BITS)
+                        for mask in range(sum(_KEYWORD_BITS) + 1))
+
+# --- Feature layouts ---
+# Board row: one per board slot, all zeros when the slot is empty.
+BOARD_FEATURES: Tuple[str, ...] = (
+    "present", "card_code", "is_follower", "is_amulet", "cost", "atk", "def",
+    "evolved", "can_attack_followers", "can_attack_leader", "attacks_left",
+) + tuple(f"kw_{name.lower().replace(' ', '_')}" for name in KEYWORD_NAMES.values())
+
+# Hand row: only encoded for the observing player.
+HAND_FEATURES: Tuple[str, ...] = (
+    "present", "card_code", "is_follower", "is_amulet", "is_spell", "cost", "atk", "def", "playable",
+) + tuple(f"kw_{name.lower().replace(' ', '_')}" for name in KEYWORD_NAMES.values())
+
+# Per-player scalars, observer first. The opponent's hand is only a count.
+PLAYER_FEATURES: Tuple[str, ...] = (
+    "life", "pp", "max_pp", "ep", "sep", "has_evolved_this_turn", "can_evolve", "can_super_evolve",
+    "is_first_player", "deck_count", "hand_count", "graveyard_count", "board_count",
+)
+
+GLOBAL_FEATURES: Tuple[str, ...] = ("turn_number", "is_observer_turn")
+
+
+class SvObservationEncoder:
+    """
+    Encodes a GameState as a fixed-length float32 vector from one player's viewpoint.
+
+    Hidden information is never read: the opponent's hand is reduced to a
+    count and neither deck's order or contents is encoded.
+
+    Vector layout (see `segments`):
+        own_board      BOARD_SLOTS x len(BOARD_FEATURES)
+        opponent_board BOARD_SLOTS x len(BOARD_FEATURES)
+        own_hand       HAND_SLOTS  x len(HAND_FEATURES)
+        players        2           x len(PLAYER_FEATURES)  (observer, opponent)
+        globals        len(GLOBAL_FEATURES)
+
+    Values are raw game numbers (life, cost, attack...), not normalized.
+    `card_code` is 1 + the card's index in `card_vocab`, or 0 when no
+    vocabulary is given or the card is not in it.
+    """
+    def __init__(self, card_vocab: Optional[Dict[str, int]] = None):
+        self.card_vocab = card_vocab or {}
+        shapes = (
+            ("own_board", (BOARD_SLOTS, len(BOARD_FEATURES))),
+            ("opponent_board", (BOARD_SLOTS, len(BOARD_FEATURES))),
+            ("own_hand", (HAND_SLOTS, len(HAND_FEATURES))),
+            ("players", (2, len(PLAYER_FEATURES))),
+            ("globals", (len(GLOBAL_FEATURES),)),
+        )
+        self.segments: Dict[str, Tuple[int, Tuple[int, ...]]] = {}
+        self._slices: Dict[str, slice] = {}
+        offset = 0
+        for name, shape in shapes:
+            self.segments[name] = (offset, shape)
+            self._slices[name] = slice(offset, offset + int(np.prod(shape)))
+            offset += int(np.prod(shape))
+        self.size = offset
+
+    def allocate(self, batch_size: Optional[int] = None) -> np.ndarray:
+        """Returns a zeroed buffer for one observation, or for `batch_size` of them."""
+        shape = (self.size,) if batch_size is None else (batch_size, self.size)
+        return np.zeros(shape, dtype=np.float32)
+
+    def view(self, observation: np.ndarray, segment: str) -> np.ndarray:
+        """Returns a shaped view of one segment of a single observation (no copy)."""
+        return observation[self._slices[segment]].reshape(self.segments[segment][1])
+
+    def encode(self, game_state: GameState, player: Player, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Encodes `game_state` as seen by `player`.
+
+        Args:
+            out (np.ndarray, optional): A float32 buffer of length `size` to write into.
+        """
+        if out is None:
+            out = np.empty(self.size, dtype=np.float32)
+        self._write(out, game_state, player)
+        return out
+
+    def encode_batch(self, states: Sequence[GameState], players: Sequence[Player],
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Encodes one observation per (state, player) pair into the rows of `out`."""
+        if out is None:
+            out = np.empty((len(states), self.size), dtype=np.float32)
+        for row, (game_state, player) in enumerate(zip(states, players)):
+            self._write(out[row], game_state, player)
+        return out
+
+    # --- Feature extraction ---
+    # Features are written straight into the observation: one assignment per
+    # card row and per player, after zeroing the buffer for the empty slots.
+
+    def _write(self, out: np.ndarray, game_state: GameState, player: Player):
+        opponent = game_state.get_opponent(player)
+        turn = game_state.turn_number
+        out.fill(0.0)
+        self._board(self.view(out, "own_board"), player.board.cards, turn)
+        self._board(self.view(out, "opponent_board"), opponent.board.cards, turn)
+        # Nothing can be played onto a full board (see SvActionGenerator).
+        board_full = len(player.board.cards) >= BOARD_SLOTS
+        self._hand(self.view(out, "own_hand"), player.hand.cards, None if board_full else player.resources)
+        players = self.view(out, "players")
+        self._player(players, 0, player)
+        self._player(players, 1, opponent)
+        out[self._slices["globals"]] = (turn, 1.0 if game_state.active_player is player else 0.0)
+
+    def _card_code(self, card: Card) -> int:
+        index = self.card_vocab.get(card.card_id)
+        return 0 if index is None else index + 1
+
+    def _board(self, rows: np.ndarray, cards: List[Card], turn: int):
+        for slot, card in enumerate(cards[:BOARD_SLOTS]):
+            card_type = card.get_property("type")
+            keywords = card.keywords
+            can_followers, can_leader = attack_options(card, turn)
+            if card_type == "Follower":
+                attacks_left = max(card.max_attacks_per_turn - card.attacks_made_this_turn, 0)
+            else:
+                attacks_left = 0
+            rows[slot] = (
+                1.0, self._card_code(card), card_type == "Follower", card_type == "Amulet",
+                card.get_property("cost", 0), card.atk, card.defense, card.is_evolved,
+                can_followers, can_leader, attacks_left,
+            ) + _KEYWORD_VALUES[keywords]
+
+    def _hand(self, rows: np.ndarray, cards: List[Card], resources: Optional[SvResourceManager]):
+        """Hand rows; `resources` is None when no card can be played."""
+        for slot, card in enumerate(cards[:HAND_SLOTS]):
+            card_type = card.get_property("type")
+            rows[slot] = (
+                1.0, self._card_code(card), card_type == "Follower", card_type == "Amulet",
+                card_type == "Spell", card.get_property("cost", 0), card.atk, card.defense,
+                resources is not None and resources.can_play_card(card),
+            ) + _KEYWORD_VALUES[card.keywords]
+
+    def _player(self, rows: np.ndarray, row: int, player: Player):
+        resources: SvResourceManager = player.resources
+        rows[row] = (
+            player.life, resources.pp, resources.max_pp, resources.ep, resources.sep,
+            resources.has_evolved_this_turn, resources.can_evolve(), resources.can_super_evolve(),
+            resources.is_first_player, len(player.deck.cards), len(player.hand.cards),
+            len(player.graveyard.cards), len(player.board.cards),
+        )
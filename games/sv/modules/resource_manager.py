@@ -2,12 +2,15 @@ from framework.core.player import Player
 from framework.core.card import Card
 from framework.core.game_state import GameState
 from framework.simulation.base_resource_manager import BaseResourceManager
+from framework.utils.events import EventType
 
 class SvResourceManager(BaseResourceManager):
     """
     Manages the resources for Shadowverse and Shadowverse: Worlds Beyond.
     This includes Play Points (PP), Evolve Points (EP), and Super Evolve Points (SEP).
     """
+    HASHED_ATTRS = ('pp', 'max_pp', 'ep', 'sep', 'has_evolved_this_turn')
+
     def __init__(self, player: Player, game_state: GameState, game_mode: str):
         super().__init__(player, game_state, game_mode)
         
@@ -34,25 +37,27 @@ class SvResourceManager(BaseResourceManager):
         """
         Increments max PP, refills PP, and resets follower attack counters.
         """
+        game_state = self.game_state
         if self.max_pp < 10:
-            self.max_pp += 1
-        self.pp = self.max_pp
+            game_state.set_attr(self, 'max_pp', self.max_pp + 1)
+        game_state.set_attr(self, 'pp', self.max_pp)
 
         # --- UPDATED LOGIC ---
         # Reset the attack counter for all followers on the board.
         for follower in self.player.board.get_cards():
-            follower.attacks_made_this_turn = 0
+            if follower.attacks_made_this_turn:
+                game_state.set_attr(follower, 'attacks_made_this_turn', 0)
         
-        self.has_evolved_this_turn = False
+        game_state.set_attr(self, 'has_evolved_this_turn', False)
         
-        if self.game_mode == 'SV':
+        if self.game_mode == 'SV' and game_state.events:
             turn_to_evolve = 5 if self.is_first_player else 4
-            if self.game_state.turn_number == turn_to_evolve:
-                print(f"--- {self.player.name} can now evolve! ---")
+            if game_state.turn_number == turn_to_evolve:
+                game_state.events.emit(EventType.CAN_EVOLVE, player=self.player.name)
 
     def can_play_card(self, card: Card) -> bool:
         """Checks if the player has enough PP to play the card."""
-        # Assumes card.properties['cost'] holds the PP cost
+        # The PP cost comes from the card's shared definition
         cost = card.get_property('cost', 0)
         return self.pp >= cost
 
@@ -60,7 +65,7 @@ class SvResourceManager(BaseResourceManager):
         """Spends the PP for playing a card."""
         cost = card.get_property('cost', 0)
         if self.pp >= cost:
-            self.pp -= cost
+            self.game_state.set_attr(self, 'pp', self.pp - cost)
         else:
             # This should ideally not be reached if can_play_card is checked first
             raise ValueError("Not enough PP to play this card.")
@@ -77,7 +82,7 @@ class SvResourceManager(BaseResourceManager):
     def spend_ep(self, amount: int = 1):
         """Spends a classic Evolve Point."""
         if self.ep >= amount:
-            self.ep -= amount
+            self.game_state.set_attr(self, 'ep', self.ep - amount)
         else:
             raise ValueError("Not enough EP to evolve.")
 
@@ -91,10 +96,18 @@ class SvResourceManager(BaseResourceManager):
     def spend_sep(self, amount: int = 1):
         """Spends a Super Evolve Point."""
         if self.sep >= amount:
-            self.sep -= amount
+            self.game_state.set_attr(self, 'sep', self.sep - amount)
         else:
             raise ValueError("Not enough SEP to super evolve.")
 
+    def snapshot(self) -> tuple:
+        """Captures PP, EP, SEP and the once-per-turn evolve flag."""
+        return (self.pp, self.max_pp, self.ep, self.sep, self.has_evolved_this_turn)
+
+    def restore(self, state: tuple):
+        """Restores counters captured by snapshot()."""
+        self.pp, self.max_pp, self.ep, self.sep, self.has_evolved_this_turn = state
+
     def __repr__(self) -> str:
         """Provides a string representation of the player's current resources."""
         base_repr = f"PP: {self.pp}/{self.max_pp}, EP: {self.ep}"
@@ -0,0 +1,556 @@
+import operator
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from framework.core.card import Card
+from framework.core.card_definition import CardDefinition
+from framework.core.game_state import GameState
+from framework.core.player import Player
+from ..database.card_index import CardIndex, CardQuery
+from ..database.skill_ast import SKILL_FIELDS, parse_skill
+from . import effects
+from .effects import Effect, Target
+
+Selector = Callable[[Card, GameState], List[Target]]
+DefinitionLookup = Callable[[str], CardDefinition]
+Parse = Callable[[Optional[str]], Any]
+
+
+class SkillContext(NamedTuple):
+    """The card pool skills are compiled against."""
+    # Resolves the card ids skills refer to (tokens to summon or put into the hand).
+    lookup: DefinitionLookup
+    # Answers filters on what a card is (clan, trait, card type, base cost).
+    index: CardIndex
+
+
+class _Unsupported(Exception):
+    """A skill uses something the compiler cannot express natively."""
+
+
+# --- DSL trees ---
+# parse_skill() turns "character=me&target=inplay" into nested lists such as
+# ['&', ['=', 'character', 'me'], ['=', 'target', 'inplay']]. Numbers stay strings.
+
+_COMPARISONS = {
+    '=': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+}
+
+
+def _entries(raw: Optional[str], parse: Parse) -> list:
+    """Parses one DSL field into its per-skill trees (the unevolved form only)."""
+    tree = parse(raw) if raw else None
+    if isinstance(tree, list) and tree and tree[0] == '//':
+        tree = tree[1]
+    if tree is None or tree == 'none':
+        return ['none']
+    return tree
+
+
+def _clauses(node) -> list:
+    if node is None or node == 'none':
+        return []
+    if isinstance(node, list) and node[0] == '&':
+        return _clauses(node[1]) + _clauses(node[2])
+    return [node]
+
+
+def _settings(node) -> Dict[str, Tuple[str, object]]:
+    """Flattens 'key=value&key<=value' into {key: (operator, value)}."""
+    settings = {}
+    for clause in _clauses(node):
+        if not (isinstance(clause, list) and len(clause) == 3 and clause[0] in _COMPARISONS
+                and isinstance(clause[1], str) and clause[1] not in settings):
+            raise _Unsupported(f"clause {clause!r}")
+        settings[clause[1]] = (clause[0], clause[2])
+    return settings
+
+
+def _take(settings: Dict[str, Tuple[str, object]], key: str, default=None):
+    """Removes an '=' setting and returns its value."""
+    if key not in settings:
+        return default
+    op, value = settings.pop(key)
+    if op != '=':
+        raise _Unsupported(f"{key}{op}")
+    return value
+
+
+def _int(value) -> int:
+    # {...} expressions (hand size, a random number...) are not compiled.
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    raise _Unsupported(f"value {value!r}")
+
+
+def _ids(value) -> List[str]:
+    """Flattens a colon list such as 900611010:900611010."""
+    if isinstance(value, list) and value[0] == ':':
+        return _ids(value[1]) + _ids(value[2])
+    _int(value)
+    return [value]
+
+
+# --- Targets ---
+
+_SIDES = {'me': (True, False), 'op': (False, True), 'both': (True, True)}
+# card_type -> (followers, amulets, leaders)
+_KINDS = {
+    'unit': (True, False, False),
+    'class': (False, False, True),
+    'unit_and_class': (True, False, True),
+    'field': (False, True, False),
+    'unit_and_allfield': (True, True, False),
+    'all': (True, True, False),
+}
+# Filters on a card's state in the game.
+_STATUS = {
+    'status_life': lambda card: card.defense,
+    'status_offense': lambda card: card.atk,
+    'status_cost': lambda card: card.get_property('cost', 0),
+    'base_card_id': lambda card: card.get_property('base_card_id'),
+}
+# Filters on what a card is, answered by the CardIndex.
+_INDEXED = ('clan', 'tribe', 'base_cost')
+Test = Tuple[Callable[[Card], object], Callable[[object, object], bool], object]
+
+
+def _card_tests(settings: Dict[str, Tuple[str, object]]) -> List[Test]:
+    """Consumes the filters on a card's state (status_cost<=3...) in `settings`."""
+    tests = []
+    for key in [key for key in settings if key in _STATUS]:
+        op, value = settings.pop(key)
+        if key != 'base_card_id':
+            value = _int(value)
+        tests.append((_STATUS[key], _COMPARISONS[op], value))
+    return tests
+
+
+def _card_query(settings: Dict[str, Tuple[str, object]], index: CardIndex,
+                keys: Tuple[str, ...] = _INDEXED) -> Optional[CardQuery]:
+    """Consumes the filters on what a card is (clan=elf, tribe=machine...) in `settings`."""
+    query = None
+    for key in [key for key in settings if key in keys]:
+        op, value = settings.pop(key)
+        if not isinstance(value, str):
+            raise _Unsupported(f"{key}{op}{value!r}")
+        try:
+            clause = CardQuery(index, index.select(key, op, value))
+        except ValueError as e:
+            raise _Unsupported(str(e))
+        query = clause if query is None else query & clause
+    return query
+
+
+def _passes(card: Card, tests: List[Test], query: Optional[CardQuery] = None) -> bool:
+    return (query is None or card.card_id in query) \
+        and all(compare(get(card), value) for get, compare, value in tests)
+
+
+def _take_count(settings: Dict[str, Tuple[str, object]]) -> Optional[int]:
+    """Consumes random_count / select_count. Without a targeting step in the
+    action space, selected targets are picked at random like random ones."""
+    counts = [_int(_take(settings, key)) for key in ('random_count', 'select_count') if key in settings]
+    if len(counts) > 1:
+        raise _Unsupported("two counts")
+    return counts[0] if counts else None
+
+
+def _pick(found: list, count: Optional[int], game_state: GameState) -> list:
+    if count is None or len(found) <= count:
+        return found
+    return game_state.rng.effect.sample(found, count)
+
+
+def _board_selector(settings: Dict[str, Tuple[str, object]], context: SkillContext) -> Selector:
+    """Compiles a 'target=inplay...' or 'target=self' description into a Selector."""
+    mine, theirs = _SIDES[_take(settings, 'character', 'me')]
+    target = _take(settings, 'target')
+    followers, amulets, leaders = _KINDS.get(_take(settings, 'card_type', 'all'), (None,) * 3)
+    if followers is None:
+        raise _Unsupported("card_type")
+    count = _take_count(settings)
+    tests = _card_tests(settings)
+    query = _card_query(settings, context.index)
+    if settings:
+        raise _Unsupported(f"target {sorted(settings)}")
+
+    if target == 'self':
+        return lambda source, game_state: [source] if source in source.owner.board.cards else []
+    if target not in ('inplay', 'inplay_other_self'):
+        raise _Unsupported(f"target={target}")
+    skip_self = target == 'inplay_other_self'
+
+    def candidates(source: Card, game_state: GameState) -> List[Target]:
+        owner = source.owner
+        players = ([owner] if mine else []) + ([game_state.get_opponent(owner)] if theirs else [])
+        found: List[Target] = []
+        for player in players:
+            for card in player.board.cards:
+                is_follower = card.get_property("type") == "Follower"
+                if (followers if is_follower else amulets) and not (skip_self and card is source) \
+                        and _passes(card, tests, query):
+                    found.append(card)
+        if leaders:
+            found += players
+        return found
+
+    if count is None:
+        return candidates
+    return lambda source, game_state: _pick(candidates(source, game_state), count, game_state)
+
+
+def _leader_selector(settings: Dict[str, Tuple[str, object]],
+                     context: SkillContext) -> Callable[[Card, GameState], List[Player]]:
+    if settings.get('card_type') != ('=', 'class'):
+        raise _Unsupported("only leaders can be healed")
+    return _board_selector(settings, context)
+
+
+# --- Conditions ---
+# A condition either always holds when the skill's own timing fires ("played
+# by me", "this card is a spell") or asks whether some card or leader exists
+# ("an enemy follower is in play"), which compiles to a selector.
+# pp_count is the play points available when the card is played: the engine
+# always plays a card for its cost, so Enhance and Accelerate branches are
+# settled at compile time. Anything that depends on other game state
+# (Vengeance, counts in {...}) leaves the skill to Lua.
+
+_OWN_CARD_TYPES = {"Follower": "unit", "Spell": "spell", "Amulet": "field"}
+Check = Callable[[Card, GameState], bool]
+
+
+def _never(card: Card, game_state: GameState) -> bool:
+    return False
+
+
+def _compile_condition(node, definition: CardDefinition, context: SkillContext) -> Optional[Check]:
+    """Returns None for a condition that always holds and _never for one that never does."""
+    card_type = definition.get_property('type')
+    settings = _settings(node)
+    if 'pp_count' in settings:
+        op, value = settings.pop('pp_count')
+        if not _COMPARISONS[op](definition.get_property('cost', 0), _int(value)):
+            return _never
+    if _take(settings, 'target') in (None, 'self'):
+        if _take(settings, 'character', 'me') != 'me' \
+                or _take(settings, 'card_type', _OWN_CARD_TYPES.get(card_type)) != _OWN_CARD_TYPES.get(card_type):
+            raise _Unsupported("condition on another card")
+        if settings:
+            raise _Unsupported(f"condition {sorted(settings)}")
+        return None
+    settings = _settings(node)
+    settings.pop('pp_count', None)
+    if 'random_count' in settings or 'select_count' in settings:
+        raise _Unsupported("condition with a count")
+    select = _board_selector(settings, context)
+    return lambda card, game_state: bool(select(card, game_state))
+
+
+# --- Skills ---
+# Each builder takes the skill's target and option settings and the
+# SkillContext, consumes the keys it understands and returns an Effect. Keys
+# left over are unsupported.
+
+def _damage(target, option, context: SkillContext) -> Effect:
+    amount, select = _int(_take(option, 'damage')), _board_selector(target, context)
+    return lambda card, game_state: effects.damage(game_state, select(card, game_state), amount)
+
+
+def _heal(target, option, context: SkillContext) -> Effect:
+    amount, select = _int(_take(option, 'healing')), _leader_selector(target, context)
+
+    def effect(card: Card, game_state: GameState):
+        for player in select(card, game_state):
+            effects.heal(game_state, player, amount)
+    return effect
+
+
+def _draw(target, option, context: SkillContext) -> Effect:
+    """Draws from the top, or searches the deck when the target has filters."""
+    mine, theirs = _SIDES[_take(target, 'character', 'me')]
+    if _take(target, 'target') != 'deck':
+        raise _Unsupported("draw from outside the deck")
+    if target.get('card_type') == ('=', 'all'):
+        del target['card_type']
+    count = _take_count(target) or 1
+    tests = _card_tests(target)
+    query = _card_query(target, context.index, _INDEXED + ('card_type',))
+    if target:
+        raise _Unsupported(f"draw {sorted(target)}")
+
+    def players(card: Card, game_state: GameState) -> List[Player]:
+        return ([card.owner] if mine else []) + ([game_state.get_opponent(card.owner)] if theirs else [])
+
+    if query is None and not tests:
+        def draw(card: Card, game_state: GameState):
+            for player in players(card, game_state):
+                effects.draw(game_state, player, count)
+        return draw
+
+    def search(card: Card, game_state: GameState):
+        for player in players(card, game_state):
+            found = player.deck.cards if query is None else query.filter(player.deck.cards)
+            found = [c for c in found if _passes(c, tests)] if tests else list(found)
+            for chosen in _pick(found, count, game_state):
+                effects.fetch(game_state, player, chosen)
+    return search
+
+
+def _removal(primitive: Callable[[GameState, Card], None]):
+    def build(target, option, context: SkillContext) -> Effect:
+        select = _board_selector(target, context)
+
+        def effect(card: Card, game_state: GameState):
+            for victim in select(card, game_state):
+                if isinstance(victim, Card):
+                    primitive(game_state, victim)
+        return effect
+    return build
+
+
+def _powerup(target, option, context: SkillContext) -> Effect:
+    atk, defense = _int(_take(option, 'add_offense', '0')), _int(_take(option, 'add_life', '0'))
+    select = _board_selector(target, context)
+
+    def effect(card: Card, game_state: GameState):
+        effects.buff(game_state, [c for c in select(card, game_state) if isinstance(c, Card)], atk, defense)
+    return effect
+
+
+def _token_effect(option, key: str, lookup: DefinitionLookup,
+                  put: Callable[[GameState, Player, CardDefinition], object]) -> Effect:
+    try:
+        definitions = [lookup(card_id) for card_id in _ids(_take(option, key))]
+    except KeyError as e:
+        raise _Unsupported(f"unknown card {e}")
+    repeat = _int(_take(option, 'repeat_count', '1'))
+    side = _take(option, 'summon_side', 'me')
+    if side not in ('me', 'op'):
+        raise _Unsupported(f"summon_side={side}")
+
+    def effect(card: Card, game_state: GameState):
+        player = card.owner if side == 'me' else game_state.get_opponent(card.owner)
+        for _ in range(repeat):
+            for definition in definitions:
+                put(game_state, player, definition)
+    return effect
+
+
+def _summon_token(target, option, context: SkillContext) -> Effect:
+    if target:
+        raise _Unsupported("summon from a target list")
+    return _token_effect(option, 'summon_token', context.lookup, effects.summon)
+
+
+def _token_draw(target, option, context: SkillContext) -> Effect:
+    if target:
+        raise _Unsupported("token_draw from a target list")
+    return _token_effect(option, 'token_draw', context.lookup, effects.add_to_hand)
+
+
+_BUILDERS = {
+    'damage': _damage,
+    'heal': _heal,
+    'draw': _draw,
+    'destroy': _removal(effects.destroy),
+    'banish': _removal(effects.banish),
+    'powerup': _powerup,
+    'summon_token': _summon_token,
+    'token_draw': _token_draw,
+}
+
+
+def compile_skill(name: str, condition, target, option, preprocess, definition: CardDefinition,
+                  context: SkillContext) -> Optional[Effect]:
+    """
+    Compiles one skill of `definition` from its parsed fields. Returns None
+    for a skill that can never fire; raises _Unsupported.
+    """
+    check = _compile_condition(condition, definition, context)
+    if check is _never:
+        return None
+    if preprocess not in (None, 'none'):
+        raise _Unsupported("preprocess")
+    target, option = _settings(target), _settings(option)
+    if name not in _BUILDERS:
+        raise _Unsupported(f"skill {name}")
+    effect = _BUILDERS[name](target, option, context)
+    if option:
+        raise _Unsupported(f"option {sorted(option)}")
+    if check is None:
+        return effect
+
+    def conditional(card: Card, game_state: GameState):
+        if check(card, game_state):
+            effect(card, game_state)
+    return conditional
+
+
+# --- Timings ---
+# The database has no timing field: "Fanfare: Draw a card." is only visible
+# in skill_disc. Each skill is matched to the first description line that
+# mentions its verb, searching from the previous skill's line onward and then
+# from the top, and takes that line's "Fanfare:" / "Last Words:" label.
+# Unlabelled lines of a spell are its 'on_spell' effect. A skill that cannot
+# be placed poisons every line between its placed neighbours, so a timing is
+# never compiled with one of its skills missing.
+
+_SKILL_WORDS = {name: re.compile(pattern) for name, pattern in {
+    'damage': r'damage',
+    'heal': r'[Rr]estore',
+    'draw': r'\b[Dd]raw|from your deck',
+    'destroy': r'[Dd]estroy',
+    'banish': r'[Bb]anish',
+    'powerup': r'[+-]\w+/[+-]\w+',
+    'summon_token': r'[Ss]ummon',
+    'token_draw': r'into your hand',
+    # Keyword abilities; CardDatabase reads the static ones from the text.
+    'guard': r'\bWard\b',
+    'rush': r'\bRush\b',
+    'quick': r'\bStorm\b',
+    'drain': r'\bDrain\b',
+    'killer': r'\bBane\b',
+    'sneak': r'\bAmbush\b',
+    # Skills that are not compiled, placed so they keep their timing in Lua.
+    'pp_fixeduse': r'Enhance|Accelerate|Crystallize',
+    'choice': r'Choose',
+    'fusion': r'Fusion|[Ff]use',
+    'discard': r'[Dd]iscard',
+    'select': r'Select',
+    'update_deck': r'into your deck',
+    'summon_card': r'[Ss]ummon',
+    'return_card': r'[Rr]eturn',
+    'transform': r'[Tt]ransform',
+    'metamorphose': r'[Tt]ransform',
+    'evolve': r'\b[Ee]volve (?:it|this|an?|all|that)\b',
+    'cost_change': r'[Ss]ubtract|[Ss]pellboost|\bcosts?\b',
+    'chant_count_change': r'Countdown',
+    'power_down': r'-\w+/-\w+|\+\w+/-\w+|-\w+/\+\w+',
+}.items()}
+_LABELS = {"Fanfare": "on_fanfare", "Last Words": "on_last_words"}
+_LINE_LABEL = re.compile(r"^([A-Z][\w ]*?)(?: \(\d+\))?:")
+
+
+def _line_timings(lines: List[str], card_type: str) -> List[Optional[str]]:
+    """The card function each description line belongs to, None for static or unsupported lines."""
+    timings = []
+    for line in lines:
+        label = _LINE_LABEL.match(line)
+        if label is None:
+            timings.append("on_spell" if card_type == "Spell" else None)
+        else:
+            timings.append(_LABELS.get(label.group(1)))
+    return timings
+
+
+def _place_skills(names: list, lines: List[str]) -> Tuple[List[Optional[int]], set]:
+    """Returns each skill's line (None if unplaced) and the set of poisoned lines."""
+    placed: List[Optional[int]] = []
+    pointer = 0
+    for name in names:
+        # Names with a suffix, such as damage@2, parse to a tree.
+        pattern = _SKILL_WORDS.get(name) if isinstance(name, str) else None
+        line = None
+        if pattern is not None:
+            for i in list(range(pointer, len(lines))) + list(range(pointer)):
+                if pattern.search(lines[i]):
+                    line = pointer = i
+                    break
+        placed.append(line)
+
+    poisoned = set()
+    for index, (name, line) in enumerate(zip(names, placed)):
+        if line is not None or name == 'none':
+            continue
+        before = [line for line in placed[:index] if line is not None]
+        after = [line for line in placed[index + 1:] if line is not None]
+        low = before[-1] if before else 0
+        high = after[0] if after else len(lines) - 1
+        poisoned.update(range(min(low, high), max(low, high) + 1))
+    return placed, poisoned
+
+
+def compile_skills(definition: CardDefinition, context: SkillContext,
+                   parse: Parse = parse_skill) -> Dict[str, Effect]:
+    """
+    Compiles a raw database card's skills into {function_name: Effect}.
+
+    Skills are grouped by timing, and a timing is only compiled if every one
+    of its skills is; the others are left to the card's Lua script. Only the
+    unevolved form is compiled.
+    """
+    if not definition.get_property('skill'):
+        return {}
+    card_type = definition.get_property('type')
+    description = definition.get_property('skill_disc') or ''
+    try:
+        fields = [_entries(definition.get_property(name), parse) for name in SKILL_FIELDS]
+        count = len(fields[0])
+        # A lone 'none' stands for every skill.
+        fields = [entries * count if entries == ['none'] else entries for entries in fields]
+        if any(len(entries) != count for entries in fields):
+            return {}
+    except ValueError:
+        return {}
+    lines = description.split('<br>')
+    timings = _line_timings(lines, card_type)
+    placed, poisoned = _place_skills(fields[0], lines)
+
+    # timing -> its skills, or None once a poisoned line belongs to it.
+    groups: Dict[str, Optional[List[tuple]]] = {}
+    for line, skill in zip(placed, zip(*fields)):
+        timing = timings[line] if line is not None else None
+        if timing is not None and groups.get(timing, []) is not None:
+            groups.setdefault(timing, []).append(skill)
+    for line in poisoned:
+        if timings[line] is not None:
+            groups[timings[line]] = None
+
+    compiled: Dict[str, Effect] = {}
+    for timing, skills in groups.items():
+        if skills is None:
+            continue
+        try:
+            steps = [compile_skill(*skill, definition, context) for skill in skills]
+        except _Unsupported:
+            continue
+        steps = [step for step in steps if step is not None]
+        if not steps:
+            continue
+        if len(steps) == 1:
+            compiled[timing] = steps[0]
+        else:
+            compiled[timing] = _sequence(steps)
+    return compiled
+
+
+def _sequence(steps: List[Effect]) -> Effect:
+    def effect(card: Card, game_state: GameState):
+        for step in steps:
+            step(card, game_state)
+    return effect
+
+
+class SkillCompiler:
+    """
+    Compiles and caches the skill DSL of raw database cards (sword.json and
+    the other class files), one dict of Effects per card id.
+
+    `lookup` resolves the card ids skills refer to (tokens to summon or put
+    into the hand), usually CardDatabase.get_definition, and `index` answers
+    their card filters, usually CardDatabase.index. `parse` turns a DSL
+    field into its tree, e.g. a SkillTrees cache's parse.
+    """
+    def __init__(self, lookup: DefinitionLookup, parse: Parse, index: CardIndex):
+        self.context = SkillContext(lookup, index)
+        self.parse = parse
+        self._compiled: Dict[str, Dict[str, Effect]] = {}
+
+    def compile(self, definition: CardDefinition) -> Dict[str, Effect]:
+        compiled = self._compiled.get(definition.card_id)
+        if compiled is None:
+            compiled = compile_skills(definition, self.context, self.parse)
+            self._compiled[definition.card_id] = compiled
+        return compiled
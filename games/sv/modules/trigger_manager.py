@@ -1,19 +1,29 @@
 # --- IMPORTS CORRECTED HERE ---
 from framework.core.card import Card
 from framework.scripting.lua_engine import LuaEngine
+from framework.utils.events import EventType
+from .effects import EffectLibrary
+from .keywords import FANFARE, LAST_WORDS
 
 # Forward reference to avoid circular import with SvEngine
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..engine import SvEngine
 
+# Card scripts live here, one file per card: <card_id>.lua
+SCRIPT_DIR = "games/sv/scripts"
+
 class TriggerManager:
     """
-    Listens for game events and triggers appropriate card effects via the Lua engine.
+    Listens for game events and triggers appropriate card effects.
+
+    Effects the native library can express (see effects.py) run as plain
+    Python calls; anything else falls back to the card's Lua script.
     """
     def __init__(self, engine: 'SvEngine'):
         self.engine = engine
         self.lua_engine: LuaEngine = engine.lua_engine
+        self.effects = EffectLibrary()
 
     def post_event(self, event_type: str, **kwargs):
         """
@@ -22,20 +32,36 @@ class TriggerManager:
         """
         if event_type == "on_play":
             card: Card = kwargs.get("card")
-            if "Fanfare" in card.get_property("effect_text", ""):
-                print(f"--- TriggerManager: Detected Fanfare for {card.name}. Running script. ---")
-                self._run_card_script(card, "on_fanfare")
+            if card.keywords & FANFARE:
+                if self.engine.events:
+                    self.engine.events.emit(EventType.TRIGGER, timing="Fanfare", card=card.name)
+                self._run_effect(card, "on_fanfare")
+            elif card.get_property("type") == "Spell":
+                effect = self.effects.get(card.definition, "on_spell")
+                if effect is not None:
+                    if self.engine.events:
+                        self.engine.events.emit(EventType.TRIGGER, timing="Spell", card=card.name)
+                    effect(card, self.engine.game_state)
         
         # We can add a new event for when a follower is destroyed
         elif event_type == "on_destroy":
             card: Card = kwargs.get("card")
-            if "Last Words" in card.get_property("effect_text", ""):
-                print(f"--- TriggerManager: Detected Last Words for {card.name}. Running script. ---")
-                self._run_card_script(card, "on_last_words")
+            if card.keywords & LAST_WORDS:
+                if self.engine.events:
+                    self.engine.events.emit(EventType.TRIGGER, timing="Last Words", card=card.name)
+                self._run_effect(card, "on_last_words")
+
 
+    def _run_effect(self, card: Card, function_name: str):
+        """Runs the card's native effect for this timing, or its Lua script if it has none."""
+        effect = self.effects.get(card.definition, function_name)
+        if effect is not None:
+            effect(card, self.engine.game_state)
+        else:
+            self._run_card_script(card, function_name)
 
     def _run_card_script(self, card: Card, function_name: str):
         """Helper to find the correct script path and execute it."""
-        script_path = f"games/sv/scripts/{card.card_id}.lua"
+        script_path = f"{SCRIPT_DIR}/{card.card_id}.lua"
         # The card and game_state are now passed from the engine to the run_script method
         self.lua_engine.run_script(script_path, function_name, card, self.engine.game_state)
\ No newline at end of file
@@ -0,0 +1,574 @@
+import random
+import struct
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from framework.core.card import Card
+from framework.core.card_definition import CardDefinition
+from framework.core.game_state import GameState, GameStateSnapshot
+from framework.core.player import Player
+from framework.simulation.action import Action
+from framework.utils.events import EventType
+from .database.db_loader import CardDatabase
+from .engine import SvEngine
+from .modules.action_space import ACTION_SPACE_SIZE, END_TURN_INDEX
+from .modules.effects import is_token_id, token_from_id
+
+# --- Binary layout ---
+# A replay is a header followed by a stream of one-byte records:
+#   0 .. ACTION_SPACE_SIZE-1  an action, as its index in SvActionSpace
+#   OP_KEYFRAME               '<I' payload length + keyframe payload
+#   OP_END                    '<b' winning seat, -1 for no winner
+# Replay files hold any number of replays, each prefixed by its '<I' length.
+MAGIC = b'TCGR'
+VERSION = 2
+OP_KEYFRAME = 0xFE
+OP_END = 0xFF
+assert ACTION_SPACE_SIZE < OP_KEYFRAME
+
+_U8 = struct.Struct('<B')
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_I8 = struct.Struct('<b')
+_KEYFRAME_HEAD = struct.Struct('<HbQ')    # turn_number, active_player_index, zobrist_hash
+_PLAYER = struct.Struct('<h?')            # life, has_decked_out
+_CARD = struct.Struct('<hh??BBhH')        # Card.snapshot() fields, in order
+# random.Random state: 624 Mersenne Twister words plus the position. Only
+# shuffle/choice/randint are used, so the cached gauss value is always None.
+_MT_STATE = struct.Struct('<625I')
+_MT_VERSION = 3
+_MT_WORDS = 624
+# Keyframes store a stream as the number of 32-bit words drawn since the
+# start of the game; this marks a full _MT_STATE instead (see _StreamCounter).
+RNG_FULL_STATE = 0xFFFFFFFF
+# Card number of a token: a card summoned mid-game rather than dealt from a
+# deck. Its card_id and state follow the zone lists (see encode_keyframe).
+TOKEN_NUMBER = 0xFFFF
+
+# Streams a replay consumes. The agent stream is not stored: replays never
+# ask agents for decisions.
+REPLAY_STREAMS = ('shuffle', 'effect')
+
+DEFAULT_KEYFRAME_INTERVAL = 10
+
+
+def _pack_str(buffer: bytearray, text: str):
+    data = text.encode('utf-8')
+    buffer += _U16.pack(len(data))
+    buffer += data
+
+
+def _turn_ordinal(turn_number: int, active_player_index: int, num_players: int) -> int:
+    """Counts player turns from 0: (turn 1, seat 0) is 0, (turn 1, seat 1) is 1..."""
+    return (turn_number - 1) * num_players + active_player_index
+
+
+class _Reader:
+    """Sequential reads over a bytes-like object."""
+    __slots__ = ('data', 'offset')
+
+    def __init__(self, data, offset: int = 0):
+        self.data = data
+        self.offset = offset
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def u8(self) -> int:
+        return self.unpack(_U8)[0]
+
+    def u16(self) -> int:
+        return self.unpack(_U16)[0]
+
+    def string(self) -> str:
+        length = self.u16()
+        text = bytes(self.data[self.offset:self.offset + length]).decode('utf-8')
+        self.offset += length
+        return text
+
+
+# --- Keyframe codec ---
+# A keyframe is the state at the start of a player turn, before the turn's
+# PP refresh and draw. Cards are referred to by their number: their position
+# in the two decks (seat 0 first) right after setup_deck, which the replay
+# reproduces from the deck lists and the seed. Only cards whose state differs
+# from their state at that moment are stored.
+
+def _encode_values(buffer: bytearray, values: tuple):
+    """Small ints and bools, e.g. a resource manager snapshot."""
+    bool_mask = 0
+    for i, value in enumerate(values):
+        if isinstance(value, bool):
+            bool_mask |= 1 << i
+    buffer += struct.pack(f'<BB{len(values)}h', len(values), bool_mask, *values)
+
+
+def _decode_values(reader: _Reader) -> tuple:
+    count, bool_mask = reader.unpack(struct.Struct('<BB'))
+    values = reader.unpack(struct.Struct(f'<{count}h'))
+    return tuple(bool(value) if bool_mask >> i & 1 else value for i, value in enumerate(values))
+
+
+class _StreamCounter:
+    """
+    Counts the 32-bit words a random stream has drawn since its baseline
+    state. Every draw the engine makes (shuffle, choice, randint) consumes
+    whole words, so that count is enough to rebuild the stream, and it takes
+    4 bytes where the state takes 2.5 KB.
+    """
+    MAX_CYCLES = 64
+
+    def __init__(self, baseline):
+        self.probe = random.Random()
+        self.probe.setstate(baseline)
+        self.words: Optional[int] = 0
+
+    def count(self, stream: random.Random) -> Optional[int]:
+        """The words `stream` has drawn so far, or None if it cannot be found within MAX_CYCLES."""
+        if self.words is None:
+            return None
+        target = stream.getstate()
+        probe = self.probe
+        # The state's last element is its position in the 624-word block, so
+        # only whole blocks past the position difference need comparing.
+        step = (target[1][-1] - probe.getstate()[1][-1]) % _MT_WORDS
+        for _ in range(self.MAX_CYCLES):
+            if step:
+                probe.getrandbits(32 * step)
+                self.words += step
+            if probe.getstate() == target:
+                return self.words
+            step = _MT_WORDS
+        self.words = None
+        return None
+
+
+def encode_keyframe(game_state: GameState, numbers: Dict[Card, int], initial_states: List[tuple],
+                    rng_counters: Dict[str, _StreamCounter]) -> bytes:
+    """
+    Serializes `game_state`. `numbers` maps every card to its card number and
+    `initial_states` holds each card's snapshot() at the start of the game.
+    Cards missing from `numbers` are tokens, stored by card_id and full state.
+    Each replay stream is stored as its word count from `rng_counters`.
+    """
+    buffer = bytearray(_KEYFRAME_HEAD.pack(game_state.turn_number, game_state.active_player_index,
+                                           game_state.zobrist_hash))
+    tokens: List[Card] = []
+    for player in game_state.players:
+        buffer += _PLAYER.pack(player.life, player.has_decked_out)
+        _encode_values(buffer, player.resources.snapshot() if player.resources is not None else ())
+        for zone in player.zones.values():
+            zone_numbers = []
+            for card in zone.cards:
+                number = numbers.get(card)
+                if number is None:
+                    tokens.append(card)
+                    number = TOKEN_NUMBER
+                zone_numbers.append(number)
+            buffer += _U16.pack(len(zone_numbers))
+            buffer += struct.pack(f'<{len(zone_numbers)}H', *zone_numbers)
+    for token in tokens:
+        _pack_str(buffer, token.card_id)
+        buffer += _CARD.pack(*token.snapshot())
+    changed = [(number, card.snapshot()) for card, number in numbers.items()]
+    changed = [(number, state) for number, state in changed if state != initial_states[number]]
+    buffer += _U16.pack(len(changed))
+    for number, state in changed:
+        buffer += _U16.pack(number)
+        buffer += _CARD.pack(*state)
+    for name in REPLAY_STREAMS:
+        stream = getattr(game_state.rng, name)
+        words = rng_counters[name].count(stream)
+        if words is not None:
+            buffer += _U32.pack(words)
+        else:
+            buffer += _U32.pack(RNG_FULL_STATE)
+            buffer += _MT_STATE.pack(*stream.getstate()[1])
+    return bytes(buffer)
+
+
+def decode_keyframe(game_state: GameState, cards: List[Card], payload, initial_states: List[tuple],
+                    rng_baseline: Dict[str, object],
+                    lookup: Callable[[str], CardDefinition] = token_from_id) -> GameStateSnapshot:
+    """
+    Rebuilds a GameStateSnapshot from a keyframe, with `cards` and
+    `initial_states` indexed by card number. Tokens are rebuilt from their
+    card_id with `lookup`. The random streams are set on
+    game_state.rng directly, by advancing each from `rng_baseline`.
+    """
+    reader = _Reader(payload)
+    turn_number, active_player_index, zobrist_hash = reader.unpack(_KEYFRAME_HEAD)
+    players = []
+    zone_numbers = []
+    for player in game_state.players:
+        life, has_decked_out = reader.unpack(_PLAYER)
+        players.append((life, has_decked_out, _decode_values(reader)))
+        for zone in player.zones.values():
+            count = reader.u16()
+            zone_numbers.append((zone, reader.unpack(struct.Struct(f'<{count}H'))))
+    # Tokens are rebuilt as new cards, in the order the zone lists refer to them.
+    tokens = []
+    for _ in range(sum(numbers.count(TOKEN_NUMBER) for _, numbers in zone_numbers)):
+        card = Card(lookup(reader.string()))
+        tokens.append((card, reader.unpack(_CARD)))
+    tokens.reverse()
+    states = list(initial_states)
+    for _ in range(reader.u16()):
+        number = reader.u16()
+        states[number] = reader.unpack(_CARD)
+    zones = []
+    for zone, numbers in zone_numbers:
+        zone_cards, zone_states = [], []
+        for number in numbers:
+            card, state = tokens.pop() if number == TOKEN_NUMBER else (cards[number], states[number])
+            zone_cards.append(card)
+            zone_states.append(state)
+        zones.append((zone, tuple(zone_cards), tuple(zone_states)))
+    zones = tuple(zones)
+    for name in REPLAY_STREAMS:
+        stream = getattr(game_state.rng, name)
+        words = reader.unpack(_U32)[0]
+        if words == RNG_FULL_STATE:
+            stream.setstate((_MT_VERSION, reader.unpack(_MT_STATE), None))
+        else:
+            stream.setstate(rng_baseline[name])
+            if words:
+                stream.getrandbits(32 * words)
+    return GameStateSnapshot(turn_number, active_player_index, tuple(players), zones, zobrist_hash)
+
+
+# --- Recording ---
+
+class ReplayRecorder:
+    """
+    Records one game at a time in the compact replay format, for
+    GameSimulator.run(recorder=...).
+
+    Stores the game mode, the seed, each seat's name and deck list, the
+    action indices chosen (one byte each) and a keyframe every
+    `keyframe_interval` player turns so Replayer.seek() never has to replay
+    from the very start. With the default interval a typical game takes
+    about 1.5 KB.
+    """
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1.")
+        self.keyframe_interval = keyframe_interval
+        self._buffer = bytearray()
+        self._players: List[Player] = []
+        self._numbers: Dict[Card, int] = {}
+        self._initial_states: List[tuple] = []
+        self._rng_counters: Dict[str, _StreamCounter] = {}
+        self._turns = 0
+        self._finished = False
+
+    def begin(self, game_state: GameState):
+        """Starts a new recording. Called after the decks are set up, before setup_game."""
+        engine = game_state.game_engine
+        card_ids = sorted({card_id for player in game_state.players for card_id in player.deck_list})
+        string_index = {card_id: i for i, card_id in enumerate(card_ids)}
+
+        buffer = bytearray(MAGIC)
+        buffer += _U8.pack(VERSION)
+        _pack_str(buffer, engine.game_mode)
+        seed = game_state.rng.seed
+        buffer += _U8.pack(isinstance(seed, int))
+        _pack_str(buffer, str(seed))
+        buffer += _U16.pack(len(card_ids))
+        for card_id in card_ids:
+            _pack_str(buffer, card_id)
+        buffer += _U8.pack(len(game_state.players))
+        for player in game_state.players:
+            _pack_str(buffer, player.name)
+            buffer += _U8.pack(player.deck_shuffled)
+            buffer += _U16.pack(len(player.deck_list))
+            buffer += struct.pack(f'<{len(player.deck_list)}H', *[string_index[c] for c in player.deck_list])
+
+        self._buffer = buffer
+        self._players = list(game_state.players)
+        self._numbers = _number_cards(game_state)
+        self._initial_states = [card.snapshot() for card in self._numbers]
+        self._rng_counters = {name: _StreamCounter(getattr(game_state.rng, name).getstate())
+                              for name in REPLAY_STREAMS}
+        self._turns = 0
+        self._finished = False
+
+    def turn_start(self, game_state: GameState):
+        """Called at the top of every player turn; writes a keyframe when one is due."""
+        if self._turns and self._turns % self.keyframe_interval == 0:
+            payload = encode_keyframe(game_state, self._numbers, self._initial_states, self._rng_counters)
+            self._buffer += _U8.pack(OP_KEYFRAME)
+            self._buffer += _U32.pack(len(payload))
+            self._buffer += payload
+        self._turns += 1
+
+    def action(self, game_state: GameState, action: Action):
+        """Called with each chosen action, before it is applied."""
+        self._buffer.append(game_state.game_engine.action_space.encode(game_state, action))
+
+    def finish(self, winner: Optional[Player]):
+        """Called once the game is over, with its winner or None."""
+        seat = self._players.index(winner) if winner is not None else -1
+        self._buffer += _U8.pack(OP_END)
+        self._buffer += _I8.pack(seat)
+        self._finished = True
+
+    def getvalue(self) -> bytes:
+        """The finished recording."""
+        if not self._finished:
+            raise RuntimeError("The recorded game has not finished.")
+        return bytes(self._buffer)
+
+
+def _number_cards(game_state: GameState) -> Dict[Card, int]:
+    numbers: Dict[Card, int] = {}
+    for player in game_state.players:
+        for card in player.deck.cards:
+            numbers[card] = len(numbers)
+    return numbers
+
+
+# --- Reading ---
+
+@dataclass
+class Keyframe:
+    """A stored state at the start of a player turn."""
+    turn: int                 # Player-turn ordinal (see Replay.turn_ordinal)
+    action_position: int      # Number of actions applied before this point
+    payload: bytes
+
+
+@dataclass
+class Replay:
+    """A parsed replay: everything needed to re-execute one recorded game."""
+    game_mode: str
+    seed: object
+    player_names: List[str]
+    deck_lists: List[List[str]]
+    deck_shuffled: List[bool]
+    actions: bytes
+    keyframes: List[Keyframe] = field(default_factory=list)
+    winner_seat: Optional[int] = None
+
+    def turn_ordinal(self, turn_number: int, seat: int = 0) -> int:
+        return _turn_ordinal(turn_number, seat, len(self.player_names))
+
+    @classmethod
+    def from_bytes(cls, data) -> 'Replay':
+        reader = _Reader(memoryview(data))
+        if bytes(reader.data[:4]) != MAGIC:
+            raise ValueError("Not a replay: bad magic bytes.")
+        reader.offset = 4
+        version = reader.u8()
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}.")
+        game_mode = reader.string()
+        seed_is_int = reader.u8()
+        seed = reader.string()
+        seed = int(seed) if seed_is_int else seed
+        card_ids = [reader.string() for _ in range(reader.u16())]
+        names, deck_lists, shuffled = [], [], []
+        for _ in range(reader.u8()):
+            names.append(reader.string())
+            shuffled.append(bool(reader.u8()))
+            count = reader.u16()
+            deck_lists.append([card_ids[i] for i in reader.unpack(struct.Struct(f'<{count}H'))])
+
+        actions = bytearray()
+        keyframes: List[Keyframe] = []
+        winner_seat = None
+        data, offset = reader.data, reader.offset
+        end = len(data)
+        while offset < end:
+            opcode = data[offset]
+            offset += 1
+            if opcode < OP_KEYFRAME:
+                actions.append(opcode)
+            elif opcode == OP_KEYFRAME:
+                length, = _U32.unpack_from(data, offset)
+                offset += _U32.size
+                payload = bytes(data[offset:offset + length])
+                offset += length
+                turn_number, active_player_index, _ = _KEYFRAME_HEAD.unpack_from(payload)
+                keyframes.append(Keyframe(_turn_ordinal(turn_number, active_player_index, len(names)),
+                                          len(actions), payload))
+            else:
+                seat, = _I8.unpack_from(data, offset)
+                offset += _I8.size
+                winner_seat = seat if seat >= 0 else None
+                break
+        return cls(game_mode, seed, names, deck_lists, shuffled, bytes(actions), keyframes, winner_seat)
+
+
+def write_replay(stream: BinaryIO, data: bytes):
+    """Appends one recorded game to a replay file."""
+    stream.write(_U32.pack(len(data)))
+    stream.write(data)
+
+
+def read_replays(stream: BinaryIO) -> Iterator[Replay]:
+    """Yields every game stored in a replay file, in order."""
+    while True:
+        head = stream.read(_U32.size)
+        if len(head) < _U32.size:
+            return
+        length, = _U32.unpack(head)
+        yield Replay.from_bytes(stream.read(length))
+
+
+# --- Re-execution ---
+
+class Replayer:
+    """
+    Re-executes a Replay through SvEngine.apply_action, without agents.
+
+    The replayer follows GameSimulator's turn loop exactly (PP refresh and
+    draw at the start of each turn, win check after each action, END_TURN
+    ends the turn), so the positions it produces are the ones the original
+    game went through. seek() jumps to a turn from the nearest keyframe.
+    """
+    def __init__(self, replay: Replay, db: CardDatabase, engine: Optional[SvEngine] = None):
+        self.replay = replay
+        self.db = db
+        self.engine = engine if engine is not None else SvEngine(game_mode=replay.game_mode, card_db=db)
+        self.game_state: Optional[GameState] = None
+        self.cards: List[Card] = []
+        self._initial_states: List[tuple] = []
+        self._rng_baseline: Dict[str, object] = {}
+        # Number of actions applied so far, and whether the current turn's
+        # PP refresh and draw have happened.
+        self.position = 0
+        self.turn_started = False
+        self.winner: Optional[Player] = None
+        self.reset()
+
+    @property
+    def finished(self) -> bool:
+        return self.winner is not None or self.position >= len(self.replay.actions)
+
+    @property
+    def turn(self) -> int:
+        """The current player-turn ordinal (see Replay.turn_ordinal)."""
+        game_state = self.game_state
+        return _turn_ordinal(game_state.turn_number, game_state.active_player_index, len(game_state.players))
+
+    def reset(self) -> GameState:
+        """Rebuilds the game from its seed and deck lists, at the start of turn 1."""
+        replay = self.replay
+        players = [Player(name=name) for name in replay.player_names]
+        game_state = GameState(players=players, game_engine=self.engine, seed=replay.seed)
+        for player, deck_list, shuffled in zip(players, replay.deck_lists, replay.deck_shuffled):
+            player.setup_deck([Card(self.db.get_definition(card_id)) for card_id in deck_list], shuffle=shuffled)
+        self.cards = list(_number_cards(game_state))
+        self._initial_states = [card.snapshot() for card in self.cards]
+        self._rng_baseline = {name: getattr(game_state.rng, name).getstate() for name in REPLAY_STREAMS}
+        self.engine.setup_game(game_state)
+        game_state.start_game()
+        self.game_state = game_state
+        self.position = 0
+        self.turn_started = False
+        self.winner = None
+        return game_state
+
+    def step(self) -> Optional[int]:
+        """
+        Applies the next recorded action, starting the turn first if needed.
+        Returns the action index applied, or None when the game is over.
+        """
+        if self.finished:
+            return None
+        if not self.turn_started:
+            self._start_turn()
+        game_state = self.game_state
+        index = self.replay.actions[self.position]
+        events = self.engine.events
+        player = game_state.active_player
+        if events:
+            action = self.engine.action_space.decode(game_state, index)
+            self.engine.apply_action(game_state, action)
+        else:
+            self.engine.apply_action_index(game_state, index)
+        self.position += 1
+        if events:
+            events.emit(EventType.ACTION_APPLIED, game_state=game_state, player=player.name, action=action)
+
+        self.winner = self.engine.check_win_condition(game_state)
+        if self.winner is not None:
+            if events:
+                events.emit(EventType.GAME_OVER, winner=self.winner.name)
+        elif index == END_TURN_INDEX:
+            game_state.end_turn()
+            self.turn_started = False
+        return index
+
+    def run(self) -> Optional[Player]:
+        """Applies every remaining action and returns the winner, if any."""
+        while self.step() is not None:
+            pass
+        return self.winner
+
+    def positions(self) -> Iterator[Tuple[GameState, int]]:
+        """
+        Yields (game_state, action_index) at every decision point from here to
+        the end: the state the acting player saw and the action it chose.
+        The state is live; snapshot or encode it before advancing.
+        """
+        actions = self.replay.actions
+        while not self.finished:
+            if not self.turn_started:
+                self._start_turn()
+            yield self.game_state, actions[self.position]
+            self.step()
+
+    def seek(self, turn_number: int, seat: int = 0) -> GameState:
+        """
+        Moves to the start of `seat`'s turn `turn_number`, after the draw,
+        restoring the nearest earlier keyframe instead of replaying from turn 1
+        when that is shorter. Seeking past the end stops at the final position.
+        """
+        target = self.replay.turn_ordinal(turn_number, seat)
+        keyframe = None
+        for candidate in self.replay.keyframes:
+            if candidate.turn > target:
+                break
+            keyframe = candidate
+        # The next turn start ahead of the current position. Replaying forward
+        # from here is only skipped when it is past the target or a keyframe
+        # lies between it and the target.
+        next_turn = self.turn + 1 if self.turn_started else self.turn
+        if next_turn > target or (keyframe is not None and keyframe.turn > next_turn):
+            if keyframe is not None:
+                self._restore(keyframe)
+            else:
+                self.reset()
+
+        while not self.finished:
+            if not self.turn_started:
+                self._start_turn()
+                if self.turn >= target:
+                    break
+            self.step()
+        return self.game_state
+
+    def _start_turn(self):
+        game_state = self.game_state
+        player = game_state.active_player
+        if player.resources:
+            player.resources.start_turn()
+        player.draw_card(game_state)
+        self.turn_started = True
+        if self.engine.events:
+            self.engine.events.emit(EventType.TURN_BEGIN, game_state=game_state)
+
+    def _definition(self, card_id: str) -> CardDefinition:
+        return token_from_id(card_id) if is_token_id(card_id) else self.db.get_definition(card_id)
+
+    def _restore(self, keyframe: Keyframe):
+        game_state = self.game_state
+        game_state.restore(decode_keyframe(game_state, self.cards, keyframe.payload, self._initial_states,
+                                           self._rng_baseline, self._definition))
+        self.position = keyframe.action_position
+        self.turn_started = False
+        self.winner = None
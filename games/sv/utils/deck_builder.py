@@ -1,22 +1,59 @@
 import os
 import json
+import hashlib
 from collections import Counter
-from typing import List, Dict, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Any, Optional
 
+from framework.utils.files import write_atomic
 from ..database.db_loader import CardDatabase
 
+# Validation results are cached in this JSON file of the deck folder. Bump
+# the version whenever the rules change so cached results are redone.
+DECK_CACHE_FILE = '.deck_cache'
+DECK_CACHE_VERSION = 1
+
+# filename -> (size, mtime_ns, content digest, deck name, deck data if valid else None, reason)
+DeckEntry = Tuple[int, int, str, str, Optional[Dict[str, Any]], str]
+
+
+def _cache_entry(value: Any) -> DeckEntry:
+    """A DeckEntry read back from the cache file; raises ValueError if it is malformed."""
+    size, mtime_ns, digest, deck_name, deck_data, reason = value
+    if not (isinstance(size, int) and isinstance(mtime_ns, int) and isinstance(digest, str)
+            and isinstance(deck_name, str) and isinstance(reason, str)
+            and (deck_data is None or isinstance(deck_data, dict))):
+        raise ValueError("malformed deck cache entry")
+    return size, mtime_ns, digest, deck_name, deck_data, reason
+
+
 class DeckValidator:
     """
     Validates a decklist against a given set of game rules.
     """
     def __init__(self, db: CardDatabase):
         self.db = db
+        # card ID -> (card ID it is a printing of, class, name), or None if unknown.
+        # Shared by every deck validated, so each card is looked up once.
+        self._cards: Dict[str, Optional[Tuple[str, str, str]]] = {}
+
+    def _card(self, card_id: str) -> Optional[Tuple[str, str, str]]:
+        try:
+            return self._cards[card_id]
+        except KeyError:
+            pass
+        try:
+            data = self.db.get_card_data(card_id)
+            card = (self.db.aliases.get(card_id, card_id), data.get('class'), data.get('name', card_id))
+        except KeyError:
+            card = None
+        self._cards[card_id] = card
+        return card
 
     def validate(self, deck_data: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Checks a deck data object against SV rules.
         """
-        # --- LOGIC UPDATED TO USE THE DECK_DATA OBJECT ---
         deck_class = deck_data.get('class')
         card_ids = deck_data.get('cardIds', [])
 
@@ -27,23 +64,25 @@ class DeckValidator:
         if len(card_ids) != 40:
             return False, f"Deck must contain 40 cards, but it has {len(card_ids)}."
 
-        # Rule 2: Card Copies
-        counts = Counter(card_ids)
+        # Rule 2: Card Existence, each distinct card looked up once
+        cards = {}
+        for card_id in dict.fromkeys(card_ids):
+            card = self._card(card_id)
+            if card is None:
+                return False, f"Deck contains an invalid Card ID: '{card_id}'."
+            cards[card_id] = card
+
+        # Rule 3: Card Copies. Printings of the same card share its limit.
+        counts = Counter(cards[card_id][0] for card_id in card_ids)
         for card_id, count in counts.items():
             if count > 3:
-                card_name = self.db.get_card_data(card_id).get('name', card_id)
+                card_name = self._card(card_id)[2]
                 return False, f"Deck contains {count} copies of '{card_name}'. Max is 3."
 
-        # Rule 3 & 4: Card Existence and Class Allegiance
-        for card_id in counts.keys():
-            try:
-                card_data = self.db.get_card_data(card_id)
-                card_class = card_data.get('class')
-                if card_class not in [deck_class, 'Neutral']:
-                    card_name = card_data.get('name', card_id)
-                    return False, f"'{deck_class}' deck contains a '{card_class}' card: '{card_name}'."
-            except KeyError:
-                return False, f"Deck contains an invalid Card ID: '{card_id}'."
+        # Rule 4: Class Allegiance
+        for _, card_class, card_name in cards.values():
+            if card_class not in [deck_class, 'Neutral']:
+                return False, f"'{deck_class}' deck contains a '{card_class}' card: '{card_name}'."
 
         return True, "Deck is valid."
 
@@ -51,10 +90,21 @@ class DeckValidator:
 class DeckLoader:
     """
     Loads and validates all deck files from a specified directory.
+
+    With `cache`, validation results are kept in a DECK_CACHE_FILE in the
+    folder, keyed by each file's content hash and the card database's
+    fingerprint: unchanged decks are neither read nor validated again. The
+    cache is plain JSON, as the folder may hold decks from anywhere.
+    Files that are new or changed are read and validated on a pool of
+    `workers` threads.
     """
-    def __init__(self, deck_folder_path: str, db: CardDatabase):
+    def __init__(self, deck_folder_path: str, db: CardDatabase, cache: bool = True,
+                 workers: Optional[int] = None):
         self.deck_folder_path = deck_folder_path
         self.validator = DeckValidator(db)
+        self.db = db
+        self.cache_path = os.path.join(deck_folder_path, DECK_CACHE_FILE) if cache else None
+        self.workers = workers
         self.valid_decks: Dict[str, Dict[str, Any]] = self._load_decks()
 
     def _load_decks(self) -> Dict[str, Dict[str, Any]]:
@@ -64,21 +114,91 @@ class DeckLoader:
         if not os.path.isdir(self.deck_folder_path):
             print(f"Warning: Deck directory not found at '{self.deck_folder_path}'")
             return loaded_decks
-            
-        for filename in os.listdir(self.deck_folder_path):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.deck_folder_path, filename)
-                with open(filepath, 'r') as f:
-                    deck_data = json.load(f)
-                
-                is_valid, reason = self.validator.validate(deck_data)
-                deck_name = deck_data.get("deckName", filename)
-                if is_valid:
+
+        cached = self._read_cache()
+        entries: Dict[str, DeckEntry] = {}
+        # (filename, size, mtime_ns, cached entry) of the files to read
+        pending = []
+        with os.scandir(self.deck_folder_path) as scan:
+            files = sorted((entry for entry in scan if entry.name.endswith('.json') and entry.is_file()),
+                           key=lambda entry: entry.name)
+        for entry in files:
+            stat = entry.stat()
+            previous = cached.get(entry.name)
+            if previous is not None and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                entries[entry.name] = previous
+            else:
+                pending.append((entry.name, stat.st_size, stat.st_mtime_ns, previous))
+
+        if pending:
+            for (filename, *_), entry in zip(pending, self._load_files(pending)):
+                entries[filename] = entry
+                deck_data, deck_name = entry[4], entry[3]
+                if deck_data is not None:
                     print(f"  > '{deck_name}' ({deck_data.get('class')}) loaded successfully.")
-                    # Use filename as the key, and store the whole data object
-                    loaded_decks[filename] = deck_data
-                else:
-                    print(f"  > Skipped '{deck_name}': {reason}")
-        
+
+        skipped = 0
+        for filename, (_, _, _, deck_name, deck_data, reason) in sorted(entries.items()):
+            if deck_data is not None:
+                # Use filename as the key, and store the whole data object
+                loaded_decks[filename] = deck_data
+            else:
+                skipped += 1
+                print(f"  > Skipped '{deck_name}': {reason}")
+
+        if pending or entries.keys() != cached.keys():
+            self._write_cache(entries)
+        print(f"Loaded {len(loaded_decks)} deck(s) and skipped {skipped}; "
+              f"{len(entries) - len(pending)} were unchanged since the last scan.")
         print("--- Deck Loading Complete ---\n")
-        return loaded_decks
\ No newline at end of file
+        return loaded_decks
+
+    def _load_files(self, tasks: List[Tuple[str, int, int, Optional[DeckEntry]]]) -> List[DeckEntry]:
+        """_load_file() for each task, in order, spread over the thread pool a few chunks per worker."""
+        workers = self.workers or min(32, (os.cpu_count() or 1) + 4)
+        if workers <= 1 or len(tasks) == 1:
+            return [self._load_file(task) for task in tasks]
+        size = -(-len(tasks) // (workers * 4))
+        chunks = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            loaded = pool.map(lambda chunk: [self._load_file(task) for task in chunk], chunks)
+            return [entry for chunk in loaded for entry in chunk]
+
+    def _load_file(self, task: Tuple[str, int, int, Optional[DeckEntry]]) -> DeckEntry:
+        """Reads and validates one deck file, unless its content matches the cached entry."""
+        filename, size, mtime_ns, previous = task
+        with open(os.path.join(self.deck_folder_path, filename), 'rb') as f:
+            content = f.read()
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        if previous is not None and previous[2] == digest:
+            # Touched but unchanged.
+            return (size, mtime_ns) + previous[2:]
+        try:
+            deck_data = json.loads(content)
+            if not isinstance(deck_data, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            return size, mtime_ns, digest, filename, None, f"Could not read the deck file: {e}"
+        is_valid, reason = self.validator.validate(deck_data)
+        deck_name = deck_data.get("deckName", filename)
+        return size, mtime_ns, digest, deck_name, deck_data if is_valid else None, reason
+
+    def _read_cache(self) -> Dict[str, DeckEntry]:
+        """The cached entries, if they were validated against the same rules and cards."""
+        if self.cache_path is None or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if (cache['version'], cache['fingerprint']) != (DECK_CACHE_VERSION, self.db.fingerprint()):
+                return {}
+            return {filename: _cache_entry(entry) for filename, entry in cache['entries'].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # A damaged cache is rebuilt from the deck files.
+            return {}
+
+    def _write_cache(self, entries: Dict[str, DeckEntry]):
+        """The cache is only an optimization, so a failed write is ignored."""
+        if self.cache_path is not None:
+            cache = {'version': DECK_CACHE_VERSION, 'fingerprint': self.db.fingerprint(), 'entries': entries}
+            write_atomic(self.cache_path, json.dumps(cache, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
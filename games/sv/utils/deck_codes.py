@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import re
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from framework.utils.files import iter_json_array
+from ..database.importer import RAW_CLANS
+
+# --- Deck hashes ---
+# Shadowverse Portal names a deck by a hash such as "1.2.61kpO.61kpO...":
+# the deck format, the clan (1-8, Forestcraft to Portalcraft), then each
+# card ID in base 64, five digits per card, from this alphabet.
+HASH_ALPHABET = '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-_'
+_DIGITS = {digit: value for value, digit in enumerate(HASH_ALPHABET)}
+_CARD_DIGITS = 5
+
+# --- Deck codes ---
+# Deck codes are the 4-character codes the game shows; only the portal can
+# turn one into its deck hash (see shadowverse_api_documentation.md).
+PORTAL_API = 'https://shadowverse-portal.com/api/v1'
+_DECK_CODE = re.compile(r'[A-Za-z0-9]{4}')
+_DECK_URL = re.compile(r'shadowverse-portal\.com/deck/([^?#/\s]+)')
+
+
+def encode_deck_hash(clan: int, card_ids: Sequence[str], deck_format: int = 1) -> str:
+    """The portal hash of a deck of raw card IDs."""
+    digits = []
+    for card_id in card_ids:
+        value = int(card_id)
+        card = ''
+        for _ in range(_CARD_DIGITS):
+            value, digit = divmod(value, len(HASH_ALPHABET))
+            card = HASH_ALPHABET[digit] + card
+        if value:
+            raise ValueError(f"Card ID {card_id} does not fit in a deck hash.")
+        digits.append(card)
+    return '.'.join([str(deck_format), str(clan)] + digits)
+
+
+def decode_deck_hash(deck_hash: str) -> Tuple[int, int, List[str]]:
+    """Splits a portal deck hash into (deck format, clan, card IDs). Raises ValueError if malformed."""
+    parts = deck_hash.strip().split('.')
+    if len(parts) < 3 or not parts[0].isdigit() or not parts[1].isdigit():
+        raise ValueError(f"'{deck_hash}' is not a deck hash.")
+    card_ids = []
+    for card in parts[2:]:
+        if len(card) != _CARD_DIGITS or any(digit not in _DIGITS for digit in card):
+            raise ValueError(f"'{card}' in deck hash '{deck_hash}' is not a card.")
+        value = 0
+        for digit in card:
+            value = value * len(HASH_ALPHABET) + _DIGITS[digit]
+        card_ids.append(str(value))
+    return int(parts[0]), int(parts[1]), card_ids
+
+
+def _deck(clan: int, card_ids: List[str], deck_hash: str, name: Optional[str]) -> Dict[str, Any]:
+    if clan not in RAW_CLANS or clan == 0:
+        raise ValueError(f"Deck '{deck_hash}' has no class (clan {clan}).")
+    deck_class = RAW_CLANS[clan]
+    return {'deckName': name or f"{deck_class} {deck_hash_name(deck_hash)}", 'class': deck_class,
+            'cardIds': card_ids, 'deckHash': deck_hash}
+
+
+def deck_hash_name(deck_hash: str) -> str:
+    """A short, stable name for a deck hash, used for imported deck files."""
+    return hashlib.blake2b(deck_hash.encode('ascii'), digest_size=6).hexdigest()
+
+
+def deck_from_hash(deck_hash: str, name: Optional[str] = None) -> Dict[str, Any]:
+    """The deck data (as in games/sv/decks) of a portal deck hash."""
+    _, clan, card_ids = decode_deck_hash(deck_hash)
+    return _deck(clan, card_ids, deck_hash.strip(), name)
+
+
+def deck_from_portal(response: Dict[str, Any], name: Optional[str] = None) -> Dict[str, Any]:
+    """The deck data of a response of the portal's "Fetching Deck from Deck Code" endpoint."""
+    deck = response.get('data', {}).get('deck')
+    if not deck or not deck.get('cards'):
+        raise ValueError("The response holds no deck.")
+    card_ids = [str(card['card_id']) for card in deck['cards']]
+    clan = int(deck.get('clan') or 0)
+    return _deck(clan, card_ids, encode_deck_hash(clan, card_ids, deck.get('deck_format') or 1), name)
+
+
+def resolve_deck_code(code: str, timeout: float = 10) -> str:
+    """
+    Asks the portal for the hash of a 4-character deck code. Raises
+    ValueError if the portal rejects the code and OSError if it cannot be
+    reached.
+    """
+    query = urllib.parse.urlencode({'format': 'json', 'deck_code': code})
+    with urllib.request.urlopen(f"{PORTAL_API}/deck/import?{query}", timeout=timeout) as response:
+        data = json.load(response).get('data', {})
+    errors = data.get('errors') or []
+    if errors or not data.get('hash'):
+        message = errors[0].get('error') if errors and isinstance(errors[0], dict) else "no deck hash returned"
+        raise ValueError(f"Deck code '{code}' was rejected: {message}")
+    return data['hash']
+
+
+def deck_from_ref(ref: str, name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    The deck data of a deck hash, a portal deck URL or a 4-character deck
+    code (resolved online).
+    """
+    ref = ref.strip()
+    match = _DECK_URL.search(ref)
+    if match:
+        ref = urllib.parse.unquote(match.group(1))
+    elif _DECK_CODE.fullmatch(ref):
+        ref = resolve_deck_code(ref)
+    return deck_from_hash(ref, name)
+
+
+def read_deck_refs(path: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Reads a list of decks to import: (deck reference, name) per line, the
+    name optional and separated by whitespace. Blank lines and lines
+    starting with '#' are skipped.
+    """
+    refs = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                ref, *name = line.split(None, 1)
+                refs.append((ref, name[0] if name else None))
+    return refs
+
+
+def _deck_sources(path: str) -> Iterable[Tuple[str, Any, Optional[str]]]:
+    """(label, reference or portal response, name) for each deck of an import file."""
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            first = f.read(1)
+        if first == '[':
+            # A saved list of portal responses, read one at a time.
+            for i, response in enumerate(iter_json_array(path)):
+                yield f"{path}[{i}]", response, None
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                yield path, json.load(f), None
+        return
+    for ref, name in read_deck_refs(path):
+        yield ref, ref, name
+
+
+def import_decks(paths: Sequence[str], out_dir: str, validator=None,
+                 workers: Optional[int] = None) -> List[Tuple[str, Optional[str], str]]:
+    """
+    Imports decks in bulk into deck files in `out_dir`. Each path is either
+    a list of deck references (see read_deck_refs) or a saved portal
+    response, or a JSON list of them. Deck codes are resolved on a pool of
+    `workers` threads. Each deck is written to deck_<hash name>.json, so
+    importing a deck again replaces its file.
+
+    With a DeckValidator, invalid decks are not written. Returns (deck,
+    written path or None, reason) for every deck.
+    """
+    sources = [source for path in paths for source in _deck_sources(path)]
+
+    def build(source: Tuple[str, Any, Optional[str]]) -> Tuple[Optional[Dict[str, Any]], str]:
+        _, ref, name = source
+        try:
+            deck = deck_from_ref(ref, name) if isinstance(ref, str) else deck_from_portal(ref, name)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            return None, str(e)
+        return deck, "Deck imported."
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        built = list(pool.map(build, sources))
+
+    os.makedirs(out_dir, exist_ok=True)
+    results = []
+    for (label, _, _), (deck, reason) in zip(sources, built):
+        if deck is not None and validator is not None:
+            is_valid, reason = validator.validate(deck)
+            if not is_valid:
+                deck = None
+        if deck is None:
+            results.append((label, None, reason))
+            continue
+        path = os.path.join(out_dir, f"deck_{deck_hash_name(deck['deckHash'])}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(deck, f, indent=4, ensure_ascii=False)
+        results.append((label, path, reason))
+    return results
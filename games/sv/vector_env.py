@@ -0,0 +1,430 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from .database.db_loader import CardDatabase
+from .modules.action_space import (
+    ACTION_SPACE_SIZE, ATTACK_OFFSET, BOARD_SLOTS, END_TURN_INDEX, EVOLVE_OFFSET,
+    HAND_SLOTS, PLAY_OFFSET, SUPER_EVOLVE_OFFSET, TARGET_SLOTS,
+)
+from .modules.keywords import FANFARE, LAST_WORDS, WARD, STORM, RUSH
+
+# --- Card kinds in the card table ---
+FOLLOWER = 0
+AMULET = 1
+SPELL = 2
+_KINDS = {"Follower": FOLLOWER, "Amulet": AMULET, "Spell": SPELL}
+
+# --- Board fields (last axis of SvVectorEnv.board) ---
+B_CODE = 0
+B_ATK = 1
+B_DEF = 2
+B_EVOLVED = 3
+B_ATTACKS = 4
+B_MAX_ATTACKS = 5
+B_TURN_PLAYED = 6
+B_KEYWORDS = 7
+B_RUSH_GAINED = 8
+BOARD_FIELDS = 9
+
+EMPTY = -1
+STARTING_LIFE = 20
+MAX_PP = 10
+
+
+class SvVectorEnv:
+    """
+    N independent SV games advanced in lockstep, stored as NumPy arrays.
+
+    Every piece of game state is one array with the game on the first axis
+    (and the seat on the second), so reset() and step() cost a fixed number
+    of NumPy operations per call instead of Python work per game.
+
+    The rules match SvEngine and SvActionGenerator for vanilla cards: PP,
+    playing followers/amulets/spells, attacking with Ward/Storm/Rush,
+    evolve, super evolve, hand limit, deck-out and the turn limit. Card
+    effects (Fanfare, Last Words, spell text) are not run, so decks with
+    such cards are rejected unless `ignore_effects` is set, in which case
+    they play as vanilla cards (their ids are kept in `ignored_effects`).
+
+    Actions and masks use the fixed layout of games/sv/modules/action_space.py.
+    Seat 0 always plays deck A and goes first.
+    """
+    def __init__(self, db: CardDatabase, deck_a: Sequence[str], deck_b: Sequence[str], num_envs: int,
+                 game_mode: str = 'SV', max_turns: int = 50, seed: Optional[int] = None,
+                 auto_reset: bool = True, ignore_effects: bool = False):
+        if game_mode not in ('SV', 'SVWB'):
+            raise ValueError("Invalid game mode specified for SvVectorEnv.")
+        if num_envs < 1:
+            raise ValueError("SvVectorEnv requires at least one environment.")
+        self.game_mode = game_mode
+        self.num_envs = num_envs
+        self.max_turns = max_turns
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+
+        # --- Card table: one row per distinct card id, indexed by card code ---
+        self.card_ids = sorted(set(deck_a) | set(deck_b))
+        codes = {card_id: code for code, card_id in enumerate(self.card_ids)}
+        size = len(self.card_ids)
+        self.card_kind = np.zeros(size, dtype=np.int16)
+        self.card_cost = np.zeros(size, dtype=np.int16)
+        self.card_atk = np.zeros(size, dtype=np.int16)
+        self.card_def = np.zeros(size, dtype=np.int16)
+        self.card_max_attacks = np.ones(size, dtype=np.int16)
+        self.card_keywords = np.zeros(size, dtype=np.int16)
+        self.ignored_effects = []
+        for card_id, code in codes.items():
+            try:
+                definition = db.get_definition(card_id)
+            except KeyError:
+                raise ValueError(f"Card '{card_id}' not found in the database.") from None
+            self.card_kind[code] = _KINDS.get(definition.get_property("type"), SPELL)
+            self.card_cost[code] = definition.get_property("cost", 0)
+            self.card_atk[code] = definition.get_property("atk") or 0
+            self.card_def[code] = definition.get_property("def") or 0
+            self.card_max_attacks[code] = definition.get_property("max_attacks", 1)
+            self.card_keywords[code] = definition.keywords
+            if definition.keywords & (FANFARE | LAST_WORDS) or (
+                    self.card_kind[code] == SPELL and definition.get_property("effect_text")):
+                self.ignored_effects.append(card_id)
+        if self.ignored_effects and not ignore_effects:
+            raise ValueError(f"SvVectorEnv does not run card effects, but these cards have them: "
+                             f"{', '.join(self.ignored_effects)}. Pass ignore_effects=True to play them as vanilla cards.")
+
+        deck_size = max(len(deck_a), len(deck_b))
+        self.decks = np.full((2, deck_size), EMPTY, dtype=np.int16)
+        self.deck_len = np.array([len(deck_a), len(deck_b)], dtype=np.int16)
+        self.decks[0, :len(deck_a)] = [codes[card_id] for card_id in deck_a]
+        self.decks[1, :len(deck_b)] = [codes[card_id] for card_id in deck_b]
+
+        # --- Game state (struct of arrays) ---
+        n = num_envs
+        self._rows = np.arange(n)
+        self.turn = np.zeros(n, dtype=np.int16)
+        self.active = np.zeros(n, dtype=np.intp)
+        self.done = np.zeros(n, dtype=np.bool_)
+        self.winner = np.full(n, EMPTY, dtype=np.int8)
+
+        self.life = np.zeros((n, 2), dtype=np.int16)
+        self.pp = np.zeros((n, 2), dtype=np.int16)
+        self.max_pp = np.zeros((n, 2), dtype=np.int16)
+        self.ep = np.zeros((n, 2), dtype=np.int16)
+        self.sep = np.zeros((n, 2), dtype=np.int16)
+        self.evolved_this_turn = np.zeros((n, 2), dtype=np.bool_)
+        self.decked_out = np.zeros((n, 2), dtype=np.bool_)
+
+        self.deck = np.full((n, 2, deck_size), EMPTY, dtype=np.int16)
+        self.deck_pos = np.zeros((n, 2), dtype=np.int16)
+        self.hand = np.full((n, 2, HAND_SLOTS), EMPTY, dtype=np.int16)
+        self.hand_count = np.zeros((n, 2), dtype=np.int16)
+        self.board = np.zeros((n, 2, BOARD_SLOTS, BOARD_FIELDS), dtype=np.int16)
+        self.board_count = np.zeros((n, 2), dtype=np.int16)
+        self.graveyard_count = np.zeros((n, 2), dtype=np.int16)
+
+        self.masks = np.zeros((n, ACTION_SPACE_SIZE), dtype=np.bool_)
+
+        # Completed-game statistics, across resets.
+        self.games_played = 0
+        self.wins = np.zeros(2, dtype=np.int64)
+        self.draws = 0
+        self.total_turns = 0
+
+    # --- Public API ---
+
+    def reset(self, envs: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Starts new games in `envs` (all environments by default): shuffles,
+        deals opening hands and begins seat 0's first turn.
+
+        Returns:
+            np.ndarray: The (num_envs, ACTION_SPACE_SIZE) legality masks.
+        """
+        e = self._rows if envs is None else np.asarray(envs, dtype=np.intp)
+        self.turn[e] = 1
+        self.active[e] = 0
+        self.done[e] = False
+        self.winner[e] = EMPTY
+
+        self.life[e] = STARTING_LIFE
+        self.pp[e] = 0
+        self.max_pp[e] = 0
+        self.evolved_this_turn[e] = False
+        self.decked_out[e] = False
+        if self.game_mode == 'SVWB':
+            self.ep[e] = 2
+            self.sep[e] = 2
+        else:
+            self.ep[e, 0] = 2
+            self.ep[e, 1] = 3
+            self.sep[e] = 0
+
+        for seat in (0, 1):
+            length = self.deck_len[seat]
+            decks = np.tile(self.decks[seat, :length], (len(e), 1))
+            self.deck[e, seat, :length] = self.rng.permuted(decks, axis=1)
+        self.deck_pos[e] = 0
+        self.hand[e] = EMPTY
+        self.hand_count[e] = 0
+        self.board[e] = 0
+        self.board[e, :, :, B_CODE] = EMPTY
+        self.board_count[e] = 0
+        self.graveyard_count[e] = 0
+
+        seats = np.zeros(len(e), dtype=np.intp)
+        hand_size = 4 if self.game_mode == 'SVWB' else 3
+        for _ in range(hand_size):
+            self._draw(e, seats)
+            self._draw(e, seats + 1)
+        self._draw(e, seats + 1) # The second player draws one extra card.
+
+        self._start_turn(e)
+        self._update_masks()
+        return self.masks
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Applies one action-space index per environment for its active player.
+        Entries for finished environments are ignored.
+
+        Returns:
+            Tuple of (masks, rewards, dones):
+                masks   (num_envs, ACTION_SPACE_SIZE) bool, legal actions for the next step.
+                rewards (num_envs, 2) float32, +1/-1 per seat for games that ended this step.
+                dones   (num_envs,) bool, True where a game ended this step. With
+                        auto_reset those environments already hold a new game.
+        """
+        actions = np.asarray(actions, dtype=np.intp)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"Expected {self.num_envs} actions, got shape {actions.shape}.")
+
+        live = ~self.done
+        e = self._rows[live]
+        a = actions[live]
+        if ((a < 0) | (a >= ACTION_SPACE_SIZE)).any() or not self.masks[e, a].all():
+            illegal = e[(a < 0) | (a >= ACTION_SPACE_SIZE) | ~self.masks[e, np.clip(a, 0, ACTION_SPACE_SIZE - 1)]]
+            raise ValueError(f"Illegal actions in environments {illegal[:10].tolist()}.")
+
+        is_play = a < ATTACK_OFFSET
+        is_attack = (a >= ATTACK_OFFSET) & (a < EVOLVE_OFFSET)
+        is_evolve = (a >= EVOLVE_OFFSET) & (a < SUPER_EVOLVE_OFFSET)
+        is_super = (a >= SUPER_EVOLVE_OFFSET) & (a < END_TURN_INDEX)
+        self._play(e[is_play], a[is_play] - PLAY_OFFSET)
+        self._attack(e[is_attack], a[is_attack] - ATTACK_OFFSET)
+        self._evolve(e[is_evolve], a[is_evolve] - EVOLVE_OFFSET)
+        self._super_evolve(e[is_super], a[is_super] - SUPER_EVOLVE_OFFSET)
+
+        self._check_winners(e)
+        ending = e[(a == END_TURN_INDEX) & ~self.done[e]]
+        self._end_turn(ending)
+
+        dones = live & self.done
+        rewards = np.zeros((self.num_envs, 2), dtype=np.float32)
+        finished = self._rows[dones]
+        if len(finished):
+            winners = self.winner[finished]
+            decided = winners >= 0
+            rewards[finished[decided], winners[decided]] = 1.0
+            rewards[finished[decided], 1 - winners[decided]] = -1.0
+            self.games_played += len(finished)
+            self.wins += np.bincount(winners[decided], minlength=2)
+            self.draws += int((~decided).sum())
+            self.total_turns += int(self.turn[finished].astype(np.int64).sum())
+            if self.auto_reset:
+                self.reset(finished)
+                return self.masks, rewards, dones
+
+        self._update_masks()
+        return self.masks, rewards, dones
+
+    def sample_actions(self, masks: Optional[np.ndarray] = None) -> np.ndarray:
+        """Picks a uniformly random legal action per environment (END_TURN for finished ones)."""
+        masks = self.masks if masks is None else masks
+        scores = self.rng.random(masks.shape) * masks
+        actions = scores.argmax(axis=1)
+        actions[~masks.any(axis=1)] = END_TURN_INDEX
+        return actions
+
+    # --- Rules ---
+
+    def _draw(self, e: np.ndarray, p: np.ndarray):
+        """Draws one card for each (env, seat) pair; pairs must be unique."""
+        pos = self.deck_pos[e, p]
+        empty = pos >= self.deck_len[p]
+        self.decked_out[e[empty], p[empty]] = True
+
+        e, p, pos = e[~empty], p[~empty], pos[~empty]
+        cards = self.deck[e, p, pos]
+        self.deck_pos[e, p] += 1
+
+        full = self.hand_count[e, p] >= HAND_SLOTS
+        self.graveyard_count[e[full], p[full]] += 1
+        e, p, cards = e[~full], p[~full], cards[~full]
+        self.hand[e, p, self.hand_count[e, p]] = cards
+        self.hand_count[e, p] += 1
+
+    def _start_turn(self, e: np.ndarray):
+        p = self.active[e]
+        self.max_pp[e, p] = np.minimum(self.max_pp[e, p] + 1, MAX_PP)
+        self.pp[e, p] = self.max_pp[e, p]
+        self.board[e, p, :, B_ATTACKS] = 0
+        self.evolved_this_turn[e, p] = False
+        self._draw(e, p)
+
+    def _end_turn(self, e: np.ndarray):
+        if not len(e):
+            return
+        self.active[e] = 1 - self.active[e]
+        new_round = e[self.active[e] == 0]
+        self.turn[new_round] += 1
+
+        over = self.turn[e] > self.max_turns
+        self.done[e[over]] = True
+        self._start_turn(e[~over])
+
+    def _play(self, e: np.ndarray, slot: np.ndarray):
+        if not len(e):
+            return
+        p = self.active[e]
+        codes = self.hand[e, p, slot]
+        self.pp[e, p] -= self.card_cost[codes]
+
+        # Remove the card from the hand, shifting later cards left.
+        columns = np.arange(HAND_SLOTS)
+        source = np.minimum(columns + (columns >= slot[:, None]), HAND_SLOTS - 1)
+        hands = np.take_along_axis(self.hand[e, p], source, axis=1)
+        hands[:, -1] = EMPTY
+        self.hand[e, p] = hands
+        self.hand_count[e, p] -= 1
+
+        kinds = self.card_kind[codes]
+        spell = kinds == SPELL
+        self.graveyard_count[e[spell], p[spell]] += 1
+
+        e, p, codes, kinds = e[~spell], p[~spell], codes[~spell], kinds[~spell]
+        rows = np.zeros((len(e), BOARD_FIELDS), dtype=np.int16)
+        rows[:, B_CODE] = codes
+        rows[:, B_ATK] = self.card_atk[codes]
+        rows[:, B_DEF] = self.card_def[codes]
+        rows[:, B_MAX_ATTACKS] = self.card_max_attacks[codes]
+        rows[:, B_TURN_PLAYED] = np.where(kinds == FOLLOWER, self.turn[e], 0)
+        rows[:, B_KEYWORDS] = self.card_keywords[codes]
+        self.board[e, p, self.board_count[e, p]] = rows
+        self.board_count[e, p] += 1
+
+    def _attack(self, e: np.ndarray, index: np.ndarray):
+        if not len(e):
+            return
+        slot, target = np.divmod(index, TARGET_SLOTS)
+        p = self.active[e]
+        o = 1 - p
+        self.board[e, p, slot, B_ATTACKS] += 1
+        atk = self.board[e, p, slot, B_ATK]
+
+        leader = target == 0
+        self.life[e[leader], o[leader]] -= atk[leader]
+
+        f = ~leader
+        e, p, o, slot, target_slot, atk = e[f], p[f], o[f], slot[f], target[f] - 1, atk[f]
+        target_atk = self.board[e, o, target_slot, B_ATK]
+        self.board[e, o, target_slot, B_DEF] -= atk
+        self.board[e, p, slot, B_DEF] -= target_atk
+        self._remove_destroyed(e)
+
+    def _remove_destroyed(self, e: np.ndarray):
+        """Moves followers with no defense left to the graveyard, keeping board order."""
+        if not len(e):
+            return
+        boards = self.board[e]
+        codes = boards[..., B_CODE]
+        occupied = codes != EMPTY
+        destroyed = occupied & (self.card_kind[np.maximum(codes, 0)] == FOLLOWER) & (boards[..., B_DEF] <= 0)
+        if not destroyed.any():
+            return
+        keep = occupied & ~destroyed
+        order = np.argsort(~keep, axis=2, kind='stable')
+        boards = np.take_along_axis(boards, order[..., None], axis=2)
+        counts = keep.sum(axis=2)
+        vacated = np.arange(BOARD_SLOTS) >= counts[..., None]
+        boards[vacated] = 0
+        boards[..., B_CODE][vacated] = EMPTY
+        self.board[e] = boards
+        self.board_count[e] = counts
+        self.graveyard_count[e] += destroyed.sum(axis=2).astype(np.int16)
+
+    def _evolve(self, e: np.ndarray, slot: np.ndarray):
+        if not len(e):
+            return
+        p = self.active[e]
+        self.evolved_this_turn[e, p] = True
+        self.ep[e, p] -= 1
+        self.board[e, p, slot, B_ATK] += 2
+        self.board[e, p, slot, B_DEF] += 2
+        self.board[e, p, slot, B_EVOLVED] = 1
+        self.board[e, p, slot, B_RUSH_GAINED] = 1
+
+    def _super_evolve(self, e: np.ndarray, slot: np.ndarray):
+        if not len(e):
+            return
+        p = self.active[e]
+        self.evolved_this_turn[e, p] = True
+        self.sep[e, p] -= 1
+        # Super Evolve has no stat effect yet, matching SvEngine.
+
+    def _check_winners(self, e: np.ndarray):
+        # Seat 0 is checked first, as in SvEngine.check_win_condition.
+        lost = (self.life[e] <= 0) | self.decked_out[e]
+        winner = np.where(lost[:, 1], 0, np.where(lost[:, 0], 1, EMPTY))
+        finished = winner >= 0
+        self.done[e[finished]] = True
+        self.winner[e[finished]] = winner[finished]
+
+    def _update_masks(self):
+        rows = self._rows
+        a = self.active
+        o = 1 - a
+        masks = self.masks
+        kind = self.card_kind
+
+        # Play: card in the hand slot, enough PP and room on the board.
+        hand = self.hand[rows, a]
+        playable = ((hand != EMPTY) & (self.card_cost[np.maximum(hand, 0)] <= self.pp[rows, a][:, None])
+                    & (self.board_count[rows, a] < BOARD_SLOTS)[:, None])
+        masks[:, PLAY_OFFSET:ATTACK_OFFSET] = playable
+
+        # Attack: attacker readiness by keyword, targets restricted by Ward.
+        own = self.board[rows, a]
+        own_codes = own[..., B_CODE]
+        own_followers = (own_codes != EMPTY) & (kind[np.maximum(own_codes, 0)] == FOLLOWER)
+        ready = own_followers & (own[..., B_ATTACKS] < own[..., B_MAX_ATTACKS])
+        played_this_turn = own[..., B_TURN_PLAYED] == self.turn[:, None]
+        keywords = own[..., B_KEYWORDS]
+        storm = (keywords & STORM) != 0
+        can_attack_leader = ready & (~played_this_turn | storm)
+        can_attack_followers = ready & (~played_this_turn | storm | ((keywords & RUSH) != 0)
+                                        | (own[..., B_RUSH_GAINED] != 0))
+
+        opponent = self.board[rows, o]
+        opponent_codes = opponent[..., B_CODE]
+        opponent_followers = (opponent_codes != EMPTY) & (kind[np.maximum(opponent_codes, 0)] == FOLLOWER)
+        ward = opponent_followers & ((opponent[..., B_KEYWORDS] & WARD) != 0)
+        has_ward = ward.any(axis=1)
+        targets = np.where(has_ward[:, None], ward, opponent_followers)
+
+        attacks = np.empty((self.num_envs, BOARD_SLOTS, TARGET_SLOTS), dtype=np.bool_)
+        attacks[:, :, 0] = can_attack_leader & ~has_ward[:, None]
+        attacks[:, :, 1:] = can_attack_followers[:, :, None] & targets[:, None, :]
+        masks[:, ATTACK_OFFSET:EVOLVE_OFFSET] = attacks.reshape(self.num_envs, -1)
+
+        # Evolve / Super Evolve, with the same gates as SvResourceManager.
+        evolved_this_turn = self.evolved_this_turn[rows, a]
+        turn_to_evolve = np.where(a == 0, 5, 4)
+        can_evolve = ~evolved_this_turn & (self.ep[rows, a] > 0) & (self.turn >= turn_to_evolve)
+        can_super_evolve = ((self.game_mode == 'SVWB') & ~evolved_this_turn
+                            & (self.sep[rows, a] > 0) & (self.turn >= 7))
+        evolved = own[..., B_EVOLVED] != 0
+        masks[:, EVOLVE_OFFSET:SUPER_EVOLVE_OFFSET] = can_evolve[:, None] & own_followers & ~evolved
+        masks[:, SUPER_EVOLVE_OFFSET:END_TURN_INDEX] = can_super_evolve[:, None] & own_followers & evolved
+
+        masks[:, END_TURN_INDEX] = True
+        masks[self.done] = False
@@ -0,0 +1,523 @@
+import contextlib
+import json
+import os
+import random
+import secrets
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from framework.core.card import Card
+from framework.simulation.evaluation import MatchupSprt, PairedStats
+from framework.simulation.simulator import GameSimulator
+from framework.utils.display import Display
+from framework.utils.events import EventType
+from agents.base_agent import BaseAgent
+from agents.simple_ai_agent import SimpleAiAgent
+from games.sv.engine import SvEngine
+from games.sv.database.db_loader import CardDatabase
+from games.sv.replay import ReplayRecorder, Replayer, read_replays, write_replay
+from games.sv.utils.deck_builder import DeckLoader, DeckValidator
+from games.sv.vector_env import SvVectorEnv
+
+DB_PATH = 'games/sv/database/test_cards.json'
+DECK_FOLDER = 'games/sv/decks'
+GAME_MODES = {'sv': 'SV', 'svwb': 'SVWB'}
+
+# Each worker process loads the card database once and reuses it for every chunk.
+_worker_db: Optional[CardDatabase] = None
+
+
+@dataclass
+class BatchResult:
+    """
+    Aggregated outcome of a batch of headless games between deck A and deck B.
+    """
+    games: int = 0
+    wins_a: int = 0
+    wins_b: int = 0
+    draws: int = 0
+    total_turns: int = 0
+    min_turns: int = 0
+    max_turns: int = 0
+    # Game i of the batch was played with seed `seed + i`.
+    seed: Optional[int] = None
+    # Errors raised by card scripts (see LuaEngine.error_count).
+    script_errors: int = 0
+
+    def record(self, winner_seat: Optional[int], turns: int):
+        """Adds a single finished game. `winner_seat` is 0 for deck A, 1 for deck B."""
+        if winner_seat == 0:
+            self.wins_a += 1
+        elif winner_seat == 1:
+            self.wins_b += 1
+        else:
+            self.draws += 1
+        self.min_turns = turns if self.games == 0 else min(self.min_turns, turns)
+        self.max_turns = max(self.max_turns, turns)
+        self.total_turns += turns
+        self.games += 1
+
+    def merge(self, other: 'BatchResult'):
+        """Folds the results of another batch into this one."""
+        if other.games == 0:
+            return
+        self.min_turns = other.min_turns if self.games == 0 else min(self.min_turns, other.min_turns)
+        self.max_turns = max(self.max_turns, other.max_turns)
+        self.games += other.games
+        self.wins_a += other.wins_a
+        self.wins_b += other.wins_b
+        self.draws += other.draws
+        self.total_turns += other.total_turns
+        self.script_errors += other.script_errors
+
+    @property
+    def mean_turns(self) -> float:
+        return self.total_turns / self.games if self.games else 0.0
+
+
+def _init_worker(db_path: str):
+    """Process pool initializer: loads the card database once per worker."""
+    global _worker_db
+    _worker_db = CardDatabase(db_path)
+
+
+def _build_deck(db: CardDatabase, card_ids: List[str]) -> List[Card]:
+    return [Card(db.get_definition(card_id)) for card_id in card_ids]
+
+
+def _run_chunk(game_mode: str, deck_a_ids: List[str], deck_b_ids: List[str],
+               num_games: int, max_turns: int, first_seed: int,
+               record: bool = False) -> Tuple[BatchResult, List[bytes]]:
+    """
+    Plays `num_games` AI vs AI games in the current process, seeded
+    first_seed, first_seed + 1, ... Deck A always takes the first seat.
+    With `record`, also returns every game's replay (see games/sv/replay.py).
+    """
+    result = BatchResult()
+    replays: List[bytes] = []
+    recorder = ReplayRecorder() if record else None
+    # Nothing subscribes to the engine's events, so the games run silently.
+    game_engine = SvEngine(game_mode=game_mode, preload_scripts=True, card_db=_worker_db)
+    for game_index in range(num_games):
+        agents = [SimpleAiAgent("Player A"), SimpleAiAgent("Player B")]
+        simulator = GameSimulator(game_engine=game_engine, agents=agents, seed=first_seed + game_index)
+        simulator.game_state.players[0].setup_deck(_build_deck(_worker_db, deck_a_ids))
+        simulator.game_state.players[1].setup_deck(_build_deck(_worker_db, deck_b_ids))
+        winner = simulator.run(max_turns=max_turns, log_level='none', recorder=recorder)
+        if recorder is not None:
+            replays.append(recorder.getvalue())
+
+        winner_seat = simulator.game_state.players.index(winner) if winner else None
+        result.record(winner_seat, simulator.game_state.turn_number)
+    result.script_errors = game_engine.lua_engine.error_count
+    return result, replays
+
+
+def _resolve_deck(deck_ref: str, deck_loader: DeckLoader, validator: DeckValidator) -> Dict[str, Any]:
+    """
+    Finds a deck either by filename inside the deck folder or by an explicit path.
+    """
+    if os.path.isfile(deck_ref):
+        with open(deck_ref, 'r') as f:
+            deck_data = json.load(f)
+        is_valid, reason = validator.validate(deck_data)
+        if not is_valid:
+            raise ValueError(f"Deck '{deck_ref}' is invalid: {reason}")
+        return deck_data
+
+    filename = deck_ref if deck_ref.endswith('.json') else f"{deck_ref}.json"
+    if filename not in deck_loader.valid_decks:
+        raise ValueError(f"No valid deck named '{deck_ref}' in '{deck_loader.deck_folder_path}'.")
+    return deck_loader.valid_decks[filename]
+
+
+def _chunk_sizes(num_games: int, workers: int) -> List[int]:
+    """Splits the workload into several chunks per worker to keep the pool balanced."""
+    num_chunks = max(1, min(num_games, workers * 4))
+    base, extra = divmod(num_games, num_chunks)
+    return [base + (1 if i < extra else 0) for i in range(num_chunks)]
+
+
+def run_batch(game_mode: str, deck_a_ids: List[str], deck_b_ids: List[str],
+              num_games: int, workers: int, max_turns: int = 50,
+              db_path: str = DB_PATH, seed: Optional[int] = None,
+              record_path: Optional[str] = None) -> BatchResult:
+    """
+    Runs `num_games` headless games, fanned out over a process pool.
+
+    Game i is seeded with `seed + i` whichever worker plays it, so results do
+    not depend on the number of workers and any single game can be replayed
+    with replay_game().
+
+    Args:
+        record_path (str, optional): Writes every game's replay to this file,
+            in the order chunks finish. Each replay carries its own seed.
+
+    Returns:
+        BatchResult: The aggregated wins, draws and turn counts.
+    """
+    if seed is None:
+        seed = secrets.randbits(48)
+    result = BatchResult(seed=seed)
+    record = record_path is not None
+    with contextlib.ExitStack() as stack:
+        record_file = stack.enter_context(open(record_path, 'wb')) if record else None
+
+        def absorb(chunk: Tuple[BatchResult, List[bytes]]):
+            chunk_result, replays = chunk
+            result.merge(chunk_result)
+            for data in replays:
+                write_replay(record_file, data)
+
+        if workers <= 1:
+            _init_worker(db_path)
+            absorb(_run_chunk(game_mode, deck_a_ids, deck_b_ids, num_games, max_turns, seed, record))
+            return result
+
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                       initargs=(db_path,)))
+        futures = []
+        first_seed = seed
+        for size in _chunk_sizes(num_games, workers):
+            futures.append(pool.submit(_run_chunk, game_mode, deck_a_ids, deck_b_ids, size, max_turns,
+                                       first_seed, record))
+            first_seed += size
+        for future in as_completed(futures):
+            absorb(future.result())
+    return result
+
+
+def replay_game(game_mode: str, deck_a_ids: List[str], deck_b_ids: List[str], seed: int,
+                max_turns: int = 50, log_level: str = 'simple', db_path: str = DB_PATH):
+    """
+    Plays one AI vs AI game with the given seed and logs it. With the seed of
+    game i from a batch (BatchResult.seed + i), this reproduces that game exactly.
+    """
+    _init_worker(db_path)
+    agents = [SimpleAiAgent("Player A"), SimpleAiAgent("Player B")]
+    simulator = GameSimulator(game_engine=SvEngine(game_mode=game_mode, card_db=_worker_db), agents=agents, seed=seed)
+    simulator.game_state.players[0].setup_deck(_build_deck(_worker_db, deck_a_ids))
+    simulator.game_state.players[1].setup_deck(_build_deck(_worker_db, deck_b_ids))
+    return simulator.run(max_turns=max_turns, log_level=log_level)
+
+
+def replay_recorded(record_path: str, seed: int, from_turn: Optional[int] = None,
+                    log_level: str = 'simple', db_path: str = DB_PATH):
+    """
+    Re-executes the recorded game with `seed` from a replay file and logs it.
+    With `from_turn`, jumps to that turn (from the nearest keyframe) and logs
+    only from there.
+    """
+    with open(record_path, 'rb') as f:
+        replay = next((r for r in read_replays(f) if r.seed == seed), None)
+    if replay is None:
+        raise ValueError(f"No game with seed {seed} in '{record_path}'.")
+    _init_worker(db_path)
+    replayer = Replayer(replay, _worker_db)
+    if from_turn is not None:
+        replayer.seek(from_turn)
+    display = Display(log_level)
+    events = replayer.engine.events
+    events.subscribe(display.handle_event)
+    try:
+        if replayer.turn_started:
+            display.handle_event(EventType.TURN_BEGIN, {'game_state': replayer.game_state})
+        winner = replayer.run()
+    finally:
+        events.unsubscribe(display.handle_event)
+    return winner
+
+
+def run_vector_batch(game_mode: str, deck_a_ids: List[str], deck_b_ids: List[str],
+                     num_games: int, num_envs: int, max_turns: int = 50,
+                     db_path: str = DB_PATH, seed: Optional[int] = None,
+                     ignore_effects: bool = False) -> BatchResult:
+    """
+    Runs `num_games` random vs random games in one SvVectorEnv of `num_envs`
+    lockstep games. Card effects are not run, so decks with effects raise
+    ValueError unless `ignore_effects` is set (see SvVectorEnv).
+    """
+    db = CardDatabase(db_path)
+    num_envs = min(num_envs, num_games)
+    env = SvVectorEnv(db, deck_a_ids, deck_b_ids, num_envs, game_mode=game_mode,
+                      max_turns=max_turns, seed=seed, auto_reset=False, ignore_effects=ignore_effects)
+    masks = env.reset()
+    started = num_envs
+    result = BatchResult(seed=seed)
+    while result.games < num_games:
+        masks, _, dones = env.step(env.sample_actions(masks))
+        finished = dones.nonzero()[0]
+        if not len(finished):
+            continue
+        for index in finished:
+            winner = int(env.winner[index])
+            result.record(winner if winner >= 0 else None, int(env.turn[index]))
+        restart = finished[:num_games - started]
+        if len(restart):
+            started += len(restart)
+            masks = env.reset(restart)
+    return result
+
+
+# --- Paired evaluation ---
+
+PAIR_CHUNK = 32
+
+# Builds an agent from its player name, e.g. an agent class. Evaluations
+# send it to worker processes, so it must be picklable (defined at module level).
+AgentFactory = Callable[[str], BaseAgent]
+
+
+def _play_seeded(game_engine: SvEngine, first: List[Card], second: List[Card], agents: List[BaseAgent],
+                 seed: int, max_turns: int) -> Optional[int]:
+    """Plays one game with fixed deck orders and returns the winning seat, or None."""
+    simulator = GameSimulator(game_engine=game_engine, agents=agents, seed=seed)
+    simulator.game_state.players[0].setup_deck(first, shuffle=False)
+    simulator.game_state.players[1].setup_deck(second, shuffle=False)
+    winner = simulator.run(max_turns=max_turns, log_level='none')
+    return simulator.game_state.players.index(winner) if winner else None
+
+
+def _shuffled_deck(card_ids: List[str], seed: int, seat: int) -> List[Card]:
+    """Builds a deck shuffled by the seat's stream for this seed, whichever deck sits there."""
+    order = list(card_ids)
+    random.Random(f"{seed}:deck:{seat}").shuffle(order)
+    return _build_deck(_worker_db, order)
+
+
+def _run_pair_chunk(game_mode: str, deck_a_ids: List[str], deck_b_ids: List[str],
+                    seeds: List[int], max_turns: int, agent_a: AgentFactory = SimpleAiAgent,
+                    agent_b: AgentFactory = SimpleAiAgent) -> List[Tuple[int, int]]:
+    """
+    Plays every seed twice, side A (deck A with agent_a) first, then side B
+    first. Both games of a pair use the same seed, and each seat's deck is
+    shuffled with the same permutation whichever deck sits there. The agent
+    and effect streams belong to the game rather than to a seat, so they
+    only line up for as long as the two games take the same course.
+
+    Returns:
+        List of (A's points in game 1, A's points in game 2); 2 win, 1 draw, 0 loss.
+    """
+    points = {0: (2, 0), 1: (0, 2), None: (1, 1)}
+    game_engine = SvEngine(game_mode=game_mode, preload_scripts=True, card_db=_worker_db)
+    outcomes = []
+    for seed in seeds:
+        first = _play_seeded(game_engine, _shuffled_deck(deck_a_ids, seed, 0), _shuffled_deck(deck_b_ids, seed, 1),
+                             [agent_a("Player A"), agent_b("Player B")], seed, max_turns)
+        second = _play_seeded(game_engine, _shuffled_deck(deck_b_ids, seed, 0), _shuffled_deck(deck_a_ids, seed, 1),
+                              [agent_b("Player B"), agent_a("Player A")], seed, max_turns)
+        outcomes.append((points[first][0], points[second][1]))
+    return outcomes
+
+
+def run_paired(game_mode: str, deck_a_ids: List[str], deck_b_ids: List[str], max_pairs: int,
+               workers: int, max_turns: int = 50, seed: Optional[int] = None,
+               sprt: Optional[MatchupSprt] = None, db_path: str = DB_PATH,
+               agent_a: AgentFactory = SimpleAiAgent,
+               agent_b: AgentFactory = SimpleAiAgent) -> Tuple[PairedStats, Optional[str], List[int]]:
+    """
+    Evaluates side A (deck A played by `agent_a`) against side B (deck B
+    played by `agent_b`) on seed pairs seed, seed + 1, ... To compare two
+    agents, give both sides the same deck; to compare decks, the same agent.
+
+    Pairs are played in chunks of PAIR_CHUNK. If `sprt` is given, the run
+    stops as soon as it reaches a decision. With several workers, chunks
+    finish out of order, and the chunks still running when the SPRT decides
+    are finished and counted as well, so the seeds played need not be a
+    contiguous range.
+
+    Returns:
+        (PairedStats, the SPRT decision or None, the seeds played in sorted order).
+    """
+    if seed is None:
+        seed = secrets.randbits(48)
+    stats = PairedStats()
+    played: List[int] = []
+    chunks = [list(range(seed + start, seed + min(start + PAIR_CHUNK, max_pairs)))
+              for start in range(0, max_pairs, PAIR_CHUNK)]
+
+    def absorb(seeds: List[int], outcomes: List[Tuple[int, int]]) -> Optional[str]:
+        played.extend(seeds)
+        for first, second in outcomes:
+            stats.record(first, second)
+        return sprt.decision(stats) if sprt else None
+
+    decision = None
+    if workers <= 1:
+        _init_worker(db_path)
+        for seeds in chunks:
+            decision = absorb(seeds, _run_pair_chunk(game_mode, deck_a_ids, deck_b_ids, seeds, max_turns,
+                                                    agent_a, agent_b))
+            if decision:
+                break
+        return stats, decision, played
+
+    pending_chunks = iter(chunks)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(db_path,)) as pool:
+        # Keep only a few chunks in flight so an early SPRT stop wastes little work.
+        # future -> the seeds of its chunk
+        in_flight = {}
+        for seeds in pending_chunks:
+            in_flight[pool.submit(_run_pair_chunk, game_mode, deck_a_ids, deck_b_ids, seeds, max_turns,
+                                  agent_a, agent_b)] = seeds
+            if len(in_flight) >= workers * 2:
+                break
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcome = absorb(in_flight.pop(future), future.result())
+                decision = decision or outcome
+            if decision:
+                # cancel() only stops chunks that have not started; the
+                # others are finished and counted rather than thrown away.
+                for future, seeds in in_flight.items():
+                    if not future.cancel():
+                        absorb(seeds, future.result())
+                break
+            for seeds in pending_chunks:
+                in_flight[pool.submit(_run_pair_chunk, game_mode, deck_a_ids, deck_b_ids, seeds, max_turns,
+                                      agent_a, agent_b)] = seeds
+                if len(in_flight) >= workers * 2:
+                    break
+    return stats, decision, sorted(played)
+
+
+def _seed_ranges(seeds: List[int]) -> str:
+    """Sorted seeds as comma-separated ranges, e.g. "5..36, 69..100"."""
+    ranges = []
+    for value in seeds:
+        if ranges and ranges[-1][1] == value - 1:
+            ranges[-1][1] = value
+        else:
+            ranges.append([value, value])
+    return ', '.join(f"{low}..{high}" if low != high else str(low) for low, high in ranges)
+
+
+def launch_evaluation(game: str, deck_a: str, deck_b: str, max_games: int, workers: Optional[int] = None,
+                      max_turns: int = 50, seed: Optional[int] = None, sprt_delta: Optional[float] = 0.05,
+                      alpha: float = 0.05, beta: float = 0.05):
+    """
+    Headless entry point for paired evaluation of deck A against deck B.
+    Plays up to `max_games` games (max_games / 2 seed pairs) and prints paired
+    statistics; with `sprt_delta`, stops once the SPRT decides.
+    """
+    game_mode = GAME_MODES[game]
+    workers = workers or os.cpu_count() or 1
+
+    print(f"\n--- Paired Evaluation Setup ({game_mode}) ---")
+    try:
+        db = CardDatabase(DB_PATH)
+        deck_loader = DeckLoader(DECK_FOLDER, db)
+        deck_a_data = _resolve_deck(deck_a, deck_loader, deck_loader.validator)
+        deck_b_data = _resolve_deck(deck_b, deck_loader, deck_loader.validator)
+    except (OSError, ValueError) as e:
+        print(f"Error loading game data: {e}")
+        return None
+
+    if seed is None:
+        seed = secrets.randbits(48)
+    sprt = MatchupSprt(sprt_delta, alpha, beta) if sprt_delta else None
+    max_pairs = max(1, max_games // 2)
+    print(f"Evaluating '{deck_a_data['deckName']}' vs '{deck_b_data['deckName']}': up to {max_pairs} seed pairs "
+          f"on {workers} worker(s)" + (f", SPRT delta {sprt_delta}..." if sprt else "..."))
+
+    start = time.perf_counter()
+    stats, decision, seeds = run_paired(game_mode, deck_a_data['cardIds'], deck_b_data['cardIds'], max_pairs,
+                                 workers, max_turns, seed=seed, sprt=sprt)
+    elapsed = time.perf_counter() - start
+
+    low, high = stats.confidence_interval()
+    ratio = stats.variance_ratio
+    print("\n--- Paired Evaluation Results ---")
+    print(f"  Seed pairs:     {stats.pairs} ({stats.games} games, seeds {_seed_ranges(seeds)})")
+    print(f"  Deck A score:   {stats.score:.4f} +/- {stats.standard_error:.4f}  (95% CI {low:.4f} - {high:.4f})"
+          f"  [{deck_a_data['deckName']}]")
+    print(f"  Deck A W/D/L:   {stats.wins}/{stats.draws}/{stats.losses}")
+    print(f"  Pair points:    {stats.counts}  (A's points per pair, 0-4)")
+    print(f"  Variance ratio: {ratio:.3f} vs unpaired games"
+          + (f" (~{1 / ratio:.1f}x fewer games needed)" if 0 < ratio < 1 else ""))
+    if sprt:
+        a_llr, b_llr = sprt.a_test.llr(stats), sprt.b_test.llr(stats)
+        verdict = {MatchupSprt.A_STRONGER: "Deck A is stronger",
+                   MatchupSprt.B_STRONGER: "Deck B is stronger",
+                   MatchupSprt.NO_EDGE: f"No edge of {sprt_delta} either way"}.get(decision, "Undecided")
+        print(f"  SPRT:           {verdict}  (LLR A {a_llr:.2f}, B {b_llr:.2f}; "
+              f"bounds {sprt.a_test.lower:.2f}/{sprt.a_test.upper:.2f})")
+    print(f"  Elapsed:        {elapsed:.2f}s")
+    return stats
+
+
+def launch(game: str, deck_a: str, deck_b: str, num_games: int, workers: Optional[int] = None, max_turns: int = 50,
+           vector_envs: Optional[int] = None, seed: Optional[int] = None, replay: Optional[int] = None,
+           record_path: Optional[str] = None, replay_file: Optional[str] = None, from_turn: Optional[int] = None,
+           ignore_effects: bool = False):
+    """
+    Headless entry point: plays deck A against deck B many times and prints a summary.
+
+    With `vector_envs`, games run in a lockstep SvVectorEnv instead of the
+    process pool; decks with card effects need `ignore_effects`. With
+    `replay`, only game number `replay` of the batch seeded `seed` is played
+    again, with the simple log; with `replay_file` it is re-executed from the
+    recording instead (from turn `from_turn`). With `record_path`, every game
+    of the batch is recorded to that file.
+    """
+    game_mode = GAME_MODES[game]
+    workers = workers or os.cpu_count() or 1
+
+    print(f"\n--- Batch Simulation Setup ({game_mode}) ---")
+    try:
+        db = CardDatabase(DB_PATH)
+        deck_loader = DeckLoader(DECK_FOLDER, db)
+        deck_a_data = _resolve_deck(deck_a, deck_loader, deck_loader.validator)
+        deck_b_data = _resolve_deck(deck_b, deck_loader, deck_loader.validator)
+    except (OSError, ValueError) as e:
+        print(f"Error loading game data: {e}")
+        return None
+
+    if replay is not None and replay_file is not None:
+        print(f"Replaying game {replay} of the batch with seed {seed} from '{replay_file}'...")
+        try:
+            replay_recorded(replay_file, seed + replay, from_turn)
+        except (OSError, ValueError) as e:
+            print(f"Error reading replay: {e}")
+        return None
+    if replay is not None:
+        print(f"Replaying game {replay} of the batch with seed {seed}...")
+        replay_game(game_mode, deck_a_data['cardIds'], deck_b_data['cardIds'], seed + replay, max_turns)
+        return None
+
+    if seed is None:
+        seed = secrets.randbits(48)
+    start = time.perf_counter()
+    if vector_envs:
+        print(f"Running {num_games} games: '{deck_a_data['deckName']}' vs '{deck_b_data['deckName']}' "
+              f"in {vector_envs} vectorized environment(s) (vanilla rules)...")
+        try:
+            result = run_vector_batch(game_mode, deck_a_data['cardIds'], deck_b_data['cardIds'],
+                                      num_games, vector_envs, max_turns, seed=seed, ignore_effects=ignore_effects)
+        except ValueError as e:
+            print(f"Error: {e} (--ignore-effects on the command line)")
+            return None
+    else:
+        print(f"Running {num_games} games: '{deck_a_data['deckName']}' vs '{deck_b_data['deckName']}' "
+              f"on {workers} worker(s)...")
+        result = run_batch(game_mode, deck_a_data['cardIds'], deck_b_data['cardIds'],
+                           num_games, workers, max_turns, seed=seed, record_path=record_path)
+    elapsed = time.perf_counter() - start
+
+    games = max(result.games, 1)
+    print("\n--- Batch Simulation Results ---")
+    print(f"  Games played:   {result.games}")
+    print(f"  Deck A wins:    {result.wins_a} ({result.wins_a / games:.1%})  [{deck_a_data['deckName']}]")
+    print(f"  Deck B wins:    {result.wins_b} ({result.wins_b / games:.1%})  [{deck_b_data['deckName']}]")
+    print(f"  Draws:          {result.draws} ({result.draws / games:.1%})")
+    print(f"  Turns:          mean {result.mean_turns:.2f}, min {result.min_turns}, max {result.max_turns}")
+    print(f"  Seed:           {result.seed} (game i uses seed {result.seed} + i)")
+    if record_path and not vector_envs:
+        print(f"  Replays:        {record_path}")
+    if result.script_errors:
+        print(f"  Script errors:  {result.script_errors} (each failing script is logged above)")
+    print(f"  Elapsed:        {elapsed:.2f}s ({result.games / elapsed if elapsed > 0 else 0.0:.1f} games/sec)")
+    return result
@@ -1,8 +1,8 @@
 from framework.core.card import Card
+from framework.core.card_definition import CardDefinition
 from framework.simulation.simulator import GameSimulator
 from agents.simple_ai_agent import SimpleAiAgent
 from games.ruleset_one.engine import RuleSetOneEngine
-import copy
 
 def launch():
     """
@@ -20,10 +20,10 @@ def launch():
 
         # 2. Create Game Engine and Decks
         game_engine = RuleSetOneEngine()
-        attack_bot = Card(card_id="ATTACK_BOT", name="Attack Bot", properties={'cost': 1})
-        draw_bot = Card(card_id="DRAW_BOT", name="Draw Bot", properties={'cost': 1})
-        deck1 = [Card(c.card_id, c.name, copy.deepcopy(c.properties)) for c in [attack_bot]*10 + [draw_bot]*10]
-        deck2 = [Card(c.card_id, c.name, copy.deepcopy(c.properties)) for c in [attack_bot]*10 + [draw_bot]*10]
+        attack_bot = CardDefinition(card_id="ATTACK_BOT", name="Attack Bot", properties={'cost': 1})
+        draw_bot = CardDefinition(card_id="DRAW_BOT", name="Draw Bot", properties={'cost': 1})
+        deck1 = [Card(definition) for definition in [attack_bot]*10 + [draw_bot]*10]
+        deck2 = [Card(definition) for definition in [attack_bot]*10 + [draw_bot]*10]
 
         # 3. Create and run the simulator
         simulator = GameSimulator(game_engine=game_engine, agents=agents)
@@ -1,9 +1,9 @@
 import questionary
 from questionary import Choice
-import copy
 
 from framework.core.card import Card
 from framework.simulation.simulator import GameSimulator
+from framework.utils.events import EventSink, print_event
 from agents.simple_ai_agent import SimpleAiAgent
 from agents.human_agent import HumanAgent
 from games.sv.engine import SvEngine
@@ -20,7 +20,9 @@ def launch():
 
     # 1. Load data (unchanged)
     try:
-        db = CardDatabase('games/sv/database/test_cards.json')
+        loading = EventSink()
+        loading.subscribe(print_event)
+        db = CardDatabase('games/sv/database/test_cards.json', events=loading)
         deck_loader = DeckLoader('games/sv/decks', db)
         
         if not deck_loader.valid_decks:
@@ -81,15 +83,15 @@ def launch():
             # 4. Run simulation (unchanged)
             deck1_ids = deck1_data['cardIds']
             deck2_ids = deck2_data['cardIds']
-            deck1 = [Card(card_id, db.get_card_data(card_id)['name'], copy.deepcopy(db.get_card_data(card_id))) for card_id in deck1_ids]
-            deck2 = [Card(card_id, db.get_card_data(card_id)['name'], copy.deepcopy(db.get_card_data(card_id))) for card_id in deck2_ids]
+            deck1 = [Card(db.get_definition(card_id)) for card_id in deck1_ids]
+            deck2 = [Card(db.get_definition(card_id)) for card_id in deck2_ids]
         
             agent_map = {'simple_ai': SimpleAiAgent, 'human': HumanAgent}
             agents = [
                 agent_map[agent1_type](f"Player 1 ({agent1_type.upper()})"),
                 agent_map[agent2_type](f"Player 2 ({agent2_type.upper()})")
             ]
-            game_engine = SvEngine(game_mode=game_mode)
+            game_engine = SvEngine(game_mode=game_mode, card_db=db)
             simulator = GameSimulator(game_engine=game_engine, agents=agents)
             simulator.game_state.players[0].setup_deck(deck1)
             simulator.game_state.players[1].setup_deck(deck2)
@@ -7,6 +7,11 @@ from launchers import ruleset_one_launcher
 from launchers import sv_launcher
 # --- NEW IMPORT ---
 from launchers import svwb_launcher
+from launchers import batch_launcher
+from games.sv.database.db_loader import CardDatabase, build_snapshot
+from games.sv.database.importer import RAW_DATABASES
+from games.sv.utils.deck_builder import DeckValidator
+from games.sv.utils.deck_codes import import_decks
 
 def show_main_menu():
     """Shows the main interactive menu to the user."""
@@ -46,20 +51,105 @@ def show_main_menu():
 
 def setup_arg_parser():
     """Sets up the command-line argument parser for headless mode."""
-    # ... (this function is unchanged)
     parser = argparse.ArgumentParser(description="A flexible TCG Simulator.")
-    parser.add_argument('--game', type=str, choices=['ruleset_one'], 
+    parser.add_argument('command', nargs='?', choices=['simulate', 'evaluate', 'build-db', 'import-decks'],
+                        help="'simulate' runs a headless batch of AI vs AI games; 'evaluate' compares "
+                             "deck A and deck B on seat-swapped seed pairs with early stopping; "
+                             "'build-db' compiles card files into the binary snapshot the database loads; "
+                             "'import-decks' writes deck files for portal deck hashes, URLs and deck codes.")
+    parser.add_argument('--game', type=str, choices=['ruleset_one', 'sv', 'svwb'], 
                         help='The name of the game to run in headless mode.')
+    parser.add_argument('--deck-a', type=str, help="Deck for the first seat (filename in games/sv/decks or a path).")
+    parser.add_argument('--deck-b', type=str, help="Deck for the second seat (filename in games/sv/decks or a path).")
+    parser.add_argument('--games', type=int, default=1000, help="Number of games to simulate.")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (defaults to the CPU count).")
+    parser.add_argument('--max-turns', type=int, default=50, help="Turn limit per game before it is scored a draw.")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Base seed for the batch; game i is played with seed + i. Random when omitted.")
+    parser.add_argument('--replay', type=int, default=None, metavar='GAME',
+                        help="Replay game number GAME of the batch given by --seed, with the simple log.")
+    parser.add_argument('--record', type=str, default=None, metavar='FILE',
+                        help="Record every game of the batch to a binary replay file.")
+    parser.add_argument('--replay-file', type=str, default=None, metavar='FILE',
+                        help="With --replay, re-execute the game from this replay file instead of replaying it.")
+    parser.add_argument('--from-turn', type=int, default=None, metavar='TURN',
+                        help="With --replay-file, jump to this turn before logging.")
+    parser.add_argument('--sprt-delta', type=float, default=0.05,
+                        help="evaluate: score edge the SPRT tests for (0 disables early stopping).")
+    parser.add_argument('--vector-envs', type=int, default=None,
+                        help="Run random self-play in this many lockstep NumPy games (vanilla rules, no card effects).")
+    parser.add_argument('--ignore-effects', action='store_true',
+                        help="With --vector-envs, play cards with Fanfare, Last Words or spell effects as vanilla cards.")
+    parser.add_argument('--db', type=str, nargs='+', default=list(RAW_DATABASES), metavar='FILE',
+                        help="build-db: the card files to compile; import-decks: the cards decks are "
+                             "validated against (defaults to the raw class databases).")
+    parser.add_argument('--decks', type=str, nargs='+', default=None, metavar='FILE',
+                        help="import-decks: files listing one deck hash, portal deck URL or deck code per line "
+                             "(optionally followed by a deck name), or saved portal deck responses (.json).")
+    parser.add_argument('--out', type=str, default='games/sv/decks/imported', metavar='DIR',
+                        help="import-decks: the folder the deck files are written to.")
     return parser
 
 
 if __name__ == "__main__":
-    # ... (this function is unchanged)
     parser = setup_arg_parser()
     args = parser.parse_args()
 
-    if args.game:
+    if args.command in ('simulate', 'evaluate'):
+        if args.game not in batch_launcher.GAME_MODES:
+            parser.error(f"{args.command} requires --game sv or --game svwb.")
+        if not args.deck_a or not args.deck_b:
+            parser.error(f"{args.command} requires both --deck-a and --deck-b.")
+        if args.games < 1:
+            parser.error("--games must be at least 1.")
+    if args.command == 'evaluate':
+        if not 0 <= args.sprt_delta < 0.5:
+            parser.error("--sprt-delta must be between 0 and 0.5.")
+        batch_launcher.launch_evaluation(args.game, args.deck_a, args.deck_b, args.games,
+                                         workers=args.workers, max_turns=args.max_turns,
+                                         seed=args.seed, sprt_delta=args.sprt_delta)
+    elif args.command == 'simulate':
+        if args.vector_envs is not None and args.vector_envs < 1:
+            parser.error("--vector-envs must be at least 1.")
+        if args.replay is not None and (args.seed is None or args.vector_envs):
+            parser.error("--replay requires --seed and cannot be combined with --vector-envs.")
+        if args.record and args.vector_envs:
+            parser.error("--record cannot be combined with --vector-envs.")
+        if args.ignore_effects and not args.vector_envs:
+            parser.error("--ignore-effects requires --vector-envs.")
+        if (args.replay_file or args.from_turn is not None) and args.replay is None:
+            parser.error("--replay-file and --from-turn require --replay.")
+        if args.from_turn is not None and not args.replay_file:
+            parser.error("--from-turn requires --replay-file.")
+        batch_launcher.launch(args.game, args.deck_a, args.deck_b, args.games,
+                              workers=args.workers, max_turns=args.max_turns,
+                              vector_envs=args.vector_envs, seed=args.seed, replay=args.replay,
+                              record_path=args.record, replay_file=args.replay_file,
+                              from_turn=args.from_turn, ignore_effects=args.ignore_effects)
+    elif args.command == 'build-db':
+        try:
+            path = build_snapshot(args.db)
+            print(f"Built card snapshot {path} from {len(args.db)} file(s).")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error building the card snapshot: {e}")
+    elif args.command == 'import-decks':
+        if not args.decks:
+            parser.error("import-decks requires --decks.")
+        try:
+            validator = DeckValidator(CardDatabase(args.db))
+            results = import_decks(args.decks, args.out, validator, workers=args.workers)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error importing decks: {e}")
+        else:
+            for deck, path, reason in results:
+                if path is None:
+                    print(f"  > Skipped '{deck}': {reason}")
+            imported = sum(1 for _, path, _ in results if path is not None)
+            print(f"Imported {imported} of {len(results)} deck(s) into '{args.out}'.")
+    elif args.game:
         if args.game == 'ruleset_one':
             ruleset_one_launcher.launch()
+        else:
+            parser.error(f"--game {args.game} is only available headless via the 'simulate' command.")
     else:
         show_main_menu()
\ No newline at end of file
@@ -0,0 +1,110 @@
+import json
+import os
+import random
+import sys
+from typing import Iterator, List, Tuple
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Card scripts and databases are found relative to the repository root, as when running main.py.
+os.chdir(ROOT)
+
+from agents.simple_ai_agent import SimpleAiAgent
+from framework.core.game_state import GameState
+from framework.simulation.action import Action
+from framework.simulation.simulator import GameSimulator
+from games.sv.database.db_loader import CardDatabase
+from games.sv.database.importer import RAW_DATABASES
+from games.sv.engine import SvEngine
+from launchers.batch_launcher import DB_PATH, DECK_FOLDER, _build_deck
+
+DECK_FILES = ('swordcraft_aggro.json', 'neutral_swordcraft.json')
+
+# Test cards with Fanfare, Last Words, token and Ward effects, for decks
+# that exercise the scripted and native card effects.
+EFFECT_CARDS = ['SWD_006', 'SWD_010', 'SWD_012', 'SWD_013', 'NEU_011', 'DRG_009', 'RUN_014', 'HVN_004',
+                'SHD_007', 'NEU_004', 'DRG_013', 'NEU_003', 'NEU_010', 'SHD_009', 'BLD_010', 'BLD_014',
+                'HVN_010', 'SHD_012', 'POR_009', 'DRG_008']
+
+
+@pytest.fixture(scope='session')
+def card_db() -> CardDatabase:
+    return CardDatabase(DB_PATH)
+
+
+@pytest.fixture(scope='session')
+def raw_db() -> CardDatabase:
+    """The full card pool, from the raw class databases."""
+    return CardDatabase(RAW_DATABASES)
+
+
+@pytest.fixture(scope='session', params=['decks', 'effects'])
+def deck_lists(request) -> Tuple[List[str], List[str]]:
+    """The card IDs of both players' decks: the sample deck files, or a mix of effect cards."""
+    if request.param == 'effects':
+        return ([EFFECT_CARDS[i % len(EFFECT_CARDS)] for i in range(40)],
+                [EFFECT_CARDS[i * 7 % len(EFFECT_CARDS)] for i in range(40)])
+    decks = []
+    for name in DECK_FILES:
+        with open(os.path.join(DECK_FOLDER, name), 'r', encoding='utf-8') as f:
+            decks.append(json.load(f)['cardIds'])
+    return decks[0], decks[1]
+
+
+@pytest.fixture
+def new_simulator(card_db, deck_lists):
+    """Returns a function that builds a GameSimulator for a seed, decks set up but not dealt."""
+    def build(seed: int, engine: SvEngine = None) -> GameSimulator:
+        engine = engine if engine is not None else SvEngine('SV', card_db=card_db)
+        simulator = GameSimulator(engine, [SimpleAiAgent("Player A"), SimpleAiAgent("Player B")], seed=seed)
+        for player, deck in zip(simulator.game_state.players, deck_lists):
+            player.setup_deck(_build_deck(card_db, deck))
+        return simulator
+    return build
+
+
+@pytest.fixture
+def new_game(new_simulator):
+    """Returns a function that starts a game for a seed and returns (engine, game_state) at the first action."""
+    def start(seed: int) -> Tuple[SvEngine, GameState]:
+        simulator = new_simulator(seed)
+        engine, game_state = simulator.game_engine, simulator.game_state
+        engine.setup_game(game_state)
+        game_state.start_game()
+        start_turn(game_state)
+        return engine, game_state
+    return start
+
+
+def start_turn(game_state: GameState):
+    """The active player's PP refresh and draw, as GameSimulator does at the start of a turn."""
+    player = game_state.active_player
+    player.resources.start_turn()
+    player.draw_card(game_state)
+
+
+def play_random(engine: SvEngine, game_state: GameState, seed: int, max_steps: int = 300) -> Iterator[List[Action]]:
+    """
+    Plays random legal actions until the game ends. Yields the legal
+    actions before each one; the caller may change the game meanwhile as
+    long as it puts it back.
+    """
+    rng = random.Random(seed)
+    for _ in range(max_steps):
+        if engine.check_win_condition(game_state):
+            return
+        actions = engine.get_possible_actions(game_state)
+        yield actions
+        action = rng.choice(actions)
+        engine.apply_action(game_state, action)
+        if action.action_type == "END_TURN":
+            game_state.end_turn()
+            start_turn(game_state)
+
+
+@pytest.fixture
+def playout():
+    """play_random, for the tests."""
+    return play_random
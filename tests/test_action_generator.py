@@ -0,0 +1,57 @@
+import random
+
+import numpy as np
+
+from conftest import start_turn
+from framework.core.journal import Journal
+from games.sv.modules.action_generator import SvActionGenerator
+
+
+def action_keys(actions) -> list:
+    return [(action.player_id, action.action_type, action.details) for action in actions]
+
+
+def test_incremental_actions_match_full_rebuild(new_game, playout):
+    for seed in range(4):
+        engine, game_state = new_game(seed)
+        journal = Journal()
+        for actions in playout(engine, game_state, seed):
+            rebuilt = SvActionGenerator(engine.game_mode).get_possible_actions(game_state, game_state.active_player)
+            assert action_keys(actions) == action_keys(rebuilt)
+
+            # Trying every action and undoing it must leave the cached sections valid.
+            for action in actions:
+                mark = journal.mark()
+                engine.apply_action(game_state, action, journal)
+                engine.get_possible_actions(game_state)
+                engine.undo(game_state, journal, mark)
+            assert action_keys(engine.get_possible_actions(game_state)) == action_keys(actions)
+
+
+def test_generators_sharing_a_game_state_stay_current(new_game):
+    """A second generator, such as a look-ahead agent's, must not hide changes from the engine's."""
+    for seed in range(8):
+        engine, game_state = new_game(seed)
+        lookahead = SvActionGenerator(engine.game_mode)
+        rng = random.Random(seed)
+        while not engine.check_win_condition(game_state) and game_state.turn_number < 30:
+            actions = engine.get_possible_actions(game_state)
+            rebuilt = SvActionGenerator(engine.game_mode).get_possible_actions(game_state, game_state.active_player)
+            assert action_keys(actions) == action_keys(rebuilt)
+
+            action = rng.choice(actions)
+            engine.apply_action(game_state, action)
+            if action.action_type == "END_TURN":
+                game_state.end_turn()
+                start_turn(game_state)
+            lookahead.get_possible_actions(game_state, game_state.active_player)
+
+
+def test_action_mask_matches_generated_actions(new_game, playout):
+    for seed in range(4):
+        engine, game_state = new_game(seed)
+        for actions in playout(engine, game_state, seed):
+            mask = engine.get_action_mask(game_state)
+            assert np.array_equal(mask, engine.action_space.legal_mask(game_state, actions=actions))
+            indices = sorted(engine.action_space.encode(game_state, action) for action in actions)
+            assert indices == list(np.flatnonzero(mask))
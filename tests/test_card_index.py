@@ -0,0 +1,70 @@
+import pytest
+
+from framework.core.card import Card
+from framework.core.card_definition import CardDefinition
+from games.sv.database.card_index import CardIndex
+
+CARDS = {
+    'knight': {'class': 'Swordcraft', 'type': 'Follower', 'char_type': 1, 'cost': 2, 'traits': ['Officer']},
+    'robot': {'class': 'Neutral', 'type': 'Follower', 'char_type': 1, 'cost': 3, 'traits': ['Machina']},
+    'golem': {'class': 'Runecraft', 'type': 'Follower', 'char_type': 1, 'cost': 5, 'traits': ['All']},
+    'bolt': {'class': 'Runecraft', 'type': 'Spell', 'char_type': 4, 'cost': 1, 'traits': []},
+    'shrine': {'class': 'Havencraft', 'type': 'Amulet', 'char_type': 3, 'cost': 2, 'traits': []},
+}
+
+
+@pytest.fixture
+def index() -> CardIndex:
+    return CardIndex.build(CARDS)
+
+
+@pytest.mark.parametrize('selector, expected', [
+    ("card_type=unit", ['knight', 'robot', 'golem']),
+    ("card_type=spell_and_field", ['bolt', 'shrine']),
+    ("card_type=chant_field", ['shrine']),
+    ("card_type=all", list(CARDS)),
+    ("tribe=machine", ['robot', 'golem']),  # A card with every trait has them all.
+    ("tribe=any_tribe", ['knight', 'robot', 'golem']),
+    ("clan=witch", ['golem', 'bolt']),
+    ("clan!=witch", ['knight', 'robot', 'shrine']),
+    ("base_cost<=2", ['knight', 'bolt', 'shrine']),
+    ("card_type=unit&base_cost>2", ['robot', 'golem']),
+    ("clan=royal|card_type=spell", ['knight', 'bolt']),
+    ("card_type=unit&(clan=all|clan=royal)", ['knight', 'robot']),
+    ("none", list(CARDS)),
+])
+def test_queries(index, selector, expected):
+    query = index.query(selector)
+    assert list(query) == expected
+    assert len(query) == len(expected)
+    assert all(card_id in query for card_id in expected) and 'unknown' not in query
+    assert index.query(selector) is query
+
+
+@pytest.mark.parametrize('selector', ["clan=moon", "tribe=pirate", "card_type=token", "clan<royal", "tribe>=machine",
+                                      "name=knight"])
+def test_invalid_selectors(index, selector):
+    with pytest.raises(ValueError):
+        index.query(selector)
+
+
+def test_combining_and_filtering(index):
+    units, cheap = index.query("card_type=unit"), index.query("base_cost<=2")
+    assert list(units & cheap) == ['knight']
+    assert list(units | cheap) == ['knight', 'robot', 'golem', 'bolt', 'shrine']
+    cards = [Card(CardDefinition(card_id, card_id, CARDS.get(card_id, {}))) for card_id in ('golem', 'bolt', 'other')]
+    assert [card.card_id for card in units.filter(cards)] == ['golem']
+
+
+def test_record_round_trip(index):
+    assert list(CardIndex(*index.record()).query("card_type=unit&base_cost<5")) == ['knight', 'robot']
+
+
+def test_queries_match_a_scan_of_the_pool(raw_db):
+    cards = {card_id: raw_db.cards[card_id] for card_id in raw_db.cards}
+    machina_units = [card_id for card_id, data in cards.items() if data['type'] == 'Follower'
+                     and ('Machina' in data['traits'] or 'All' in data['traits'])]
+    assert list(raw_db.query("card_type=unit&tribe=machine")) == machina_units
+    cheap_forest = [card_id for card_id, data in cards.items()
+                    if data['class'] == 'Forestcraft' and data['cost'] <= 2]
+    assert list(raw_db.query("clan=elf&base_cost<=2")) == cheap_forest
@@ -0,0 +1,120 @@
+import json
+import os
+import pickle
+import shutil
+
+import pytest
+
+from games.sv.utils.deck_builder import DECK_CACHE_FILE, DeckLoader
+from games.sv.utils.deck_codes import (
+    decode_deck_hash, deck_from_hash, deck_from_portal, encode_deck_hash, import_decks, read_deck_refs,
+)
+from launchers.batch_launcher import DECK_FOLDER
+
+CARD_IDS = ['100011010', '100011010', '101014020', '900041010', '0', str(64 ** 5 - 1)]
+
+
+def test_deck_hash_round_trip():
+    deck_hash = encode_deck_hash(4, CARD_IDS, deck_format=3)
+    assert deck_hash.startswith('3.4.')
+    assert decode_deck_hash(deck_hash) == (3, 4, CARD_IDS)
+    assert decode_deck_hash(f"  {deck_hash}\n") == (3, 4, CARD_IDS)
+    with pytest.raises(ValueError):
+        encode_deck_hash(1, [str(64 ** 5)])
+
+
+@pytest.mark.parametrize('deck_hash', ['', '1.2', 'a.2.00000', '1.2.0000', '1.2.0000*', '1.2.00000.'])
+def test_malformed_deck_hashes_are_rejected(deck_hash):
+    with pytest.raises(ValueError):
+        decode_deck_hash(deck_hash)
+
+
+def test_decks_from_hashes_and_portal_responses():
+    deck_hash = encode_deck_hash(1, CARD_IDS)
+    deck = deck_from_hash(deck_hash, name="Mine")
+    assert deck == {'deckName': "Mine", 'class': 'Forestcraft', 'cardIds': CARD_IDS, 'deckHash': deck_hash}
+    response = {'data': {'deck': {'clan': 1, 'deck_format': 1, 'cards': [{'card_id': int(c)} for c in CARD_IDS]}}}
+    assert deck_from_portal(response, name="Mine") == deck
+    with pytest.raises(ValueError):
+        deck_from_hash(encode_deck_hash(0, CARD_IDS))
+
+
+def test_import_decks(tmp_path):
+    refs = tmp_path / 'decks.txt'
+    good = encode_deck_hash(2, CARD_IDS)
+    refs.write_text(f"# imported decks\n{good}\tSword deck\n\nnot-a-hash\n", encoding='utf-8')
+    assert read_deck_refs(str(refs)) == [(good, "Sword deck"), ('not-a-hash', None)]
+
+    out = tmp_path / 'imported'
+    (imported, path, _), (skipped, no_path, reason) = import_decks([str(refs)], str(out), workers=2)
+    assert (imported, skipped, no_path) == (good, 'not-a-hash', None)
+    assert reason
+    with open(path, 'r', encoding='utf-8') as f:
+        assert json.load(f) == deck_from_hash(good, "Sword deck")
+
+
+@pytest.fixture
+def deck_folder(tmp_path):
+    folder = tmp_path / 'decks'
+    shutil.copytree(DECK_FOLDER, folder, ignore=shutil.ignore_patterns(DECK_CACHE_FILE, 'imported'))
+    return folder
+
+
+def count_reads(monkeypatch) -> list:
+    """Records the deck files DeckLoader reads from then on."""
+    reads = []
+    load_file = DeckLoader._load_file
+
+    def counting(self, task):
+        reads.append(task[0])
+        return load_file(self, task)
+    monkeypatch.setattr(DeckLoader, '_load_file', counting)
+    return reads
+
+
+def test_deck_cache(card_db, deck_folder, monkeypatch):
+    first = DeckLoader(str(deck_folder), card_db, workers=2).valid_decks
+    assert first
+    with open(deck_folder / DECK_CACHE_FILE, 'r', encoding='utf-8') as f:
+        json.load(f)
+
+    reads = count_reads(monkeypatch)
+    assert DeckLoader(str(deck_folder), card_db).valid_decks == first
+    assert reads == []
+
+    # A changed file is read again, and so is everything when the cache belongs to other cards.
+    name = sorted(first)[0]
+    deck = dict(first[name], deckName="Renamed")
+    (deck_folder / name).write_text(json.dumps(deck), encoding='utf-8')
+    assert DeckLoader(str(deck_folder), card_db).valid_decks[name]['deckName'] == "Renamed"
+    assert reads == [name]
+
+    cache = json.loads((deck_folder / DECK_CACHE_FILE).read_text(encoding='utf-8'))
+    cache['fingerprint'] = 'other cards'
+    (deck_folder / DECK_CACHE_FILE).write_text(json.dumps(cache), encoding='utf-8')
+    reads.clear()
+    DeckLoader(str(deck_folder), card_db)
+    assert len(reads) == len(os.listdir(deck_folder)) - 1
+
+
+class Planted:
+    def __reduce__(self):
+        return os.makedirs, (self.path,)
+
+
+@pytest.mark.parametrize('damage', ['pickle', 'truncated', 'entries'])
+def test_damaged_or_planted_caches_are_ignored(card_db, deck_folder, tmp_path, damage):
+    expected = DeckLoader(str(deck_folder), card_db).valid_decks
+    cache_path = deck_folder / DECK_CACHE_FILE
+    planted = Planted()
+    planted.path = str(tmp_path / 'planted')
+    if damage == 'pickle':
+        cache_path.write_bytes(pickle.dumps(planted))
+    elif damage == 'truncated':
+        cache_path.write_bytes(cache_path.read_bytes()[:-10])
+    else:
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+        cache['entries'] = {name: [1, 2, 3] for name in cache['entries']}
+        cache_path.write_text(json.dumps(cache), encoding='utf-8')
+    assert DeckLoader(str(deck_folder), card_db).valid_decks == expected
+    assert not os.path.exists(planted.path)
@@ -0,0 +1,111 @@
+import pytest
+
+from framework.core.card import Card
+from games.sv.modules import effects
+from games.sv.modules.effects import EffectLibrary, compile_card, compile_sentences, token_from_id
+
+
+@pytest.mark.parametrize('card_id, functions', [
+    ('SWD_006', {'on_fanfare'}),
+    ('SWD_010', {'on_fanfare'}),  # Keyword text before the timing is skipped.
+    ('SWD_012', {'on_spell'}),
+    ('NEU_011', {'on_last_words'}),
+    ('SHD_007', {'on_last_words'}),
+])
+def test_compile_card(card_db, card_id, functions):
+    assert set(compile_card(card_db.get_definition(card_id))) == functions
+
+
+@pytest.mark.parametrize('text', ['', 'Draw a card. Then dance.', 'Summon a 1/1 Knight and a Dragon.'])
+def test_text_that_is_not_understood_is_left_to_lua(text):
+    assert compile_sentences(text) is None
+
+
+@pytest.fixture
+def cleared_game(new_game):
+    """A started game with both boards emptied into the graveyards."""
+    engine, game_state = new_game(0)
+    for player in game_state.players:
+        for card in list(player.board.cards):
+            player.board.remove(card)
+            player.graveyard.add(card)
+    return engine, game_state
+
+
+def play(card_db, game_state, player, card_id: str) -> Card:
+    card = Card(card_db.get_definition(card_id))
+    player.board.add(card)
+    return card
+
+
+def test_summons_and_board_wide_damage(card_db, cleared_game):
+    _, game_state = cleared_game
+    me = game_state.active_player
+    opponent = game_state.get_opponent(me)
+
+    general = play(card_db, game_state, me, 'SWD_010')
+    compile_card(general.definition)['on_fanfare'](general, game_state)
+    guardian = me.board.cards[-1]
+    assert (guardian.card_id, guardian.atk, guardian.defense) == ('TOKEN:Shield Guardian:1/2', 1, 2)
+    assert guardian.definition is token_from_id(guardian.card_id)
+
+    poseidon = play(card_db, game_state, opponent, 'DRG_009')
+    compile_card(poseidon.definition)['on_fanfare'](poseidon, game_state)
+    assert [card.name for card in opponent.board.cards[1:]] == ["Poseidon's Guard"] * 2
+
+    abomination = play(card_db, game_state, me, 'RUN_014')
+    compile_card(abomination.definition)['on_fanfare'](abomination, game_state)
+    # Damage lands on every target before any is destroyed.
+    assert me.board.cards == [general, abomination] and general.defense == 2
+    assert opponent.board.cards == [poseidon] and poseidon.defense == 3
+    assert [card.name for card in opponent.graveyard.cards[-2:]] == ["Poseidon's Guard"] * 2
+
+
+def test_destroy_fires_last_words(card_db, cleared_game):
+    _, game_state = cleared_game
+    me = game_state.active_player
+    spirit = play(card_db, game_state, me, 'NEU_011')
+    effects.destroy(game_state, spirit)
+    assert spirit in me.graveyard.cards
+    assert [card.card_id for card in me.board.cards] == ['TOKEN:Steel Knight:2/2']
+    effects.destroy(game_state, spirit)  # Not on the board any more: nothing happens.
+    assert spirit in me.graveyard.cards and len(me.board.cards) == 1
+
+
+def test_limits(card_db, cleared_game):
+    _, game_state = cleared_game
+    me = game_state.active_player
+    for _ in range(effects.BOARD_LIMIT):
+        assert effects.summon_token(game_state, me, "Knight", 1, 1) is not None
+    assert effects.summon_token(game_state, me, "Knight", 1, 1) is None
+    assert len(me.board.cards) == effects.BOARD_LIMIT
+
+    effects.damage(game_state, [me], 5)
+    effects.heal(game_state, me, 2)
+    assert me.life == effects.MAX_LIFE - 3
+    effects.heal(game_state, me, 10)
+    assert me.life == effects.MAX_LIFE
+
+
+def test_effects_are_hashed_and_undone(card_db, cleared_game):
+    _, game_state = cleared_game
+    me = game_state.active_player
+    before, snapshot = game_state.zobrist_hash, game_state.snapshot()
+    knight = effects.summon_token(game_state, me, "Knight", 1, 1)
+    effects.buff(game_state, [knight], 2, 2)
+    effects.damage(game_state, [game_state.get_opponent(me)], 3)
+    assert (knight.atk, knight.defense) == (3, 3)
+    assert game_state.zobrist_hash != before
+    assert game_state.zobrist_hash == game_state.rehash()
+    game_state.restore(snapshot)
+    assert knight not in me.board.cards and game_state.zobrist_hash == before
+
+
+def test_registered_effects_take_precedence(card_db):
+    library = EffectLibrary()
+    definition = card_db.get_definition('NEU_003')
+    compiled = library.get(definition, 'on_fanfare')
+    assert compiled is not None and library.get(definition, 'on_last_words') is None
+    custom = lambda card, game_state: None
+    library.register('NEU_003', 'on_fanfare', custom)
+    assert library.get(definition, 'on_fanfare') is custom
@@ -0,0 +1,73 @@
+from typing import List
+
+import pytest
+
+from agents.base_agent import BaseAgent
+from agents.simple_ai_agent import SimpleAiAgent
+from framework.core.game_state import GameState
+from framework.simulation.action import Action
+from framework.simulation.evaluation import MatchupSprt, PairedStats, Sprt
+from launchers.batch_launcher import run_paired
+
+
+class PassiveAgent(BaseAgent):
+    """Ends every turn without doing anything."""
+    def choose_action(self, game_state: GameState, possible_actions: List[Action]) -> Action:
+        return next(action for action in possible_actions if action.action_type == "END_TURN")
+
+
+def paired_stats(pair_points: List[int]) -> PairedStats:
+    """PairedStats with one pair per entry; each entry is A's points in the pair (0-4)."""
+    stats = PairedStats()
+    for points in pair_points:
+        stats.record(min(points, 2), points - min(points, 2))
+    return stats
+
+
+def test_paired_stats():
+    stats = paired_stats([4, 2, 2, 3, 0])
+    assert stats.counts == [1, 0, 2, 1, 1]
+    assert (stats.pairs, stats.games) == (5, 10)
+    assert (stats.wins, stats.draws, stats.losses) == (5, 1, 4)
+    assert stats.score == pytest.approx(11 / 20)
+    low, high = stats.confidence_interval()
+    assert low < stats.score < high
+    assert PairedStats().score == 0.5
+
+
+def test_variance_ratio_rewards_pairing():
+    # Every pair split 1-1: single games vary as much as they can, pairs not at all.
+    assert paired_stats([2] * 40).variance_ratio == 0.0
+    # Pairs won or lost outright: pairing saves nothing.
+    assert paired_stats([4, 0] * 20).variance_ratio == pytest.approx(2.0)
+
+
+def test_sprt_decisions():
+    with pytest.raises(ValueError):
+        Sprt(0.5, 0.5)
+    test = Sprt(0.5, 0.6, min_pairs=16)
+    assert test.decision(paired_stats([4, 3] * 7)) is None # Too few pairs
+    assert test.decision(paired_stats([4, 3] * 20)) is True
+    assert test.decision(paired_stats([0, 1] * 20)) is False
+
+    matchup = MatchupSprt(0.1)
+    assert matchup.decision(paired_stats([4, 3] * 20)) == MatchupSprt.A_STRONGER
+    assert matchup.decision(paired_stats([0, 1] * 20)) == MatchupSprt.B_STRONGER
+    assert matchup.decision(paired_stats([2] * 200)) == MatchupSprt.NO_EDGE
+    assert matchup.decision(paired_stats([2, 3, 1, 2] * 4)) is None
+
+
+def test_a_mirror_match_is_always_even(deck_lists):
+    """With the same deck and agent on both sides, both games of a pair are the same game."""
+    stats, decision, seeds = run_paired('SV', deck_lists[0], deck_lists[0], 24, workers=1, seed=100)
+    assert stats.counts == [0, 0, 24, 0, 0]
+    assert decision is None
+    assert seeds == list(range(100, 124))
+
+
+def test_agents_can_be_compared(deck_lists):
+    stats, decision, seeds = run_paired('SV', deck_lists[0], deck_lists[0], 64, workers=1, seed=5,
+                                        sprt=MatchupSprt(0.1), agent_a=SimpleAiAgent, agent_b=PassiveAgent)
+    assert decision == MatchupSprt.A_STRONGER
+    assert stats.score > 0.9
+    assert seeds == list(range(5, 5 + stats.pairs))
@@ -0,0 +1,33 @@
+from framework.utils.events import EventSink, EventType, format_event
+from games.sv.database.db_loader import CardDatabase
+from launchers.batch_launcher import DB_PATH
+
+
+def test_event_sink():
+    events = EventSink()
+    assert not events
+    received = []
+    subscriber = lambda event_type, fields: received.append((event_type, fields))
+    events.subscribe(subscriber)
+    assert events
+    events.emit(EventType.PASS_TURN, player="A")
+    assert received == [(EventType.PASS_TURN, {'player': "A"})]
+    assert format_event(*received[0]) == "A passes the turn."
+    events.unsubscribe(subscriber)
+    assert not events
+
+
+def test_card_loading_is_an_event(capsys):
+    events = EventSink()
+    received = []
+    events.subscribe(lambda event_type, fields: received.append((event_type, fields)))
+    db = CardDatabase(DB_PATH, events=events)
+    assert received == [(EventType.CARDS_LOADED, {'count': len(db.cards)})]
+    CardDatabase(DB_PATH)
+    assert capsys.readouterr().out == ""
+
+
+def test_headless_games_print_nothing(new_simulator, capsys):
+    for seed in range(3):
+        new_simulator(seed).run(max_turns=50, log_level='none')
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,56 @@
+import json
+import os
+
+import pytest
+
+from framework.utils.files import iter_json_array, write_atomic
+from games.sv.database.importer import RAW_DATABASES
+
+DOCUMENTS = [
+    [],
+    [1, -2, 3.5, -4e-3, 12345678901234567890, True, False, None],
+    ["plain", "with ] and , and [", "escaped \" quote \\ and \n newline", "unicode é ☃ 𝄞", ""],
+    [{"id": 1, "nested": {"list": [1, [2, [3]]], "text": "} ]"}}, {}, [], [[]]],
+    [{"card_id": n, "name": f"Card {n}", "cost": n % 10, "tags": ["a"] * (n % 4)} for n in range(200)],
+]
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+@pytest.mark.parametrize('indent', [None, 2])
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 1 << 16])
+def test_iter_json_array_matches_json_load(tmp_path, document, indent, chunk_size):
+    path = tmp_path / 'array.json'
+    path.write_text(json.dumps(document, indent=indent, ensure_ascii=False), encoding='utf-8')
+    with open(path, 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+    assert list(iter_json_array(str(path), chunk_size=chunk_size)) == expected
+
+
+def test_iter_json_array_matches_json_load_on_a_class_database():
+    path = RAW_DATABASES[0]
+    with open(path, 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+    assert list(iter_json_array(path)) == expected
+
+    fields = ('card_id', 'card_name', 'no_such_field')
+    trimmed = [{key: card[key] for key in fields if key in card} for card in expected]
+    assert list(iter_json_array(path, fields, chunk_size=4096)) == trimmed
+
+
+@pytest.mark.parametrize('text', ['{"a": 1}', '[1, 2', '[1 2]', '[1,, 2]', ''])
+def test_iter_json_array_rejects_malformed_files(tmp_path, text):
+    path = tmp_path / 'bad.json'
+    path.write_text(text, encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(iter_json_array(str(path), chunk_size=2))
+
+
+def test_write_atomic(tmp_path):
+    path = tmp_path / 'cache'
+    assert write_atomic(str(path), b'first')
+    assert write_atomic(str(path), b'second')
+    assert path.read_bytes() == b'second'
+    assert os.listdir(tmp_path) == ['cache']
+
+    # A folder that cannot be written to is reported, not raised.
+    assert not write_atomic(str(tmp_path / 'missing' / 'cache'), b'data')
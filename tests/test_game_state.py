@@ -0,0 +1,107 @@
+from framework.core.game_state import GameState
+from framework.core.journal import Journal
+from framework.core.zobrist import ZobristKeys
+
+
+def state_signature(game_state: GameState, instance_ids: bool = True) -> tuple:
+    """
+    Everything restore() and undo() must bring back: turn, players,
+    resources, zone contents, card stats and the card index. Without
+    `instance_ids`, cards are told apart by card ID only, as tokens get a
+    new instance ID each time.
+    """
+    def card_key(card):
+        return card.instance_id if instance_ids else card.card_id
+
+    players = tuple(
+        (player.life, player.has_decked_out, player.resources.snapshot(),
+         tuple((zone.name, tuple((card_key(card), card.owner is player, card.snapshot()) for card in zone.cards))
+               for zone in player.zones.values()))
+        for player in game_state.players)
+    if not instance_ids:
+        return game_state.turn_number, game_state.active_player_index, players
+    index = tuple(sorted((instance_id, id(card), id(zone)) for instance_id, (card, zone, _) in game_state.card_index.items()))
+    return game_state.turn_number, game_state.active_player_index, players, index
+
+
+def test_restore_returns_to_the_snapshot(new_game, playout):
+    engine, game_state = new_game(3)
+    snapshots = []
+    for step, _ in enumerate(playout(engine, game_state, 3)):
+        if step % 7 == 0:
+            snapshots.append((game_state.snapshot(), state_signature(game_state), game_state.zobrist_hash))
+    assert len(snapshots) > 3
+    # Any snapshot can be restored, in any order, and more than once.
+    for snapshot, signature, zobrist_hash in snapshots[::-1] + snapshots:
+        game_state.restore(snapshot)
+        assert state_signature(game_state) == signature
+        assert game_state.zobrist_hash == zobrist_hash == game_state.rehash()
+
+
+def test_undo_restores_state_and_hash(new_game, playout):
+    for seed in range(4):
+        engine, game_state = new_game(seed)
+        journal = Journal()
+        for actions in playout(engine, game_state, seed):
+            before, hash_before = state_signature(game_state), game_state.zobrist_hash
+            assert hash_before == game_state.rehash()
+            for action in actions:
+                mark = journal.mark()
+                engine.apply_action(game_state, action, journal)
+                if action.action_type == "END_TURN":
+                    # The turn change and the next player's draw are journaled too.
+                    game_state.journal = journal
+                    game_state.end_turn()
+                    game_state.active_player.resources.start_turn()
+                    game_state.active_player.draw_card(game_state)
+                    game_state.journal = None
+                engine.undo(game_state, journal, mark)
+                assert state_signature(game_state) == before, action
+                assert game_state.zobrist_hash == hash_before, action
+
+
+def test_index_actions_match_actions(new_game, playout):
+    """Applying an action-space index changes the game exactly as applying its decoded Action."""
+    engine, game_state = new_game(7)
+    journal = Journal()
+    for _ in playout(engine, game_state, 7):
+        for index in engine.get_action_mask(game_state).nonzero()[0]:
+            rng_state = game_state.rng.getstate()
+            mark = journal.mark()
+            engine.apply_action_index(game_state, int(index), journal)
+            by_index = state_signature(game_state, instance_ids=False), game_state.zobrist_hash
+            engine.undo(game_state, journal, mark)
+            game_state.rng.setstate(rng_state)
+
+            engine.apply_action(game_state, engine.action_space.decode(game_state, int(index)), journal)
+            assert (state_signature(game_state, instance_ids=False), game_state.zobrist_hash) == by_index
+            engine.undo(game_state, journal, mark)
+            game_state.rng.setstate(rng_state)
+
+
+def test_winner_is_reported_on_every_check(new_game):
+    engine, game_state = new_game(1)
+    loser = game_state.players[1]
+    game_state.set_attr(loser, 'life', 0)
+    assert engine.check_win_condition(game_state) is game_state.players[0]
+    assert engine.check_win_condition(game_state) is game_state.players[0]
+
+
+def test_zobrist_keys_do_not_depend_on_use_order():
+    features = [('game', 'turn_number', turn) for turn in range(20)]
+    forward, backward = ZobristKeys(), ZobristKeys()
+    keys = [forward.key(feature) for feature in features]
+    assert [backward.key(feature) for feature in reversed(features)] == keys[::-1]
+
+    state = (2, 3, False, False, 0, 1, 4, 0)
+    assert forward.card_key((0, 'hand', 'SWD_001'), state) == backward.card_key((0, 'hand', 'SWD_001'), state)
+    assert forward.card_key((0, 'hand', 'SWD_001'), state) != forward.card_key((1, 'hand', 'SWD_001'), state)
+
+
+def test_card_keys_mix_the_whole_card_state():
+    """Copies of a card whose stats add up to the same totals must not collide."""
+    keys = ZobristKeys()
+    place = (0, 'field', 'SWD_001')
+    damaged = keys.card_key(place, (2, 1, False, False, 0, 1, 4, 0)) + keys.card_key(place, (2, 3, False, False, 0, 1, 4, 0))
+    even = 2 * keys.card_key(place, (2, 2, False, False, 0, 1, 4, 0))
+    assert damaged & ((1 << 64) - 1) != even & ((1 << 64) - 1)
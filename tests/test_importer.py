@@ -0,0 +1,63 @@
+import json
+
+from games.sv.database.db_loader import CardDatabase
+from games.sv.database.importer import TOKEN_CARD_SET, from_raw, import_pool, is_raw_database, pool_aliases
+
+
+def raw_card(card_id: int, base_card_id: int, card_set_id: int = 10001, **fields) -> dict:
+    entry = {
+        'card_id': card_id, 'card_name': f"Card {base_card_id}", 'clan': 2, 'char_type': 1,
+        'card_set_id': card_set_id, 'rarity': 1, 'cost': 2, 'atk': 2, 'life': 2, 'evo_atk': 4, 'evo_life': 4,
+        'tribe_name': '-', 'skill_disc': '', 'evo_skill_disc': '', 'base_card_id': base_card_id,
+        'skill': '', 'skill_condition': '', 'skill_target': '', 'skill_option': '', 'skill_preprocess': '',
+        'copyright': 'not imported',
+    }
+    entry.update(fields)
+    return entry
+
+
+def test_from_raw():
+    data = from_raw(raw_card(5, 5, card_set_id=TOKEN_CARD_SET, cost=-1, tribe_name='Mach./Nat.',
+                             skill_disc='Fanfare: Deal 1 damage.<br>[b]Ward[/b]', skill='damage'))
+    assert (data['class'], data['type'], data['rarity'], data['cost']) == ('Swordcraft', 'Follower', 'Token', 0)
+    assert data['traits'] == ['Machina', 'Natura']
+    assert data['effect_text'] == 'Fanfare: Deal 1 damage. Ward'
+    assert (data['skill'], data['skill_target']) == ('damage', 'none')
+    assert 'copyright' not in data
+
+
+def test_printings_are_folded_into_one_card(tmp_path):
+    path = tmp_path / 'sword.json'
+    path.write_text(json.dumps([
+        raw_card(100, 100), raw_card(200, 100, card_set_id=10002),
+        # A reprint seen before its base printing, which then takes its place.
+        raw_card(301, 300, card_set_id=10003), raw_card(300, 300),
+        # Same base card, different stats: a card of its own.
+        raw_card(401, 400, atk=3), raw_card(400, 400),
+    ]), encoding='utf-8')
+    assert is_raw_database(str(path))
+
+    cards = import_pool([str(path)])
+    assert list(cards) == ['100', '300', '401', '400']
+    assert cards['100']['alias_ids'] == ['200'] and cards['300']['alias_ids'] == ['301']
+    assert cards['300']['card_set_id'] == 10001
+    assert pool_aliases(cards) == {'200': '100', '301': '300'}
+
+    db = CardDatabase([str(path)], skill_cache=None)
+    assert db.get_definition('200') is db.get_definition('100')
+    assert db.get_card_data('301') is db.get_card_data('300')
+    assert db.get_definition('401').get_property('atk') == 3
+
+
+def test_the_pool_has_no_duplicate_printings(raw_db):
+    assert raw_db.aliases
+    for alias, card_id in raw_db.aliases.items():
+        assert alias not in raw_db.cards and card_id in raw_db.cards
+    seen = {}
+    for card_id in raw_db.cards:
+        data = dict(raw_db.cards[card_id])
+        data.pop('alias_ids', None)
+        data.pop('card_set_id')
+        key = json.dumps(data, sort_keys=True)
+        assert key not in seen, (card_id, seen.get(key))
+        seen[key] = card_id
@@ -0,0 +1,102 @@
+import logging
+import os
+
+from framework.scripting.lua_engine import LuaEngine
+from framework.utils.events import EventSink, EventType
+
+
+class RecordingApi:
+    """A stand-in for ScriptAPI that records what scripts call."""
+    def __init__(self):
+        self.calls = []
+
+    def record(self, value):
+        self.calls.append(value)
+
+
+def write_script(path, body: str, mtime_ns: int = None):
+    path.write_text(f"function on_fanfare(card, game_state)\n  {body}\nend\n", encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_scripts_are_compiled_once(tmp_path):
+    api = RecordingApi()
+    engine = LuaEngine(api)
+    script = tmp_path / 'CARD_001.lua'
+    write_script(script, 'api.record(card)', mtime_ns=10 ** 18)
+    for card in ('first', 'second'):
+        engine.run_script(str(script), 'on_fanfare', card, None)
+    assert api.calls == ['first', 'second']
+
+    # Without dev mode the compiled function is kept, even when the file changes or goes away.
+    write_script(script, 'api.record("edited")', mtime_ns=2 * 10 ** 18)
+    engine.run_script(str(script), 'on_fanfare', 'third', None)
+    os.remove(script)
+    engine.run_script(str(script), 'on_fanfare', 'fourth', None)
+    assert api.calls[2:] == ['third', 'fourth']
+    engine.invalidate(str(script))
+    engine.run_script(str(script), 'on_fanfare', 'fifth', None)
+    assert api.calls[4:] == []
+
+
+def test_missing_scripts_and_functions_are_cached_misses(tmp_path):
+    api = RecordingApi()
+    engine = LuaEngine(api)
+    script = tmp_path / 'CARD_002.lua'
+    engine.run_script(str(script), 'on_fanfare', 'card', None)
+    write_script(script, 'api.record(card)')
+    engine.run_script(str(script), 'on_fanfare', 'card', None)
+    assert api.calls == []
+    engine.invalidate()
+    engine.run_script(str(script), 'on_last_words', 'card', None)
+    engine.run_script(str(script), 'on_fanfare', 'card', None)
+    assert api.calls == ['card']
+
+
+def test_dev_mode_reloads_edited_scripts(tmp_path):
+    api = RecordingApi()
+    engine = LuaEngine(api, dev_mode=True)
+    script = tmp_path / 'CARD_003.lua'
+    engine.run_script(str(script), 'on_fanfare', 'card', None)
+    write_script(script, 'api.record("v1")', mtime_ns=10 ** 18)
+    engine.run_script(str(script), 'on_fanfare', 'card', None)
+    write_script(script, 'api.record("v2")', mtime_ns=2 * 10 ** 18)
+    engine.run_script(str(script), 'on_fanfare', 'card', None)
+    assert api.calls == ['v1', 'v2']
+
+
+def test_scripts_do_not_share_functions(tmp_path):
+    api = RecordingApi()
+    engine = LuaEngine(api)
+    for name in ('A', 'B'):
+        write_script(tmp_path / f'{name}.lua', f'api.record("{name}")')
+    (tmp_path / 'notes.txt').write_text('not a script', encoding='utf-8')
+    assert engine.warm_up(str(tmp_path)) == 2
+    for name in ('B', 'A'):
+        engine.run_script(str(tmp_path / f'{name}.lua'), 'on_fanfare', 'card', None)
+    assert api.calls == ['B', 'A']
+
+
+def test_errors_are_reported_with_or_without_subscribers(tmp_path, caplog):
+    broken = tmp_path / 'BROKEN.lua'
+    write_script(broken, 'error("boom")')
+    unparsable = tmp_path / 'SYNTAX.lua'
+    unparsable.write_text('function on_fanfare(', encoding='utf-8')
+
+    events = EventSink()
+    engine = LuaEngine(RecordingApi(), events)
+    with caplog.at_level(logging.WARNING, logger='framework.scripting.lua_engine'):
+        for _ in range(3):
+            engine.run_script(str(broken), 'on_fanfare', 'card', None)
+        engine.run_script(str(unparsable), 'on_fanfare', 'card', None)
+    # Nobody subscribed: each failing function is logged once, and every error counted.
+    assert engine.error_count == 4
+    assert len(caplog.records) == 2
+    assert 'boom' in caplog.records[0].getMessage()
+
+    reported = []
+    events.subscribe(lambda event_type, fields: reported.append((event_type, fields['function'])))
+    engine.run_script(str(broken), 'on_fanfare', 'card', None)
+    assert reported == [(EventType.SCRIPT_ERROR, 'on_fanfare')]
+    assert engine.error_count == 5
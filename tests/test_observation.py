@@ -0,0 +1,62 @@
+import numpy as np
+
+from games.sv.modules.action_space import HAND_SLOTS
+from games.sv.modules.observation import BOARD_FEATURES, HAND_FEATURES, SvObservationEncoder
+
+
+def test_features_agree_with_the_legal_actions(new_game, playout):
+    encoder = SvObservationEncoder()
+    playable = HAND_FEATURES.index("playable")
+    can_attack = [BOARD_FEATURES.index("can_attack_followers"), BOARD_FEATURES.index("can_attack_leader")]
+    for seed in range(3):
+        engine, game_state = new_game(seed)
+        for actions in playout(engine, game_state, seed):
+            player = game_state.active_player
+            observation = encoder.encode(game_state, player)
+
+            played = {a.details["card_instance_id"] for a in actions if a.action_type == "PLAY_CARD"}
+            hand = encoder.view(observation, "own_hand")
+            assert [bool(row[playable]) for row in hand[:HAND_SLOTS]] == \
+                   [slot < len(player.hand.cards) and player.hand.cards[slot].instance_id in played
+                    for slot in range(HAND_SLOTS)]
+
+            attackers = {a.details["attacker_id"] for a in actions if a.action_type == "ATTACK"}
+            board = encoder.view(observation, "own_board")
+            for slot, card in enumerate(player.board.cards):
+                if card.instance_id in attackers:
+                    assert board[slot, can_attack].any()
+
+
+def test_hidden_information_is_not_encoded(new_game, playout):
+    encoder = SvObservationEncoder({"SWD_001": 0, "NEU_003": 1})
+    engine, game_state = new_game(2)
+    for _ in playout(engine, game_state, 2):
+        observer = game_state.active_player
+        opponent = game_state.get_opponent(observer)
+        before = encoder.encode(game_state, observer)
+        # Reordering the opponent's hand and either deck changes nothing the observer can see.
+        hand, decks = list(opponent.hand.cards), [list(p.deck.cards) for p in game_state.players]
+        opponent.hand.cards.reverse()
+        for player in game_state.players:
+            player.deck.cards.reverse()
+        assert np.array_equal(encoder.encode(game_state, observer), before)
+        opponent.hand.cards[:] = hand
+        for player, deck in zip(game_state.players, decks):
+            player.deck.cards[:] = deck
+
+
+def test_batches_match_single_encodings(new_game, playout):
+    encoder = SvObservationEncoder()
+    states = []
+    for seed in range(4):
+        engine, game_state = new_game(seed)
+        for step, _ in enumerate(playout(engine, game_state, seed)):
+            if step == 40:
+                break
+        states.append(game_state)
+    players = [game_state.players[1] for game_state in states]
+    batch = encoder.allocate(len(states))
+    batch.fill(7.0)
+    encoder.encode_batch(states, players, out=batch)
+    for row, (game_state, player) in enumerate(zip(states, players)):
+        assert np.array_equal(batch[row], encoder.encode(game_state, player))
@@ -0,0 +1,61 @@
+import io
+from dataclasses import replace
+
+from games.sv.engine import SvEngine
+from games.sv.replay import ReplayRecorder, Replayer, read_replays, write_replay
+
+
+def position(game_state) -> tuple:
+    """A comparable summary of a game position, including the hash."""
+    return (game_state.turn_number, game_state.active_player_index, game_state.zobrist_hash,
+            [(player.life, player.resources.snapshot(),
+              [[(card.card_id, card.snapshot()) for card in zone.cards] for zone in player.zones.values()])
+             for player in game_state.players])
+
+
+def record_games(new_simulator, count: int):
+    """Plays `count` games and returns (replay file bytes, [(winner seat, final turn, final hash)])."""
+    recorder = ReplayRecorder(keyframe_interval=4)
+    stream = io.BytesIO()
+    results = []
+    for seed in range(count):
+        simulator = new_simulator(seed)
+        winner = simulator.run(max_turns=50, log_level='none', recorder=recorder)
+        game_state = simulator.game_state
+        results.append((game_state.players.index(winner) if winner else None,
+                        game_state.turn_number, game_state.zobrist_hash))
+        write_replay(stream, recorder.getvalue())
+    return stream.getvalue(), results
+
+
+def test_replay_round_trip(card_db, new_simulator):
+    data, results = record_games(new_simulator, 12)
+    replays = list(read_replays(io.BytesIO(data)))
+    assert len(replays) == len(results)
+
+    engine = SvEngine('SV', card_db=card_db)
+    for replay, (winner_seat, turn_number, zobrist_hash) in zip(replays, results):
+        assert replay.winner_seat == winner_seat
+        replayer = Replayer(replay, card_db, engine)
+        winner = replayer.run()
+        game_state = replayer.game_state
+        assert (game_state.players.index(winner) if winner else None) == winner_seat
+        assert game_state.turn_number == turn_number
+        assert game_state.zobrist_hash == zobrist_hash == game_state.rehash()
+
+
+def test_seek_matches_replaying_from_the_start(card_db, new_simulator):
+    data, _ = record_games(new_simulator, 6)
+    engine = SvEngine('SV', card_db=card_db)
+    for replay in read_replays(io.BytesIO(data)):
+        assert replay.keyframes
+        without_keyframes = replace(replay, keyframes=[])
+        seeking = Replayer(replay, card_db, engine)
+        # Forward, backward and repeated seeks, some past the end of the game.
+        for turn_number in (3, 9, 2, 14, 14, 1, 30, 6):
+            for seat in (0, 1):
+                expected = position(Replayer(without_keyframes, card_db, engine).seek(turn_number, seat))
+                game_state = seeking.seek(turn_number, seat)
+                assert position(game_state) == expected, (turn_number, seat)
+                assert game_state.zobrist_hash == game_state.rehash()
+
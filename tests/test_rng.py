@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+from framework.core.rng import GameRng
+
+
+def game_record(simulator) -> tuple:
+    """Who won, when, and every card's final place, by card ID."""
+    winner = simulator.run(max_turns=50, log_level='none')
+    game_state = simulator.game_state
+    return (winner.name if winner else None, game_state.turn_number,
+            [[(zone.name, [card.card_id for card in zone.cards]) for zone in player.zones.values()]
+             for player in game_state.players])
+
+
+def test_a_seed_replays_the_same_game(new_simulator):
+    records = [game_record(new_simulator(seed)) for seed in (11, 12, 11)]
+    assert records[0] == records[2]
+    assert records[0] != records[1]
+
+
+def test_streams_are_independent():
+    plain, busy = GameRng(5), GameRng(5)
+    busy.agent.random()
+    busy.effect.random()
+    assert [busy.shuffle.random() for _ in range(5)] == [plain.shuffle.random() for _ in range(5)]
+
+    state = plain.getstate()
+    drawn = [plain.effect.random() for _ in range(3)]
+    plain.setstate(state)
+    assert [plain.effect.random() for _ in range(3)] == drawn
+
+
+def test_streams_do_not_depend_on_the_process():
+    script = "from framework.core.rng import GameRng; r = GameRng('x'); print(r.shuffle.random(), r.agent.random())"
+    outputs = set()
+    for hash_seed in ('1', '2'):
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        outputs.add(subprocess.run([sys.executable, '-c', script], env=env, capture_output=True, text=True,
+                                   check=True).stdout)
+    rng = GameRng('x')
+    assert outputs == {f"{rng.shuffle.random()} {rng.agent.random()}\n"}
@@ -0,0 +1,29 @@
+import pytest
+
+from framework.utils.files import iter_json_array
+from games.sv.database.helper_script import skill_tokenizer
+from games.sv.database.importer import RAW_DATABASES
+from games.sv.database.skill_ast import SKILL_FIELDS, parse_skill
+
+
+def parse_or_error(parse, text):
+    try:
+        return parse(text)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize('path', RAW_DATABASES)
+def test_parse_skill_matches_the_original_parser(path):
+    """Every skill string of the class databases parses to the same tree, or fails in both parsers."""
+    texts = set()
+    for card in iter_json_array(path, SKILL_FIELDS):
+        texts.update(value for value in card.values() if isinstance(value, str))
+    assert texts
+    for text in texts:
+        assert parse_or_error(parse_skill, text) == parse_or_error(skill_tokenizer.parse_skill, text), text
+
+
+@pytest.mark.parametrize('text', ['', 'none', 'damage=2', 'a(b)&c|d', '{x,y}//z', '-(1+2)*3'])
+def test_parse_skill_matches_the_original_parser_on_small_inputs(text):
+    assert parse_or_error(parse_skill, text) == parse_or_error(skill_tokenizer.parse_skill, text)
@@ -0,0 +1,75 @@
+import pytest
+
+from framework.core.card import Card
+from games.sv.modules.effects import EffectLibrary, compile_card
+
+EVELISIA = '106021010'        # Fanfare: Deal 1 damage to the enemy leader.
+DROP_OF_KINDNESS = '900034050'  # Restore 3 defense to your leader.
+WISE_MERMAN = '104011030'     # Fanfare: Give +1/+0 to an allied Neutral follower.
+OATHLESS_KNIGHT = '100211020'  # Fanfare: Summon a Knight.
+FIGHTER = '100011020'         # A vanilla Neutral 2/2.
+KUNOICHI = '100211060'        # A Swordcraft 2/1.
+
+
+@pytest.mark.parametrize('card_id, functions', [
+    (EVELISIA, {'on_fanfare'}),
+    (DROP_OF_KINDNESS, {'on_spell'}),
+    (OATHLESS_KNIGHT, {'on_fanfare'}),
+    ('102021020', set()),  # At the start of your turn: no timing the engine runs.
+    ('103011040', set()),  # A condition counting cards by cost and clan.
+    ('103011060', set()),  # An option computed from the board.
+    (FIGHTER, set()),
+])
+def test_compiled_timings(raw_db, card_id, functions):
+    assert set(raw_db.skills.compile(raw_db.get_definition(card_id))) == functions
+
+
+def test_most_of_the_pool_compiles(raw_db):
+    assert raw_db.compile_skills() > 800
+
+
+def play(raw_db, player, card_id: str) -> Card:
+    card = Card(raw_db.get_definition(card_id))
+    player.board.add(card)
+    return card
+
+
+def run(raw_db, card: Card, function_name: str, game_state):
+    raw_db.skills.compile(card.definition)[function_name](card, game_state)
+
+
+def test_compiled_effects(raw_db, new_game):
+    _, game_state = new_game(0)
+    me = game_state.active_player
+    opponent = game_state.get_opponent(me)
+
+    evelisia = play(raw_db, me, EVELISIA)
+    run(raw_db, evelisia, 'on_fanfare', game_state)
+    assert opponent.life == 19
+
+    game_state.set_attr(me, 'life', 15)
+    drop = Card(raw_db.get_definition(DROP_OF_KINDNESS))
+    me.graveyard.add(drop)  # A played spell resolves from the graveyard.
+    run(raw_db, drop, 'on_spell', game_state)
+    assert me.life == 18
+
+    knight = play(raw_db, me, OATHLESS_KNIGHT)
+    run(raw_db, knight, 'on_fanfare', game_state)
+    assert me.board.cards[-1].name == "Knight"
+
+
+def test_skill_targets_are_filtered(raw_db, new_game):
+    _, game_state = new_game(0)
+    me = game_state.active_player
+    fighter, kunoichi = play(raw_db, me, FIGHTER), play(raw_db, me, KUNOICHI)
+    merman = play(raw_db, me, WISE_MERMAN)
+    run(raw_db, merman, 'on_fanfare', game_state)
+    # Only the other Neutral follower qualifies.
+    assert (fighter.atk, kunoichi.atk, merman.atk) == (3, 2, 1)
+
+
+def test_skills_take_precedence_over_text(raw_db):
+    knight = raw_db.get_definition(OATHLESS_KNIGHT)
+    assert compile_card(knight) == {}  # "Summon a Knight." names no stats.
+    library = EffectLibrary(raw_db.skills)
+    assert library.get(knight, 'on_fanfare') is raw_db.skills.compile(knight)['on_fanfare']
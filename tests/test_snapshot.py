@@ -0,0 +1,67 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from games.sv.database.db_loader import CardDatabase
+from games.sv.database.importer import DB_DIR
+from games.sv.database.snapshot import CardSnapshot
+from launchers.batch_launcher import DB_PATH
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Copies of an engine-format card file and two raw class databases, snapshotted in tmp_path."""
+    paths = []
+    for source in (DB_PATH, os.path.join(DB_DIR, 'sword.json'), os.path.join(DB_DIR, 'neutral.json')):
+        paths.append(str(tmp_path / os.path.basename(source)))
+        shutil.copyfile(source, paths[-1])
+    return paths
+
+
+def load(paths) -> CardDatabase:
+    return CardDatabase(paths, skill_cache=None)
+
+
+def test_snapshot_round_trip(sources):
+    built = load(sources)
+    assert not isinstance(built.cards, CardSnapshot) and os.path.exists(built.snapshot_path)
+    loaded = load(sources)
+    assert isinstance(loaded.cards, CardSnapshot)
+
+    fresh = CardDatabase(sources, skill_cache=None, snapshot=False)
+    assert list(loaded.cards) == list(fresh.cards)
+    assert {card_id: loaded.cards[card_id] for card_id in loaded.cards} == dict(fresh.cards)
+    assert loaded.aliases == fresh.aliases
+    assert loaded.index.record() == fresh.index.record()
+    # Skills compile the same from the stored trees as from the text.
+    assert loaded.compile_skills() == fresh.compile_skills() > 0
+    assert loaded.fingerprint() == fresh.fingerprint()
+
+
+def test_snapshot_is_rebuilt_when_a_source_changes(sources):
+    load(sources)
+    # Touching a file without changing it keeps the snapshot.
+    os.utime(sources[0], ns=(10 ** 18, 10 ** 18))
+    assert isinstance(load(sources).cards, CardSnapshot)
+
+    with open(sources[0], 'r', encoding='utf-8') as f:
+        cards = json.load(f)
+    cards['NEU_001']['name'] = "Renamed"
+    with open(sources[0], 'w', encoding='utf-8') as f:
+        json.dump(cards, f)
+    rebuilt = load(sources)
+    assert not isinstance(rebuilt.cards, CardSnapshot)
+    assert load(sources).get_card_data('NEU_001')['name'] == "Renamed"
+
+
+def test_damaged_snapshots_are_rebuilt(sources):
+    path = load(sources).snapshot_path
+    with open(path, 'r+b') as f:
+        f.truncate(100)
+    assert not isinstance(load(sources).cards, CardSnapshot)
+    with open(path, 'wb') as f:
+        f.write(b'not a snapshot')
+    assert load(sources).get_card_data('NEU_001')
+    assert isinstance(load(sources).cards, CardSnapshot)
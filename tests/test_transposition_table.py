@@ -0,0 +1,61 @@
+import pytest
+
+from framework.simulation.transposition_table import TranspositionTable
+
+
+def test_lru_evicts_the_least_recently_used_entry():
+    table = TranspositionTable(capacity=3, policy='lru')
+    for key in (1, 2, 3):
+        table.store(key, float(key))
+    table.lookup(1)
+    table.store(4, 4.0)
+    assert 2 not in table
+    assert [key in table for key in (1, 3, 4)] == [True, True, True]
+    assert len(table) == 3
+
+
+def test_fifo_evicts_the_oldest_entry():
+    table = TranspositionTable(capacity=3, policy='fifo')
+    for key in (1, 2, 3):
+        table.store(key, float(key))
+    table.lookup(1)
+    table.store(2, 20.0, best_action='attack', depth=2) # Updating keeps its place.
+    table.store(4, 4.0)
+    assert 1 not in table
+    entry = table.lookup(2)
+    assert (entry.value, entry.best_action, entry.depth) == (20.0, 'attack', 2)
+
+
+def test_depth_keeps_the_deeper_result():
+    table = TranspositionTable(capacity=8, policy='depth')
+    assert table.store(3, 1.0, depth=4)
+    assert not table.store(3 + 8, 2.0, depth=2) # Same slot, shallower search.
+    assert table.lookup(3).value == 1.0 and table.lookup(3 + 8) is None
+    assert table.store(3 + 8, 3.0, depth=4)
+    assert table.lookup(3 + 8).value == 3.0 and 3 not in table
+    assert table.store(3 + 8, 0.5, depth=1) # The same position is always updated.
+    assert len(table) == 1
+
+
+def test_always_replaces():
+    table = TranspositionTable(capacity=8, policy='always')
+    table.store(5, 1.0, depth=9)
+    assert table.store(5 + 8, 2.0, depth=0)
+    assert 5 not in table and table.lookup(5 + 8).value == 2.0
+
+
+@pytest.mark.parametrize('policy', ['lru', 'fifo', 'depth', 'always'])
+def test_counters_and_clear(policy):
+    table = TranspositionTable(capacity=4, policy=policy)
+    table.store(1, 1.0)
+    assert table.lookup(1) is not None and table.lookup(2) is None
+    assert (table.hits, table.misses) == (1, 1)
+    table.clear()
+    assert len(table) == 0 and (table.hits, table.misses) == (0, 0) and 1 not in table
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        TranspositionTable(capacity=0)
+    with pytest.raises(ValueError):
+        TranspositionTable(policy='random')
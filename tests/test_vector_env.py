@@ -0,0 +1,103 @@
+import random
+
+import numpy as np
+import pytest
+
+from agents.simple_ai_agent import SimpleAiAgent
+from framework.core.card import Card
+from framework.simulation.simulator import GameSimulator
+from games.sv.engine import SvEngine
+from games.sv.modules.action_space import END_TURN_INDEX
+from games.sv.vector_env import B_ATK, B_CODE, B_DEF, SvVectorEnv
+
+MAX_TURNS = 20
+
+
+@pytest.fixture(scope='module')
+def vanilla_decks(card_db):
+    """Two random decks of the database's cards that have no effects."""
+    card_ids = sorted(card_db.cards)
+    vanilla = sorted(set(card_ids) - set(SvVectorEnv(card_db, card_ids, card_ids, 1, ignore_effects=True).ignored_effects))
+    rng = random.Random(1)
+    return [rng.choice(vanilla) for _ in range(40)], [rng.choice(vanilla) for _ in range(30)]
+
+
+def test_decks_with_effects_are_rejected(card_db, vanilla_decks):
+    deck = vanilla_decks[0][:39] + ['NEU_003'] # Fanfare: Draw a card.
+    with pytest.raises(ValueError, match='NEU_003'):
+        SvVectorEnv(card_db, deck, vanilla_decks[1], 2)
+    assert SvVectorEnv(card_db, deck, vanilla_decks[1], 2, ignore_effects=True).ignored_effects == ['NEU_003']
+    assert SvVectorEnv(card_db, *vanilla_decks, 2).ignored_effects == []
+    with pytest.raises(ValueError, match='NO_SUCH_CARD'):
+        SvVectorEnv(card_db, vanilla_decks[0] + ['NO_SUCH_CARD'], vanilla_decks[1], 2)
+
+
+def engine_twin(card_db, env: SvVectorEnv, index: int):
+    """An SvEngine game dealt from the same shuffled decks as environment `index`."""
+    engine = SvEngine(env.game_mode, card_db=card_db)
+    game_state = GameSimulator(engine, [SimpleAiAgent("A"), SimpleAiAgent("B")], seed=index).game_state
+    for seat, player in enumerate(game_state.players):
+        player.deck.cards = []
+        for code in env.deck[index, seat, :env.deck_len[seat]]:
+            player.deck.add(Card(card_db.get_definition(env.card_ids[code])))
+    engine.setup_game(game_state)
+    game_state.start_game()
+    game_state.active_player.resources.start_turn()
+    game_state.active_player.draw_card(game_state)
+    return engine, game_state
+
+
+@pytest.mark.parametrize('game_mode', ['SV', 'SVWB'])
+def test_lockstep_games_match_the_engine(card_db, vanilla_decks, game_mode):
+    for seed in range(3):
+        env = SvVectorEnv(card_db, *vanilla_decks, 8, game_mode=game_mode, max_turns=MAX_TURNS, seed=seed,
+                          auto_reset=False)
+        env.reset()
+        twins = [engine_twin(card_db, env, index) for index in range(env.num_envs)]
+        finished = [False] * env.num_envs
+        winners = [None] * env.num_envs
+        while not env.done.all():
+            actions = env.sample_actions()
+            for index, (engine, game_state) in enumerate(twins):
+                if finished[index]:
+                    continue
+                assert np.array_equal(engine.get_action_mask(game_state), env.masks[index])
+                engine.apply_action_index(game_state, int(actions[index]))
+                winner = engine.check_win_condition(game_state)
+                if winner:
+                    winners[index], finished[index] = game_state.players.index(winner), True
+                elif actions[index] == END_TURN_INDEX:
+                    game_state.end_turn()
+                    if game_state.turn_number > MAX_TURNS:
+                        finished[index] = True
+                    else:
+                        game_state.active_player.resources.start_turn()
+                        game_state.active_player.draw_card(game_state)
+            env.step(actions)
+
+            for index, (engine, game_state) in enumerate(twins):
+                assert env.done[index] == finished[index]
+                for seat, player in enumerate(game_state.players):
+                    resources = player.resources
+                    assert (env.life[index, seat], env.pp[index, seat], env.ep[index, seat]) == \
+                           (player.life, resources.pp, resources.ep)
+                    hand = env.hand[index, seat, :env.hand_count[index, seat]]
+                    assert [env.card_ids[code] for code in hand] == [card.card_id for card in player.hand.cards]
+                    board = env.board[index, seat, :env.board_count[index, seat]]
+                    assert [(env.card_ids[row[B_CODE]], row[B_ATK], row[B_DEF]) for row in board] == \
+                           [(card.card_id, card.atk, card.defense) for card in player.board.cards]
+                    assert env.graveyard_count[index, seat] == len(player.graveyard.cards)
+                if finished[index]:
+                    assert env.winner[index] == (-1 if winners[index] is None else winners[index])
+
+
+def test_auto_reset_keeps_playing(card_db, vanilla_decks):
+    env = SvVectorEnv(card_db, *vanilla_decks, 8, seed=3)
+    masks = env.reset()
+    while env.games_played < 40:
+        masks, rewards, dones = env.step(env.sample_actions(masks))
+        assert (rewards[~dones] == 0).all()
+        assert not env.done.any()
+    assert env.wins.sum() + env.draws == env.games_played
+    with pytest.raises(ValueError):
+        env.step(np.full(env.num_envs, -1))